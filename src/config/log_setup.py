@@ -0,0 +1,109 @@
+"""
+Logging Setup Module
+
+This module installs the single loguru configuration shared by the GUI, the
+scraper and the command line tools. setup_logging is idempotent: whoever calls it
+first configures the sinks and later calls do nothing, so repeated scrapes no
+longer stack duplicate file sinks.
+
+Sinks are asynchronous (enqueue=True): a log call only formats the record and puts
+it on a queue, the writing happens on loguru's writer thread. The file sink writes
+one JSON object per record (LOG_JSON), and every record carries the id of the
+current scrape run and its stage. Debug lines are sampled per call site. A
+spawned child process (the scraper run by the GUI) writes its own file instead
+of rotating the GUI's.
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+from contextvars import ContextVar
+from typing import Dict, Tuple
+
+from loguru import logger
+
+from src.config.settings import (
+    PROJECT_ROOT, LOG_LEVEL, LOG_FILE_LEVEL, LOG_JSON, LOG_DEBUG_SAMPLE_RATE, LOG_ROTATION, LOG_RETENTION,
+)
+
+LOGS_DIR = os.path.join(PROJECT_ROOT, "logs")
+LOG_FILE = os.path.join(LOGS_DIR, "vbscraper.log")
+# One file per spawned child (the scraper process), sharing the retention count
+CHILD_LOG_FILE = os.path.join(LOGS_DIR, "vbscraper-child.{time:YYYY-MM-DD_HH-mm-ss_SSSSSS}.log")
+
+CONSOLE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {extra[run_id]} {extra[stage]: <8} | {message}"
+
+_run_id: ContextVar[str] = ContextVar("run_id", default="-")
+_stage: ContextVar[str] = ContextVar("stage", default="-")
+
+_configured = False
+_lock = threading.Lock()
+
+# Debug lines seen per call site (module, line)
+_debug_counts: Dict[Tuple[str, int], int] = {}
+_debug_lock = threading.Lock()
+
+
+def set_run(run_id: str) -> None:
+    """Tag the records of the current thread (or task) with a scrape run id."""
+    _run_id.set(run_id)
+
+
+def set_stage(stage: str) -> None:
+    """Tag the records of the current thread (or task) with a pipeline stage."""
+    _stage.set(stage)
+
+
+def _keep_debug(record: dict) -> bool:
+    """Keep the first debug line of each call site, then one in LOG_DEBUG_SAMPLE_RATE."""
+    if record["level"].no > 10 or LOG_DEBUG_SAMPLE_RATE <= 1:
+        return True
+    site = (record["name"], record["line"])
+    with _debug_lock:
+        count = _debug_counts.get(site, 0)
+        _debug_counts[site] = count + 1
+    return count % LOG_DEBUG_SAMPLE_RATE == 0
+
+
+def _add_context(record: dict) -> None:
+    """Patcher adding the run id, stage and sampling decision to every record.
+
+    Sampling is decided here, once per record, so every sink keeps the same lines.
+    """
+    record["extra"].setdefault("run_id", _run_id.get())
+    record["extra"].setdefault("stage", _stage.get())
+    record["extra"]["sampled"] = _keep_debug(record)
+
+
+def _sample_debug(record: dict) -> bool:
+    """Sink filter keeping the records selected by the patcher."""
+    return record["extra"].get("sampled", True)
+
+
+def setup_logging(console: bool = True) -> None:
+    """Install the logging sinks once per process; later calls do nothing."""
+    global _configured
+    with _lock:
+        if _configured:
+            return
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        logger.remove()
+        logger.configure(patcher=_add_context)
+        if console and sys.stderr is not None:
+            logger.add(sys.stderr, level=LOG_LEVEL, format=CONSOLE_FORMAT, filter=_sample_debug, enqueue=True)
+        # Two processes rotating the same file would rename it under each other
+        child = multiprocessing.parent_process() is not None
+        logger.add(
+            CHILD_LOG_FILE if child else LOG_FILE,
+            level=LOG_FILE_LEVEL,
+            filter=_sample_debug,
+            serialize=LOG_JSON,
+            rotation=LOG_ROTATION,
+            retention=LOG_RETENTION,
+            enqueue=True,
+            backtrace=True,
+            # Variable values in tracebacks are slow to render and may leak credentials
+            diagnose=False,
+        )
+        _configured = True
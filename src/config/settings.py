@@ -6,6 +6,8 @@ It provides centralized access to application settings such as authentication cr
 request timeouts, and other configurable parameters.
 """
 
+import os
+
 # Authentication settings
 AUTH_CREDENTIALS = {
     "username": "",  # Fill in your oddportal username
@@ -20,7 +22,87 @@ RETRY_DELAY = 5  # seconds
 # Scraping settings
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 BASE_URL = "https://oddportal.com"  # Replace with actual URL if different
+SCRAPER_IN_PROCESS = True  # Run the GUI scraper in a child process (cancellable) instead of a thread
+AUTO_REFRESH_INTERVAL_MINUTES = 10  # Interval of the GUI auto-refresh mode
 
 # Output settings
 DATA_DIRECTORY = "data"
-LOG_LEVEL = "INFO"
\ No newline at end of file
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_PATH = os.path.join(PROJECT_ROOT, DATA_DIRECTORY)
+ROLLUPS_FILE = "rollups.csv"  # Per-run aggregates used by the history dashboard
+MANIFEST_FILE = "manifest.json"  # Generation, row count and checksum of the last exports
+GENERATIONS_DIRECTORY = "generations"  # Immutable copy of the last exports, under DATA_DIRECTORY
+EXPORT_GENERATIONS = 5  # Number of exports kept in GENERATIONS_DIRECTORY
+LOG_LEVEL = "INFO"  # Level of the console log
+LOG_FILE_LEVEL = "DEBUG"  # Level of logs/vbscraper.log
+LOG_JSON = True  # Write the log file as one JSON object per line (run id and stage included)
+LOG_DEBUG_SAMPLE_RATE = 10  # Keep one debug line in this many per call site (1 = keep all)
+LOG_ROTATION = "5 MB"  # Size at which the log file is rotated
+LOG_RETENTION = 10  # Number of rotated log files kept
+TIMEZONE = None  # IANA timezone of the times shown by the site, e.g. "Europe/Paris" (None = system timezone)
+
+# Staking settings
+BANKROLL = 1000.0  # Bankroll the stakes are computed for
+KELLY_FRACTION = 0.25  # Fraction of the full Kelly stake (0.25 = quarter Kelly)
+MAX_STAKE_FRACTION = 0.05  # Cap of a single stake, as a fraction of the bankroll
+FLAT_STAKE = 10.0  # Stake of the flat strategy
+PROPORTIONAL_STAKE_FACTOR = 0.1  # Proportional strategy: stake = bankroll * factor * edge
+MAX_EVENT_EXPOSURE = 0.10  # Maximum total stake on one event, as a fraction of the bankroll
+MAX_BOOKMAKER_EXPOSURE = 0.30  # Maximum total stake at one bookmaker, as a fraction of the bankroll
+
+# Name normalization settings
+ALIASES_FILE = "aliases.json"  # Persistent table of team and league name variants
+NAME_MATCH_CUTOFF = 0.88  # Minimum difflib similarity to treat a new name as a variant of a known one
+
+# Pricing settings
+VALUE_TOLERANCE = 0.05  # Maximum relative gap between the scraped value and probability x odds
+PROBABILITY_MODEL = ""  # Own probability model as "package.module:function" (empty = scraped probabilities)
+
+# Arbitrage settings
+ARBITRAGE_FILE = "arbitrage.csv"  # Surebets of the last scrape
+ARBITRAGE_TOTAL_STAKE = 100.0  # Total stake split across the legs of a surebet
+ARBITRAGE_MIN_PROFIT = 0.0  # Minimum guaranteed return of a reported surebet (0.01 = 1%)
+
+# Alert settings
+ALERTS_FILE = "alerts.json"  # Bets already alerted and last message of each rule
+ALERT_RULES = [  # Keys: name, min_value, min_probability, min_odds, max_odds, min_edge, min_odds_movement,
+    # sports, countries, leagues, bookmakers (lists), kickoff_within_hours, cooldown_minutes
+    {"name": "High probability", "min_probability": 50},
+]
+ALERT_COOLDOWN_MINUTES = 30  # Minimum time between two messages of the same rule
+ALERT_QUIET_HOURS = None  # Local (start_hour, end_hour) without alerts, e.g. (23, 7); None = always alert
+ALERT_MEMORY_HOURS = 48  # How long a bet without a known kickoff stays marked as alerted
+ALERT_MAX_LISTED_BETS = 5  # Bets listed in a message, the others are only counted
+
+# Notification settings
+NOTIFICATION_SINKS = ["desktop"]  # Any of "desktop", "webhook" and "file"
+NOTIFICATION_WEBHOOK_URL = ""  # Endpoint receiving a JSON POST per batch (webhook sink)
+NOTIFICATION_FILE = "notifications.jsonl"  # One JSON line per notification (file sink), under DATA_DIRECTORY
+NOTIFICATION_QUEUE_SIZE = 100  # Pending notifications kept, newer ones are dropped when full
+NOTIFICATION_BATCH_SECONDS = 2.0  # Notifications within this delay of each other are sent as one digest
+NOTIFICATION_TIMEOUT = 5  # Webhook timeout, and half the time a scrape waits for pending deliveries (seconds)
+
+# API settings
+API_ENABLED = False  # Serve the displayed snapshot over a local read-only HTTP API from the GUI
+API_HOST = "127.0.0.1"  # Interface the API listens on
+API_PORT = 8765  # Port of the API
+API_RELOAD_SECONDS = 5  # How often the standalone API checks the CSV for a new export
+
+# Page archive settings
+ARCHIVE_PAGES = True  # Keep every fetched page, to debug the parser and re-extract the history
+PAGES_DIRECTORY = "pages"  # Compressed page archive, under DATA_DIRECTORY
+ARCHIVE_DICTIONARY_PAGES = 500  # Pages compressed with one dictionary before a new one is built
+ARCHIVE_COMPRESSION_LEVEL = 9  # zlib level of the archived pages (1-9)
+
+# Backtesting settings
+HISTORY_DIRECTORY = "history"  # Snapshot of every stored scrape, under DATA_DIRECTORY
+MOVEMENTS_DIRECTORY = "movements"  # Odds time series and closing-line values, under DATA_DIRECTORY
+BACKTEST_FILE = "backtest.csv"  # Results of the last parameter sweep
+BACKTEST_SEED = 42  # Seed of the simulated outcomes of bets without a known result
+BACKTEST_WORKERS = None  # Worker processes of a parameter sweep (None = CPU count)
+BACKTEST_MIN_VALUES = [1.0, 1.05, 1.1, 1.2, 1.3]  # Swept value thresholds
+BACKTEST_MIN_PROBABILITIES = [0, 20, 30, 40, 50]  # Swept probability thresholds (%)
+BACKTEST_KELLY_FRACTIONS = [0.1, 0.25, 0.5, 1.0]  # Swept Kelly fractions
+
+# Startup settings
+STARTUP_IMPORT_BUDGET_MS = 500  # Maximum import time of the GUI module, checked by src/test/startup_time.py
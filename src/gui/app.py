@@ -1,45 +1,32 @@
 import customtkinter as ctk
-import pandas as pd
 import threading
 import time
 import os
 import sys
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-import numpy as np
 from loguru import logger
 
 # Add project path to import the scraper
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+# Only lightweight modules are imported here. pandas, NumPy, matplotlib and the
+# scraper (Playwright, BeautifulSoup, plyer) are imported by the views and actions
+# that need them, so the first frame doesn't wait for them (see src/test/startup_time.py).
+from src.gui import events
+from src.gui.events import UIEventQueue
+from src.gui.loader import DataLoader
+from src.gui.images import LogoImageCache
+from src.config.settings import SCRAPER_IN_PROCESS, AUTO_REFRESH_INTERVAL_MINUTES, API_ENABLED
+from src.config.log_setup import setup_logging
+
 # Define paths
 ASSETS_DIR = os.path.join(Path(__file__).parent.parent.parent, "assets")
 ICON_PATH = os.path.join(ASSETS_DIR, "vbicon.ico")
-LOGS_DIR = os.path.join(Path(__file__).parent.parent.parent, "logs")
-os.makedirs(LOGS_DIR, exist_ok=True)
-
-# Configuration de loguru au lieu de logging
-log_file = os.path.join(LOGS_DIR, f"vbscraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-
-# Supprimer les handlers par défaut de loguru
-logger.remove()
 
-# Ajouter des handlers personnalisés pour le fichier et la console
-logger.add(
-    log_file,
-    rotation="1 MB", 
-    level="INFO",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}", 
-    backtrace=True, 
-    diagnose=True
-)
-logger.add(
-    sys.stderr, 
-    level="INFO", 
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
-)
+# Shared logging configuration, installed once per process
+setup_logging()
 
 # Ajouter cette fonction pour simplifier les chemins dans les logs
 def format_path(path):
@@ -84,17 +71,29 @@ FONTS = {
     "small": ("Inter", 10),
 }
 
-# Import the scraper module
-try:
-    # Assurez-vous que le répertoire racine du projet est dans sys.path
-    project_root = Path(__file__).parent.parent.parent
-    sys.path.append(str(project_root))
-    
-    # Importation directe depuis le module src.scraper
-    from src.scraper.scraper import main as run_scraper
-    
-    # Vérifiez que l'importation a bien fonctionné
-    logger.info(f"Scraper module successfully imported from {format_path(str(project_root))}")
+# Cadence at which worker events are applied to the UI
+UI_EVENT_INTERVAL_MS = 50
+
+# Delay before filter inputs are applied, so typing doesn't rebuild the list on every key
+FILTER_DEBOUNCE_MS = 300
+
+# Kickoff window choices of the filter bar (label -> hours ahead)
+KICKOFF_WINDOWS = {
+    "Any time": None,
+    "Next 3h": 3,
+    "Next 12h": 12,
+    "Next 24h": 24,
+    "Next 48h": 48,
+}
+
+# Check that the scraper dependencies are installed without importing them
+SCRAPER_DEPENDENCIES = ["playwright", "bs4", "plyer"]
+
+project_root = Path(__file__).parent.parent.parent
+missing_dependencies = [name for name in SCRAPER_DEPENDENCIES if importlib.util.find_spec(name) is None]
+
+if not missing_dependencies:
+    logger.info(f"Scraper module available in {format_path(str(project_root))}")
     
     # Vérifiez aussi que le répertoire data existe
     data_dir = os.path.join(project_root, "data")
@@ -105,11 +104,10 @@ try:
         logger.info(f"Data directory found at {format_path(data_dir)}")
         
     SCRAPER_AVAILABLE = True
-except ImportError as e:
+else:
     SCRAPER_AVAILABLE = False
-    logger.error(f"Failed to import scraper module: {str(e)}")
+    logger.error(f"Scraper dependencies not installed: {', '.join(missing_dependencies)}")
     logger.warning("Scraping module not available. Running in simulation mode.")
-    logger.critical(f"Uncaught exception in main thread: {str(e)}", exc_info=True)
 
 
 class ValueBetScraperApp(ctk.CTk):
@@ -164,20 +162,56 @@ class ValueBetScraperApp(ctk.CTk):
         self.data = None
         self.filtered_data = None
         self.scraping_thread = None
+        self.scraper_process = None
+        self.chart_manager = None
+        self.logo_cache = LogoImageCache()
+        self.history_charts = None
         self.current_page = 1
         self.items_per_page = 5
         self.pagination_controls = None
         self.filter_controls = {}
+        self.filter_state = {}
+        self.filtered_positions = None
+        self.matching_positions = None
+        self.formatted_matches = []
+        self.cards_scroll_frame = None
+        self.count_label = None
+        self._filter_job = None
+
+        # Indexes derived from self.data, rebuilt only when data_version changes
+        self.data_version = 0
+        self._derived_cache = {}
 
         # Loading animation frames
         self.loading_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         self.current_frame = 0
         self.animation_running = False
         
+        # Events posted by the scraping worker, applied on the Tk thread
+        self.ui_events = UIEventQueue()
+        
+        # Background CSV loading, the view waiting for the data is shown once loaded
+        self.data_loader = DataLoader(self.ui_events)
+        self._pending_view = None
+        
+        # Auto-refresh: background scrapes merged into the displayed list
+        self._auto_refresh_job = None
+        self._background_refresh = False
+        # Start of the last scrape, to tell its exported surebets from older ones
+        self._scrape_started_at = None
+        
+        # Backtest parameter sweep, run off the Tk thread
+        self.backtest_running = False
+        
+        # Optional local API serving the displayed snapshot to other tools
+        self.api_server = self._start_api_server() if API_ENABLED else None
+        
         # Set up UI components
         self._setup_sidebar()
         self._setup_main_area()
         
+        self.after(UI_EVENT_INTERVAL_MS, self._process_ui_events)
+        
     def _setup_sidebar(self):
         """Set up the sidebar with navigation buttons"""
         mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
@@ -230,6 +264,17 @@ class ValueBetScraperApp(ctk.CTk):
         )
         self.stats_button.grid(row=4, column=0, padx=20, pady=10, sticky="ew")
         
+        # History button
+        self.history_button = ctk.CTkButton(
+            self.sidebar_frame, 
+            text="History",
+            command=self.show_history,
+            font=FONTS["button"],
+            height=45,
+            corner_radius=8,
+        )
+        self.history_button.grid(row=5, column=0, padx=20, pady=10, sticky="ew")
+        
         # Settings section title
         self.settings_title = ctk.CTkLabel(
             self.sidebar_frame,
@@ -237,11 +282,11 @@ class ValueBetScraperApp(ctk.CTk):
             font=ctk.CTkFont(family="Inter", size=12),
             text_color=COLORS["text_secondary"][mode_index],
         )
-        self.settings_title.grid(row=5, column=0, padx=25, pady=(20, 10), sticky="w")
+        self.settings_title.grid(row=6, column=0, padx=25, pady=(20, 10), sticky="w")
         
         # Theme selector
         theme_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
-        theme_frame.grid(row=6, column=0, padx=20, pady=(5, 10), sticky="ew")
+        theme_frame.grid(row=7, column=0, padx=20, pady=(5, 10), sticky="ew")
         
         self.theme_option = ctk.CTkOptionMenu(
             theme_frame,
@@ -253,6 +298,15 @@ class ValueBetScraperApp(ctk.CTk):
         self.theme_option.pack(side="right")
         self.theme_option.set(ctk.get_appearance_mode().capitalize())
         
+        # Auto-refresh toggle
+        self.auto_refresh_switch = ctk.CTkSwitch(
+            self.sidebar_frame,
+            text=f"Auto-refresh ({AUTO_REFRESH_INTERVAL_MINUTES} min)",
+            command=self.toggle_auto_refresh,
+            font=ctk.CTkFont(family="Inter", size=12),
+        )
+        self.auto_refresh_switch.grid(row=8, column=0, padx=25, pady=(5, 10), sticky="nw")
+        
         # Version info
         version_label = ctk.CTkLabel(
             self.sidebar_frame,
@@ -345,6 +399,15 @@ class ValueBetScraperApp(ctk.CTk):
             text="",
             font=ctk.CTkFont(family="Inter", size=14)
         )
+        self.cancel_button = ctk.CTkButton(
+            self.progress_frame,
+            text="Cancel",
+            command=self.cancel_scraping,
+            font=FONTS["button"],
+            height=36,
+            width=140,
+            fg_color=COLORS["error_text"][mode_index],
+        )
         
         # Notification area
         self.notification_frame = ctk.CTkFrame(
@@ -360,6 +423,42 @@ class ValueBetScraperApp(ctk.CTk):
         )
         self.notification_label.pack(pady=10)
 
+    def _set_data(self, df):
+        """Replace the current dataset and invalidate everything derived from it"""
+        # Data scraped before the pricing module (or simulated) gets the edge columns here
+        if "model_value" not in df.columns:
+            from src.scraper.pricing import add_pricing_columns
+            df = add_pricing_columns(df)
+        # Kickoffs read back from the CSV are text, and older files only have date and time
+        from src.scraper.kickoff import ensure_kickoff
+        df = ensure_kickoff(df)
+        
+        self.data = df
+        self.filtered_data = df
+        self.filtered_positions = None
+        if self.api_server is not None:
+            self.api_server.publish(df)
+        self.matching_positions = None
+        self.data_version += 1
+
+    def _start_api_server(self):
+        """Start the local snapshot API, or return None if it can't listen"""
+        from src.scraper.api import SnapshotServer
+        
+        try:
+            return SnapshotServer().start()
+        except OSError as e:
+            logger.error(f"Failed to start the API: {e}")
+            return None
+
+    def _derived(self, name, build):
+        """Return a structure derived from self.data, rebuilt only when data_version changes"""
+        version, value = self._derived_cache.get(name, (None, None))
+        if version != self.data_version:
+            value = build()
+            self._derived_cache[name] = (self.data_version, value)
+        return value
+
     def change_appearance_mode(self, new_appearance_mode):
         """Change the app's appearance mode"""
         ctk.set_appearance_mode(new_appearance_mode.lower())
@@ -385,6 +484,10 @@ class ValueBetScraperApp(ctk.CTk):
         logger.info("Starting scraping process")
         mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
         
+        if self._background_refresh:
+            self.show_notification("A background refresh is running, please wait.", "warning")
+            return
+        
         # Set up UI for scraping
         for widget in self.content_frame.winfo_children():
             widget.destroy()
@@ -400,18 +503,60 @@ class ValueBetScraperApp(ctk.CTk):
         self.animate_spinner()
         
         self.progress_status.configure(text="Initializing scraper...")
-        self.progress_status.pack(pady=(0, 100))
+        self.progress_status.pack(pady=(0, 20))
         
         # Disable buttons during scraping
         self.scrape_button.configure(state="disabled")
         self.display_cards_button.configure(state="disabled")
         self.stats_button.configure(state="disabled")
+        self.history_button.configure(state="disabled")
+        
+        if SCRAPER_AVAILABLE and SCRAPER_IN_PROCESS:
+            self.cancel_button.pack(pady=(0, 100))
+        self._launch_scraper()
+    
+    def _launch_scraper(self):
+        """Start the scraper in a child process or a thread, depending on the settings"""
+        self._scrape_started_at = time.time()
+        if SCRAPER_AVAILABLE and SCRAPER_IN_PROCESS:
+            from src.scraper.worker import ScraperProcess
+            
+            # Start scraping in a child process, its messages are pumped by _process_ui_events
+            self.scraper_process = ScraperProcess()
+            self.scraper_process.start()
+            return
         
         # Start scraping in a separate thread
         self.scraping_thread = threading.Thread(target=self._scraping_task)
         self.scraping_thread.daemon = True
         self.scraping_thread.start()
     
+    def toggle_auto_refresh(self):
+        """Start or stop the periodic background refresh"""
+        if self._auto_refresh_job is not None:
+            self.after_cancel(self._auto_refresh_job)
+            self._auto_refresh_job = None
+        
+        if self.auto_refresh_switch.get():
+            logger.info(f"Auto-refresh enabled every {AUTO_REFRESH_INTERVAL_MINUTES} minutes")
+            self._auto_refresh_job = self.after(AUTO_REFRESH_INTERVAL_MINUTES * 60 * 1000, self._auto_refresh_tick)
+        else:
+            logger.info("Auto-refresh disabled")
+    
+    def _auto_refresh_tick(self):
+        """Scrape in the background unless a scrape is already running, then reschedule"""
+        self._auto_refresh_job = None
+        if not self.auto_refresh_switch.get():
+            return
+        
+        if self.scraper_process is None and not self.animation_running and not self._background_refresh:
+            logger.info("Starting background refresh")
+            self._background_refresh = True
+            self.show_notification("Refreshing value bets in the background...", "info")
+            self._launch_scraper()
+        
+        self._auto_refresh_job = self.after(AUTO_REFRESH_INTERVAL_MINUTES * 60 * 1000, self._auto_refresh_tick)
+    
     def animate_spinner(self):
         """Animate the loading spinner"""
         if not self.animation_running:
@@ -422,32 +567,37 @@ class ValueBetScraperApp(ctk.CTk):
         self.after(100, self.animate_spinner)
     
     def _scraping_task(self):
-        """Execute the scraping process"""
+        """Execute the scraping process (runs in the worker thread)"""
         logger.info(f"Executing scraping task, SCRAPER_AVAILABLE={SCRAPER_AVAILABLE}")
         
         # Vérification des chemins importants
         logger.info(f"Data path: {format_path(self.data_path)}")
         logger.info(f"Current working directory: {os.getcwd()}")
         
-        if SCRAPER_AVAILABLE:
-            logger.info("Using real scraper")
-            self._real_scraping()
-        else:
-            logger.warning("Scraper not available, running simulation")
-            self.simulate_scraping()
+        try:
+            if SCRAPER_AVAILABLE:
+                logger.info("Using real scraper")
+                self._real_scraping()
+            else:
+                logger.warning("Scraper not available, running simulation")
+                self.simulate_scraping()
+        finally:
+            self.ui_events.post(events.FINISHED)
     
     def simulate_scraping(self):
         """Simulate the scraping process for testing UI"""
+        import pandas as pd
+        
         logger.info("Running scraping simulation")
         steps = 10
         for i in range(steps + 1):
             progress = i / steps
             message = f"Simulation step {i}/{steps}"
-            self.update_progress(progress, message)
+            self.ui_events.post_progress(progress, message)
             time.sleep(0.5)
         
         # Create sample data
-        self.data = pd.DataFrame({
+        data = pd.DataFrame({
             "sports": ["Football"] * 10,
             "countries": ["France", "England", "Spain", "Italy", "Germany", "France", "England", "Spain", "Italy", "Germany"],
             "leagues": ["Ligue 1", "Premier League", "La Liga", "Serie A", "Bundesliga", "Ligue 2", "Championship", "Segunda", "Serie B", "2. Bundesliga"],
@@ -463,46 +613,180 @@ class ValueBetScraperApp(ctk.CTk):
             "probability": [52.3, 31.2, 38.7, 56.2, 61.8, 68.5, 49.2, 43.5, 54.3, 35.8]
         })
         
-        self.filtered_data = self.data.copy()
-        self.show_notification("Simulation completed. Data generated.", "success")
-        
-        # Re-enable buttons and clean up
-        self.after(1000, lambda: self.scrape_button.configure(state="normal"))
-        self.after(1000, lambda: self.display_cards_button.configure(state="normal"))
-        self.after(1000, lambda: self.stats_button.configure(state="normal"))
-        self.animation_running = False
-        self.after(1000, self._cleanup_after_scraping)
-        self.after(1500, self.display_data_cards)
+        self.ui_events.post(events.RESULT, data, "Simulation completed. Data generated.")
     
     def _real_scraping(self):
         """Execute actual scraping with the main function from scraper"""
         try:
+            from src.scraper.scraper import main as run_scraper
+            
             def progress_callback(step, total_steps, message):
                 progress = step / total_steps if total_steps > 0 else 0
-                self.update_progress(progress, message)
+                self.ui_events.post_progress(progress, message)
             
             df = run_scraper(callback=progress_callback)
             
             if df is not None and not df.empty:
-                self.data = df
-                self.filtered_data = df.copy()
                 bet_count = len(df)
-                self.show_notification(f"Scraping completed successfully! {bet_count} value bets found.", "success")
-                self.after(1500, self.display_data_cards)
+                self.ui_events.post(events.RESULT, df, f"Scraping completed successfully! {bet_count} value bets found.")
             else:
-                self.show_notification("Scraping completed but no data was retrieved.", "warning")
+                self.ui_events.post_notification("Scraping completed but no data was retrieved.", "warning")
             
         except Exception as e:
-            self.show_notification(f"Error during execution: {str(e)}", "error")
+            self.ui_events.post(events.ERROR, f"Error during execution: {str(e)}")
             logger.exception(f"Error during scraping: {str(e)}")  # logger.exception au lieu de logger.error avec exc_info
+    
+    def _pump_scraper_process(self):
+        """Forward the messages of the scraper child process to the UI event queue"""
+        if self.scraper_process is None:
+            return
+        
+        from src.scraper import worker
+        
+        # Checked before reading so the last messages of an exiting child are not lost
+        alive = self.scraper_process.is_alive()
+        
+        for message in self.scraper_process.poll():
+            kind = message[0]
+            if kind == worker.PROGRESS:
+                self.ui_events.post_progress(message[1], message[2])
+            elif kind == worker.RESULT:
+                df = message[1]
+                if df is not None and not df.empty:
+                    self.ui_events.post(events.RESULT, df, f"Scraping completed successfully! {len(df)} value bets found.")
+                else:
+                    self.ui_events.post_notification("Scraping completed but no data was retrieved.", "warning")
+            elif kind == worker.ERROR:
+                self.ui_events.post(events.ERROR, f"Error during execution: {message[1]}")
+        
+        if not alive:
+            self.scraper_process = None
+            self.ui_events.post(events.FINISHED)
+    
+    def cancel_scraping(self):
+        """Stop the scraper child process"""
+        if self.scraper_process is None:
+            return
+        
+        logger.info("Scraping cancelled by user")
+        self.scraper_process.cancel(timeout=2.0)
+        self.scraper_process = None
+        self.show_notification("Scraping cancelled.", "warning")
+        self._on_scraping_finished()
+    
+    def _process_ui_events(self):
+        """Apply the events posted by workers, one coalesced redraw per tick"""
+        try:
+            self._pump_scraper_process()
+            for kind, payload in self.ui_events.drain():
+                if kind == events.PROGRESS:
+                    self.update_progress(*payload)
+                elif kind == events.NOTIFICATION:
+                    self.show_notification(*payload)
+                elif kind == events.ERROR:
+                    self.show_notification(payload[0], "error")
+                elif kind == events.RESULT:
+                    self._on_scraping_result(*payload)
+                elif kind == events.FINISHED:
+                    self._on_scraping_finished()
+                elif kind == events.DATA_LOADED:
+                    self._on_data_loaded(*payload)
+                elif kind == events.BACKTEST_DONE:
+                    self._on_backtest_done(*payload)
+        except Exception as e:
+            logger.exception(f"Error while processing UI events: {str(e)}")
         finally:
-            self.after(1000, lambda: self.scrape_button.configure(state="normal"))
-            self.after(1000, lambda: self.display_cards_button.configure(state="normal"))
-            self.after(1000, lambda: self.stats_button.configure(state="normal"))
-            self.animation_running = False
-            self.after(1000, self._cleanup_after_scraping)
+            self.after(UI_EVENT_INTERVAL_MS, self._process_ui_events)
     
-    def create_match_card(self, parent, league, prono, date, time, teams, outcome, bookmaker, odds, value, prob):
+    def _on_scraping_result(self, df, message):
+        """Install freshly scraped data and show it once the progress view is gone"""
+        # Surebets are reported once the scrape summary has been read
+        self.after(3000, self._report_arbitrages)
+        
+        if self._background_refresh:
+            self._merge_refreshed_data(df)
+            return
+        
+        self._set_data(df)
+        self.show_notification(message, "success")
+        self.after(1500, self.display_data_cards)
+    
+    def _report_arbitrages(self):
+        """Notify the surebets exported by the scrape that just finished"""
+        from src.scraper.arbitrage import load_arbitrages
+        
+        # The scraper already found them; a file older than the scrape is from a previous run
+        legs = load_arbitrages(since=self._scrape_started_at)
+        if legs is not None and not legs.empty:
+            count = legs["arbitrage_id"].nunique()
+            self.show_notification(f"{count} surebets found (best +{legs['profit'].max():.1%}).", "success")
+    
+    def _on_scraping_finished(self):
+        """Stop the spinner and restore the UI after the worker ended"""
+        if self._background_refresh:
+            # No progress view was shown for a background refresh
+            self._background_refresh = False
+            return
+        
+        self.animation_running = False
+        self.after(1000, self._cleanup_after_scraping)
+    
+    def _merge_refreshed_data(self, df):
+        """Merge a background scrape into the current data, redrawing only what changed"""
+        import numpy as np
+        from src.scraper.delta import merge_snapshot
+        from src.scraper.grouping import bet_groups
+        from src.scraper.kickoff import ensure_kickoff
+        
+        if self.data is None:
+            self._set_data(df)
+            self.show_notification(f"Auto-refresh: {len(df)} value bets loaded.", "success")
+            return
+        
+        merged, info = merge_snapshot(self.data, ensure_kickoff(df))
+        delta = info["delta"]
+        added, removed, changed = len(delta["added"]), len(delta["removed"]), len(delta["changed"])
+        if added == removed == changed == 0:
+            self.show_notification("Auto-refresh: no changes.", "info")
+            return
+        
+        # Reuse the card of every untouched bet, only changed and new bets are formatted
+        old_rows = self._get_card_rows()
+        groups = bet_groups(merged)
+        merged_rows = self._card_frame(merged, groups)
+        # A bet whose group changed (bookmaker count, spread, best price) shows stale figures
+        old_groups = self._get_bet_groups().iloc[np.maximum(info["old_positions"], 0)].set_axis(groups.index)
+        group_changed = ~(old_groups.eq(groups) | (old_groups.isna() & groups.isna())).all(axis=1).to_numpy()
+        card_rows = []
+        for position, (old_position, is_changed, odds_change) in enumerate(
+            zip(info["old_positions"], info["changed"], info["odds_change"])
+        ):
+            if old_position < 0 or is_changed or group_changed[position]:
+                row = self._format_card_row(merged_rows.iloc[position])
+                row["odds_change"] = odds_change if is_changed else None
+            else:
+                row = old_rows[old_position]
+                if row.get("odds_change") is not None:
+                    # Highlights only last until the next refresh
+                    row = dict(row, odds_change=None)
+            card_rows.append(row)
+        
+        self._set_data(merged)
+        self._derived_cache["card_rows"] = (self.data_version, card_rows)
+        self._derived_cache["bet_groups"] = (self.data_version, groups)
+        
+        # Keep the page, filters and scroll position of the cards view
+        if self.cards_scroll_frame is not None and self.cards_scroll_frame.winfo_exists():
+            self._update_filtered_positions()
+            self._refresh_card_list(keep_page=True)
+        
+        logger.info(f"Auto-refresh merged: {added} added, {removed} removed, {changed} changed")
+        self.show_notification(f"Auto-refresh: {added} new, {changed} changed, {removed} removed bets.", "success")
+    
+    def create_match_card(self, parent, league, prono, date, time, teams, outcome, bookmaker, odds, value, prob,
+                          odds_change=None, bookmaker_logo=None, stake=None, opening_odds=None,
+                          odds_movement=None, bookmaker_count=None, odds_spread=None, edge=None,
+                          value_mismatch=False):
         """Create an improved match card with better styling"""
         mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
         
@@ -563,6 +847,15 @@ class ValueBetScraperApp(ctk.CTk):
             text_color=COLORS["text_secondary"][mode_index]
         ).pack(side="left")
         
+        # Same bet offered by other bookmakers
+        if bookmaker_count is not None and bookmaker_count > 1:
+            ctk.CTkLabel(
+                prono_frame, 
+                text=f"{bookmaker_count} bookmakers • spread {odds_spread:.2f}", 
+                font=FONTS["small"], 
+                text_color=COLORS["text_secondary"][mode_index]
+            ).pack(side="right")
+        
         # Bet details in a horizontal layout
         bet_info = ctk.CTkFrame(card, fg_color="transparent")
         bet_info.pack(fill="x", padx=12, pady=(6, 10))
@@ -583,9 +876,12 @@ class ValueBetScraperApp(ctk.CTk):
         )
         outcome_label.pack(side="left", pady=2)
         
+        # Bookmaker logo (shared image object) alone, or its name when there is no logo
+        logo = self.logo_cache.get(bookmaker_logo)
         ctk.CTkLabel(
             left_info, 
-            text=bookmaker, 
+            text=bookmaker if logo is None else "", 
+            image=logo,
             width=100, 
             font=FONTS["bookmaker"],
             text_color=COLORS["text_primary"][mode_index]
@@ -595,12 +891,33 @@ class ValueBetScraperApp(ctk.CTk):
         center_info = ctk.CTkFrame(bet_info, fg_color="transparent")
         center_info.pack(side="left", padx=15)
         
-        ctk.CTkLabel(
-            center_info, 
-            text=f"@{odds}", 
-            font=FONTS["odds"],
-            text_color=COLORS["text_primary"][mode_index]
-        ).pack(side="left")
+        # Odds changed by the last auto-refresh are highlighted with their direction
+        if odds_change is not None and odds_change == odds_change and odds_change != 0:
+            arrow = "▲" if odds_change > 0 else "▼"
+            ctk.CTkLabel(
+                center_info, 
+                text=f"@{odds} {arrow}", 
+                font=FONTS["odds"],
+                fg_color=COLORS["warning_bg"][mode_index],
+                text_color=COLORS["warning_text"][mode_index],
+                corner_radius=6
+            ).pack(side="left")
+        else:
+            ctk.CTkLabel(
+                center_info, 
+                text=f"@{odds}", 
+                font=FONTS["odds"],
+                text_color=COLORS["text_primary"][mode_index]
+            ).pack(side="left")
+        
+        # Movement since the bet was first seen (odds movement tracker)
+        if opening_odds is not None and odds_movement:
+            ctk.CTkLabel(
+                center_info, 
+                text=f"from {opening_odds:.2f} ({odds_movement:+.1%})", 
+                font=FONTS["small"],
+                text_color=COLORS["success_text" if odds_movement > 0 else "error_text"][mode_index]
+            ).pack(side="left", padx=(6, 0))
         
         # Handle value display
         try:
@@ -616,13 +933,31 @@ class ValueBetScraperApp(ctk.CTk):
             value_color = COLORS["text_secondary"][mode_index]
             value_display = str(value) if value is not None else "0"
         
+        # The scraped value is flagged when it disagrees with probability x odds
         ctk.CTkLabel(
             center_info, 
-            text=f"Value: {value_display}", 
+            text=f"Value: {value_display}" + (" ⚠" if value_mismatch else ""), 
             font=FONTS["value"],
             text_color=value_color
         ).pack(side="left", padx=(15, 0))
         
+        if edge is not None:
+            ctk.CTkLabel(
+                center_info, 
+                text=f"Edge: {edge:.2f}", 
+                font=FONTS["value"],
+                text_color=COLORS["text_secondary"][mode_index]
+            ).pack(side="left", padx=(15, 0))
+        
+        # Recommended stake (capped fractional Kelly), when computed by the scraper
+        if stake is not None:
+            ctk.CTkLabel(
+                center_info, 
+                text=f"Stake: {stake:.2f}", 
+                font=FONTS["value"],
+                text_color=COLORS["text_secondary"][mode_index]
+            ).pack(side="left", padx=(15, 0))
+        
         # Right - Probability
         ctk.CTkLabel(
             bet_info, 
@@ -723,6 +1058,7 @@ class ValueBetScraperApp(ctk.CTk):
             "prev_btn": prev_btn,
             "next_btn": next_btn,
             "page_label": page_label,
+            "items_info": items_info,
             "total_pages": total_pages,
             "per_page_selector": per_page_selector
         }
@@ -769,82 +1105,396 @@ class ValueBetScraperApp(ctk.CTk):
         for i in range(start_idx, end_idx):
             self.create_match_card(scroll_frame, **matches[i])
 
-    def format_date_for_display(self, date_str):
-        """Convert date to user-friendly format"""
-        try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            today = datetime.now().date()
-            match_date = date_obj.date()
-            
-            delta = (match_date - today).days
-            
-            if delta == 0:
-                return "Today"
-            elif delta == 1:
-                return "Tomorrow"
-            else:
-                return date_obj.strftime('%d/%m')
-        
-        except Exception:
-            return date_str
+    def format_date_for_display(self, kickoff):
+        """Convert a local kickoff timestamp to a user-friendly day"""
+        delta = (kickoff.date() - datetime.now(kickoff.tzinfo).date()).days
+        
+        if delta == 0:
+            return "Today"
+        elif delta == 1:
+            return "Tomorrow"
+        else:
+            return kickoff.strftime('%d/%m')
 
     def prepare_data_for_cards(self):
         """Prepare data for card display"""
-        if self.filtered_data is None or self.filtered_data.empty:
+        if self.data is None or self.data.empty or self.filtered_positions is None:
             return []
         
-        formatted_data = []
-        for _, row in self.filtered_data.iterrows():
-            # Format date
-            display_date = self.format_date_for_display(str(row["date"]))
-            
-            # Format data for display
-            teams = f"{row['team_1']} - {row['team_2']}"
-            league = f"{row['sports']} / {row['countries']} / {row['leagues']}"
-            prob = f"{float(row['probability']):.1f}%"
-            
-            # Format value correctly
-            if isinstance(row['value'], str) and '%' in row['value']:
-                value = row['value']
-            else:
-                try:
-                    value = float(row['value'])
-                except (ValueError, TypeError):
-                    value = 0.0
-            
-            # Create dictionary for card creation
-            match_data = {
-                "league": league,
-                "prono": row["pronos"],
-                "date": display_date,
-                "time": row["time"],
-                "teams": teams,
-                "outcome": row["outcome"],
-                "bookmaker": row["bookmaker"],
-                "odds": row["odds"],
-                "value": value,
-                "prob": prob
-            }
-            
-            formatted_data.append(match_data)
+        card_rows = self._get_card_rows()
+        return [card_rows[i] for i in self.filtered_positions]
+
+    def _get_card_rows(self):
+        """Return the card dictionaries of every row, built once per data version"""
+        return self._derived("card_rows", self._build_card_rows)
+
+    def _build_card_rows(self):
+        """Build the card dictionary of every row of the current data"""
+        rows = self._card_frame(self.data, self._get_bet_groups())
+        return [self._format_card_row(row) for _, row in rows.iterrows()]
+
+    def _card_frame(self, df, groups):
+        """Return the rows to format as cards: data, bookmaker groups and local kickoffs"""
+        from src.scraper.grouping import GROUP_COLUMNS
+        from src.scraper.kickoff import ensure_kickoff, local_timezone
+        
+        rows = ensure_kickoff(df.drop(columns=GROUP_COLUMNS, errors="ignore")).join(groups)
+        # Kickoffs are stored in UTC and shown in local time
+        rows["kickoff"] = rows["kickoff"].dt.tz_convert(local_timezone())
+        return rows
+
+    def _format_card_row(self, row):
+        """Build the card dictionary of one data row"""
+        import pandas as pd
+        
+        # Format date
+        kickoff = row["kickoff"]
+        if pd.notna(kickoff):
+            display_date = self.format_date_for_display(kickoff)
+            display_time = kickoff.strftime("%H:%M")
+        else:
+            display_date, display_time = str(row["date"]), str(row["time"])
+        
+        # Format data for display
+        teams = f"{row['team_1']} - {row['team_2']}"
+        league = f"{row['sports']} / {row['countries']} / {row['leagues']}"
+        prob = f"{float(row['probability']):.1f}%"
+        
+        # Format value correctly
+        if isinstance(row['value'], str) and '%' in row['value']:
+            value = row['value']
+        else:
+            try:
+                value = float(row['value'])
+            except (ValueError, TypeError):
+                value = 0.0
+        
+        # Create dictionary for card creation
+        match_data = {
+            "league": league,
+            "prono": row["pronos"],
+            "date": display_date,
+            "time": display_time,
+            "teams": teams,
+            "outcome": row["outcome"],
+            "bookmaker": row["bookmaker"],
+            "odds": row["odds"],
+            "value": value,
+            "prob": prob,
+            "bookmaker_logo": row.get("bookmaker_logo") if isinstance(row.get("bookmaker_logo"), str) else None,
+            "stake": float(row["stake_kelly"]) if pd.notna(row.get("stake_kelly")) else None,
+            "opening_odds": float(row["opening_odds"]) if pd.notna(row.get("opening_odds")) else None,
+            "odds_movement": float(row["odds_movement"]) if pd.notna(row.get("odds_movement")) else None,
+            "edge": float(row["model_value"]) if pd.notna(row.get("model_value")) else None,
+            "value_mismatch": bool(row.get("value_mismatch", False)),
+            "bookmaker_count": int(row["bookmaker_count"]),
+            "odds_spread": float(row["odds_spread"]) if pd.notna(row["odds_spread"]) else 0.0
+        }
         
-        return formatted_data
+        return match_data
+
+    def _get_filter_index(self):
+        """Return the filter index of the current data, built once per data version"""
+        from src.scraper.filters import FilterIndex
+        
+        return self._derived("filter_index", lambda: FilterIndex(self.data))
+
+    def _get_bet_groups(self):
+        """Return the bookmaker grouping of the current data, computed once per data version"""
+        from src.scraper.grouping import bet_groups
+        
+        return self._derived("bet_groups", lambda: bet_groups(self.data))
+
+    def _get_search_index(self):
+        """Return the text search index of the current data, built once per data version"""
+        from src.gui.search import SearchIndex
+        
+        return self._derived("search_index", lambda: SearchIndex(self.data))
         
     def create_filter_controls(self, parent):
-        """Create filter controls (simplified)"""
-        return {}
+        """Create the filter bar (category selectors, numeric thresholds, kickoff window)"""
+        from src.scraper.filters import CATEGORY_COLUMNS, ALL_OPTION
+        from src.gui.sorting import SORT_KEYS
+        
+        mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
+        index = self._get_filter_index()
+        controls = {}
+        
+        filter_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        filter_frame.pack(fill="x", padx=15, pady=(15, 0))
+        
+        # Search box over teams, leagues and countries, followed by the sort order
+        search_row = ctk.CTkFrame(filter_frame, fg_color="transparent")
+        search_row.pack(fill="x", pady=(0, 8))
+        
+        search_entry = ctk.CTkEntry(
+            search_row,
+            placeholder_text="Search teams, leagues or countries...",
+            height=34,
+            font=ctk.CTkFont(family="Inter", size=13),
+        )
+        search_entry.pack(side="left", fill="x", expand=True)
+        if self.filter_state.get("search"):
+            search_entry.insert(0, self.filter_state["search"])
+        search_entry.bind("<KeyRelease>", lambda _event: self._schedule_filter_update())
+        controls["search"] = search_entry
+        
+        sort_direction = ctk.CTkSegmentedButton(
+            search_row,
+            values=["Desc", "Asc"],
+            command=lambda _value: self._apply_sort(),
+            font=ctk.CTkFont(family="Inter", size=12),
+        )
+        sort_direction.pack(side="right", padx=(8, 0))
+        sort_direction.set(self.filter_state.get("sort_direction", "Desc"))
+        controls["sort_direction"] = sort_direction
+        
+        sort_selector = ctk.CTkOptionMenu(
+            search_row,
+            values=list(SORT_KEYS.keys()),
+            command=lambda _value: self._apply_sort(),
+            width=130,
+            font=ctk.CTkFont(family="Inter", size=12),
+        )
+        sort_selector.pack(side="right", padx=(8, 0))
+        sort_selector.set(self.filter_state.get("sort_by", "Default"))
+        controls["sort_by"] = sort_selector
+        
+        # Condensed view: the best price of each bet instead of one card per bookmaker
+        one_per_event = ctk.CTkSwitch(
+            search_row,
+            text="One card per event",
+            command=self._schedule_filter_update,
+            font=FONTS["small"],
+            onvalue=1,
+            offvalue=0,
+        )
+        one_per_event.pack(side="right", padx=(15, 0))
+        if self.filter_state.get("one_per_event"):
+            one_per_event.select()
+        controls["one_per_event"] = one_per_event
+        
+        ctk.CTkLabel(
+            search_row,
+            text="Sort by",
+            font=FONTS["small"],
+            text_color=COLORS["text_secondary"][mode_index]
+        ).pack(side="right", padx=(15, 0))
+        
+        def add_field(row, label):
+            field = ctk.CTkFrame(row, fg_color="transparent")
+            field.pack(side="left", padx=(0, 8))
+            ctk.CTkLabel(
+                field,
+                text=label,
+                font=FONTS["small"],
+                text_color=COLORS["text_secondary"][mode_index]
+            ).pack(anchor="w")
+            return field
+        
+        # Category selectors
+        category_row = ctk.CTkFrame(filter_frame, fg_color="transparent")
+        category_row.pack(fill="x")
+        
+        for name in CATEGORY_COLUMNS:
+            options = [ALL_OPTION] + index.options(name)
+            selector = ctk.CTkOptionMenu(
+                add_field(category_row, name.capitalize()),
+                values=options,
+                command=lambda _value: self._schedule_filter_update(),
+                width=140,
+                dynamic_resizing=False,
+                font=ctk.CTkFont(family="Inter", size=12),
+            )
+            selector.pack()
+            # Values of a previous dataset may no longer exist
+            selected = self.filter_state.get(name, ALL_OPTION)
+            selector.set(selected if selected in options else ALL_OPTION)
+            controls[name] = selector
+        
+        # Numeric thresholds and kickoff window
+        numeric_row = ctk.CTkFrame(filter_frame, fg_color="transparent")
+        numeric_row.pack(fill="x", pady=(6, 0))
+        
+        numeric_fields = [
+            ("min_value", "Min. value"),
+            ("min_probability", "Min. probability (%)"),
+            ("min_edge", "Min. edge"),
+            ("min_odds", "Min. odds"),
+            ("max_odds", "Max. odds"),
+        ]
+        for name, label in numeric_fields:
+            entry = ctk.CTkEntry(
+                add_field(numeric_row, label),
+                width=120,
+                font=ctk.CTkFont(family="Inter", size=12),
+            )
+            entry.pack()
+            if self.filter_state.get(name):
+                entry.insert(0, self.filter_state[name])
+            entry.bind("<KeyRelease>", lambda _event: self._schedule_filter_update())
+            controls[name] = entry
+        
+        kickoff_selector = ctk.CTkOptionMenu(
+            add_field(numeric_row, "Kickoff"),
+            values=list(KICKOFF_WINDOWS.keys()),
+            command=lambda _value: self._schedule_filter_update(),
+            width=120,
+            font=ctk.CTkFont(family="Inter", size=12),
+        )
+        kickoff_selector.pack()
+        kickoff_selector.set(self.filter_state.get("kickoff", "Any time"))
+        controls["kickoff"] = kickoff_selector
+        
+        reset_button = ctk.CTkButton(
+            numeric_row,
+            text="Reset",
+            command=self.reset_filters,
+            font=FONTS["button"],
+            width=90,
+            height=28,
+            fg_color=COLORS["accent"][mode_index],
+            hover_color=COLORS["accent_hover"][mode_index],
+        )
+        reset_button.pack(side="left", anchor="s", padx=(8, 0))
+        
+        return controls
+
+    def _read_filter_controls(self):
+        """Read the raw values of the filter widgets"""
+        return {name: widget.get() for name, widget in self.filter_controls.items()}
+
+    def _filters_from_state(self, state):
+        """Convert raw filter widget values to FilterIndex.select arguments"""
+        from src.scraper.filters import CATEGORY_COLUMNS
+        
+        filters = {name: state.get(name) for name in CATEGORY_COLUMNS}
+        
+        for name in ("min_value", "min_probability", "min_edge", "min_odds", "max_odds"):
+            raw = (state.get(name) or "").strip().replace(",", ".").rstrip("%")
+            try:
+                filters[name] = float(raw) if raw else None
+            except ValueError:
+                # Ignore incomplete input such as "1." while the user is typing
+                filters[name] = None
+        
+        filters["kickoff_hours"] = KICKOFF_WINDOWS.get(state.get("kickoff"))
+        return filters
+
+    def _schedule_filter_update(self):
+        """Debounce filter changes before applying them"""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DEBOUNCE_MS, self._apply_filters)
+
+    def _apply_filters(self):
+        """Apply the current filter widgets and refresh the card list"""
+        self._filter_job = None
+        # The cards view may have been replaced while the update was pending
+        if self.data is None or self.cards_scroll_frame is None or not self.cards_scroll_frame.winfo_exists():
+            return
+        
+        self.filter_state = self._read_filter_controls()
+        self._update_filtered_positions()
+        self.current_page = 1
+        self._refresh_card_list()
+
+    def _update_filtered_positions(self):
+        """Intersect the filter and search indexes with the current filter state"""
+        import numpy as np
+        
+        index = self._get_filter_index()
+        positions = index.select(self._filters_from_state(self.filter_state))
+        
+        query = (self.filter_state.get("search") or "").strip()
+        if query:
+            matches = self._get_search_index().search(query)
+            positions = np.intersect1d(positions, matches, assume_unique=True)
+        
+        if self.filter_state.get("one_per_event"):
+            import pandas as pd
+            from src.scraper.grouping import best_price_positions
+            
+            groups = self._get_bet_groups()
+            odds = self._derived("odds_array", lambda: pd.to_numeric(self.data["odds"], errors="coerce").to_numpy(dtype=float))
+            positions = best_price_positions(positions, groups["group_id"].to_numpy(), odds)
+        
+        self.matching_positions = positions
+        self._update_sorted_positions()
+
+    def _update_sorted_positions(self):
+        """Order the matching rows with the cached permutation of the selected sort key"""
+        from src.gui.sorting import SortIndex, SORT_KEYS
+        
+        sort_index = self._derived("sort_index", lambda: SortIndex(self.data))
+        # "Default" keeps the scraper order, which is already the most relevant first
+        column = SORT_KEYS.get(self.filter_state.get("sort_by"))
+        ascending = self.filter_state.get("sort_direction") == "Asc" if column else True
+        
+        self.filtered_positions = sort_index.order(self.matching_positions, column, ascending)
+        self.filtered_data = self.data.iloc[self.filtered_positions]
+
+    def _apply_sort(self):
+        """Reorder the displayed bets without re-filtering or rebuilding card data"""
+        if self.data is None or self.matching_positions is None:
+            return
+        
+        self.filter_state = self._read_filter_controls()
+        self._update_sorted_positions()
+        self.current_page = 1
+        self._refresh_card_list()
+
+    def reset_filters(self):
+        """Clear every filter and show all bets"""
+        self.filter_state = {}
+        self.display_data_cards()
+
+    def _refresh_card_list(self, keep_page=False):
+        """Refresh the count, pagination and cards without rebuilding the filter bar
+        
+        With keep_page, the cards are only redrawn if the current page content changed
+        and the scroll position is preserved.
+        """
+        mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
+        start_idx = (self.current_page - 1) * self.items_per_page
+        previous_page = self.formatted_matches[start_idx:start_idx + self.items_per_page]
+        self.formatted_matches = self.prepare_data_for_cards()
+        
+        bets_count = len(self.formatted_matches)
+        total_count = len(self.data) if self.data is not None else 0
+        
+        if bets_count < total_count:
+            count_text = f"{bets_count} of {total_count} bets displayed"
+        else:
+            count_text = f"{bets_count} bets found"
+        self.count_label.configure(text=count_text)
+        
+        total_pages = max(1, (bets_count + self.items_per_page - 1) // self.items_per_page)
+        self.current_page = min(self.current_page, total_pages)
+        self.pagination_controls["total_pages"] = total_pages
+        self.pagination_controls["page_label"].configure(text=f"Page {self.current_page}/{total_pages}")
+        self.pagination_controls["items_info"].configure(text=f"Total: {bets_count} bets")
+        
+        if keep_page:
+            start_idx = (self.current_page - 1) * self.items_per_page
+            page = self.formatted_matches[start_idx:start_idx + self.items_per_page]
+            if len(page) == len(previous_page) and all(a is b for a, b in zip(page, previous_page)):
+                return
+            
+            scroll_position = self.cards_scroll_frame._parent_canvas.yview()[0]
+            self.update_matches_display(self.current_page, self.formatted_matches, self.cards_scroll_frame)
+            self.cards_scroll_frame._parent_canvas.yview_moveto(scroll_position)
+            return
+        
+        self.update_matches_display(self.current_page, self.formatted_matches, self.cards_scroll_frame)
         
     def display_data_cards(self):
         """Display data as cards with pagination"""
         mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
         
         if self.data is None:
-            if not self.load_data():
-                return
-                
-        # If filtered_data is None, initialize it from data
-        if self.filtered_data is None:
-            self.filtered_data = self.data.copy()
+            self.load_data(self.display_data_cards)
+            return
         
         # Update page title
         self.title_label.configure(text="Value Bets")
@@ -853,39 +1503,31 @@ class ValueBetScraperApp(ctk.CTk):
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         
-        # Create filter controls (simplified in this version)
+        # Create filter controls and apply the saved filter state
         self.filter_controls = self.create_filter_controls(self.content_frame)
+        self.filter_state = self._read_filter_controls()
+        self._update_filtered_positions()
         
         # Create main scroll frame
-        scroll_frame = ctk.CTkScrollableFrame(
+        self.cards_scroll_frame = ctk.CTkScrollableFrame(
             self.content_frame,
             fg_color="transparent",
         )
-        scroll_frame.pack(fill="both", expand=True, padx=15, pady=5)
-        
-        # Prepare data for display
-        formatted_matches = self.prepare_data_for_cards()
+        self.cards_scroll_frame.pack(fill="both", expand=True, padx=15, pady=5)
         
         self.current_page = 1
         
         # Display match count
-        bets_count = len(self.filtered_data) if self.filtered_data is not None else 0
-        total_count = len(self.data) if self.data is not None else 0
-        
         count_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         count_frame.pack(fill="x", padx=15, pady=5)
         
-        if bets_count < total_count:
-            count_text = f"{bets_count} of {total_count} bets displayed"
-        else:
-            count_text = f"{bets_count} bets found"
-            
-        ctk.CTkLabel(
+        self.count_label = ctk.CTkLabel(
             count_frame,
-            text=count_text,
+            text="",
             font=ctk.CTkFont(family="Inter", size=12),
             text_color=COLORS["text_secondary"][mode_index]
-        ).pack(side="left")
+        )
+        self.count_label.pack(side="left")
         
         # Function to change page
         def change_page(direction):
@@ -895,7 +1537,7 @@ class ValueBetScraperApp(ctk.CTk):
                 self.current_page -= 1
             elif direction == "refresh":
                 # Just refresh the current page
-                total_pages = max(1, (len(formatted_matches) + self.items_per_page - 1) // self.items_per_page)
+                total_pages = max(1, (len(self.formatted_matches) + self.items_per_page - 1) // self.items_per_page)
                 self.pagination_controls["total_pages"] = total_pages
                 self.current_page = min(self.current_page, total_pages)
             
@@ -904,8 +1546,8 @@ class ValueBetScraperApp(ctk.CTk):
             )
             self.update_matches_display(
                 self.current_page, 
-                formatted_matches, 
-                scroll_frame
+                self.formatted_matches, 
+                self.cards_scroll_frame
             )
         
         # Create pagination controls
@@ -914,24 +1556,23 @@ class ValueBetScraperApp(ctk.CTk):
         
         self.pagination_controls = self.create_pagination_controls(
             pagination_frame, 
-            len(formatted_matches), 
+            0, 
             self.items_per_page, 
             change_page
         )
         
         # Display first page of matches
-        self.update_matches_display(
-            self.current_page, 
-            formatted_matches, 
-            scroll_frame
-        )
+        self._refresh_card_list()
     
     def show_statistics(self):
         """Show statistics and visualizations"""
-        if self.data is None or self.data.empty:
-            if not self.load_data():
-                self.show_notification("No data available to generate statistics.", "warning")
-                return
+        if self.data is None:
+            self.load_data(self.show_statistics)
+            return
+        
+        if self.data.empty:
+            self.show_notification("No data available to generate statistics.", "warning")
+            return
         
         mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
         
@@ -949,21 +1590,20 @@ class ValueBetScraperApp(ctk.CTk):
         kpi_frame = ctk.CTkFrame(stats_container, fg_color="transparent")
         kpi_frame.pack(fill="x", pady=(0, 20))
         
-        # Calculate KPIs
-        total_bets = len(self.data)
-        avg_odds = self.data["odds"].mean()
-        
-        # Traiter 'value' comme un float représentant un ratio, pas un pourcentage
-        avg_value = self.data["value"].astype(float).mean()
-        
-        # Calculer un KPI supplémentaire: ROI potentiel moyen (value-1)
-        avg_roi = (self.data["value"].astype(float) - 1).mean() * 100  # Convertir en pourcentage
+        # Calculate KPIs (once per data version)
+        kpis = self._derived("statistics_kpis", self._compute_kpis)
         
         # Create KPI cards
-        self.create_kpi_card(kpi_frame, "Total Value Bets", str(total_bets), "card-1")
-        self.create_kpi_card(kpi_frame, "Average Odds", f"{avg_odds:.2f}", "card-2")
-        self.create_kpi_card(kpi_frame, "Average Value", f"{avg_value:.2f}", "card-3")
-        self.create_kpi_card(kpi_frame, "Avg. ROI", f"{avg_roi:.1f}%", "card-4")
+        self.create_kpi_card(kpi_frame, "Total Value Bets", str(kpis["total_bets"]), "card-1")
+        self.create_kpi_card(kpi_frame, "Average Odds", f"{kpis['avg_odds']:.2f}", "card-2")
+        self.create_kpi_card(kpi_frame, "Average Value", f"{kpis['avg_value']:.2f}", "card-3")
+        self.create_kpi_card(kpi_frame, "Avg. ROI", f"{kpis['avg_roi']:.1f}%", "card-4")
+        
+        # Figures are created once and only refreshed when the data changed
+        if self.chart_manager is None:
+            from src.gui.charts import ChartManager
+            self.chart_manager = ChartManager(COLORS["accent"][0])
+        self.chart_manager.update(self.data, self.data_version)
         
         # Create charts container
         charts_container = ctk.CTkFrame(stats_container, fg_color="transparent")
@@ -987,32 +1627,7 @@ class ValueBetScraperApp(ctk.CTk):
         )
         left_title.pack(pady=(15, 5))
         
-        # Create value distribution chart
-        fig1, ax1 = plt.subplots(figsize=(5, 4))
-        
-        # Extraire les données de value comme des floats
-        value_data = self.data["value"].astype(float)
-        
-        # Créer des bins plus adaptés à des ratios
-        bins = np.linspace(min(value_data), max(value_data), 10)
-        
-        ax1.hist(value_data, bins=bins, color=COLORS["accent"][0], alpha=0.7)
-        ax1.set_xlabel('Value (ratio)')
-        ax1.set_ylabel('Number of bets')
-        ax1.grid(True, alpha=0.3)
-        ax1.spines['top'].set_visible(False)
-        ax1.spines['right'].set_visible(False)
-        
-        # Ajouter une ligne verticale à value=2.0 qui représente un ROI de 100%
-        ax1.axvline(x=2.0, color='red', linestyle='--', alpha=0.7)
-        ax1.text(2.0, 0, '100% ROI', color='red', rotation=90, va='bottom', ha='right')
-        
-        fig1.tight_layout()
-        
-        # Embed chart in GUI
-        canvas1 = FigureCanvasTkAgg(fig1, master=left_chart_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        self.chart_manager.attach(self.chart_manager.value_figure, left_chart_frame)
         
         # Right chart: ROI potential distribution
         right_chart_frame = ctk.CTkFrame(
@@ -1032,43 +1647,10 @@ class ValueBetScraperApp(ctk.CTk):
         )
         right_title.pack(pady=(15, 5))
         
-        # Create bookmaker distribution chart
-        fig2, ax2 = plt.subplots(figsize=(5, 4))
-        
-        # Get bookmaker counts
-        bookmaker_counts = self.data['bookmaker'].value_counts()
-        
-        # Limit to top 10 bookmakers
-        if len(bookmaker_counts) > 10:
-            other_count = bookmaker_counts[10:].sum()
-            bookmaker_counts = bookmaker_counts[:10]
-            bookmaker_counts['Others'] = other_count
-        
-        bars = ax2.bar(bookmaker_counts.index, bookmaker_counts.values, color=COLORS["accent"][0], alpha=0.7)
-        ax2.set_xlabel('Bookmaker')
-        ax2.set_ylabel('Number of bets')
+        self.chart_manager.attach(self.chart_manager.bookmaker_figure, right_chart_frame)
         
-        # Fix the ticklabels warning by explicitly setting ticks first
-        ax2.set_xticks(range(len(bookmaker_counts)))
-        ax2.set_xticklabels(bookmaker_counts.index, rotation=45, ha='right')
-        
-        ax2.grid(True, axis='y', alpha=0.3)
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['right'].set_visible(False)
-        
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{height:.0f}',
-                    ha='center', va='bottom', fontsize=8)
-                    
-        fig2.tight_layout()
-        
-        # Embed chart in GUI
-        canvas2 = FigureCanvasTkAgg(fig2, master=right_chart_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        # Best strategies of the last backtest sweep
+        self._create_backtest_panel(stats_container, mode_index)
         
         # Back button
         bottom_frame = ctk.CTkFrame(stats_container, fg_color="transparent")
@@ -1084,6 +1666,192 @@ class ValueBetScraperApp(ctk.CTk):
             fg_color=COLORS["accent"][mode_index],
             hover_color=COLORS["accent_hover"][mode_index],
         ).pack(side="left")
+        
+        ctk.CTkButton(
+            bottom_frame,
+            text="Running Backtest..." if self.backtest_running else "Run Backtest",
+            command=self.run_backtest,
+            state="disabled" if self.backtest_running else "normal",
+            font=FONTS["button"],
+            height=40,
+            width=180,
+            fg_color=COLORS["accent"][mode_index],
+            hover_color=COLORS["accent_hover"][mode_index],
+        ).pack(side="left", padx=(10, 0))
+    
+    def _create_backtest_panel(self, parent, mode_index):
+        """Show the best strategies of the exported backtest results, if any"""
+        from src.scraper.backtest import load_backtest
+        
+        results = load_backtest()
+        if results is None or results.empty:
+            return
+        
+        panel = ctk.CTkFrame(
+            parent,
+            fg_color=COLORS["card_bg"][mode_index],
+            corner_radius=10,
+            border_width=1,
+            border_color=COLORS["border"][mode_index]
+        )
+        panel.pack(fill="x", pady=(20, 0))
+        
+        ctk.CTkLabel(
+            panel,
+            text=f"Backtest - Best Strategies ({len(results)} tested)",
+            font=FONTS["subtitle"],
+            text_color=COLORS["text_primary"][mode_index]
+        ).grid(row=0, column=0, columnspan=6, sticky="w", padx=15, pady=(10, 5))
+        
+        # Without any known result, outcomes were drawn from the same probabilities
+        # the strategies filter on, so the ROI only restates the model
+        simulated = "known" not in results.columns or results["known"].sum() == 0
+        if simulated:
+            ctk.CTkLabel(
+                panel,
+                text="No known results yet: outcomes are simulated from the scraped probabilities.",
+                font=ctk.CTkFont(family="Inter", size=12),
+                text_color=COLORS["text_secondary"][mode_index]
+            ).grid(row=1, column=0, columnspan=6, sticky="w", padx=15, pady=(0, 5))
+        
+        headers = ["Min Value", "Min Prob.", "Kelly", "Bets", "Simulated ROI" if simulated else "ROI", "Max Drawdown"]
+        for column, header in enumerate(headers):
+            ctk.CTkLabel(
+                panel,
+                text=header,
+                font=ctk.CTkFont(family="Inter", size=12, weight="bold"),
+                text_color=COLORS["text_secondary"][mode_index]
+            ).grid(row=2, column=column, padx=15, sticky="w")
+        
+        best = results.sort_values("roi", ascending=False).head(5)
+        for row, strategy in enumerate(best.itertuples(index=False), start=3):
+            cells = [
+                f"{strategy.min_value:.2f}",
+                f"{strategy.min_probability:.0f}%",
+                f"{strategy.kelly_fraction:.2f}",
+                str(strategy.bets),
+                f"{strategy.roi:.1f}%",
+                f"{strategy.max_drawdown:.1f}%",
+            ]
+            for column, text in enumerate(cells):
+                ctk.CTkLabel(
+                    panel,
+                    text=text,
+                    font=ctk.CTkFont(family="Inter", size=12),
+                    text_color=COLORS["text_primary"][mode_index]
+                ).grid(row=row, column=column, padx=15, sticky="w")
+        
+        panel.grid_rowconfigure(len(best) + 3, minsize=10)
+    
+    def run_backtest(self):
+        """Sweep the backtest parameters over the stored snapshots in the background"""
+        if self.backtest_running:
+            return
+        
+        self.backtest_running = True
+        self.show_notification("Backtest started...", "info")
+        threading.Thread(target=self._backtest_task, daemon=True).start()
+        if self.title_label.cget("text") == "Statistics & Visualizations":
+            self.show_statistics()
+    
+    def _backtest_task(self):
+        """Run the sweep (worker thread) and post its results to the Tk thread"""
+        try:
+            from src.scraper.backtest import run_sweep, export_backtest
+            
+            results = run_sweep()
+            if not results.empty:
+                export_backtest(results)
+            self.ui_events.post(events.BACKTEST_DONE, results, None)
+        except Exception as e:
+            logger.exception(f"Backtest failed: {str(e)}")
+            self.ui_events.post(events.BACKTEST_DONE, None, str(e))
+    
+    def _on_backtest_done(self, results, error):
+        """Report the sweep and refresh the statistics view if it's displayed"""
+        self.backtest_running = False
+        
+        if error is not None:
+            self.show_notification(f"Backtest failed: {error}", "error")
+        elif results.empty:
+            self.show_notification("No stored snapshots to backtest yet.", "warning")
+        else:
+            self.show_notification(f"Backtest done: {len(results)} strategies tested.", "success")
+        
+        if self.title_label.cget("text") == "Statistics & Visualizations":
+            self.show_statistics()
+    
+    def show_history(self):
+        """Show trends over all stored scrapes, computed from the rollups only"""
+        from src.gui.charts import HistoryCharts
+        from src.scraper.rollups import load_rollups, history_summary, rollups_path
+        
+        mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
+        
+        path = rollups_path()
+        if not os.path.exists(path):
+            self.show_notification("No history yet. Run scraping first.", "warning")
+            return
+        
+        # The rollups file only grows, so its size identifies its content
+        rollups_version = os.path.getsize(path)
+        if self.history_charts is None:
+            self.history_charts = HistoryCharts(COLORS["accent"][0])
+        if self.history_charts.rollups_version != rollups_version:
+            rollups = load_rollups(path)
+            self.history_charts.update(history_summary(rollups), rollups_version)
+            self.history_run_count = rollups["run_id"].nunique()
+        
+        self.title_label.configure(text="History")
+        
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        history_container = ctk.CTkScrollableFrame(self.content_frame, fg_color="transparent")
+        history_container.pack(fill="both", expand=True, padx=15, pady=15)
+        
+        ctk.CTkLabel(
+            history_container,
+            text=f"{self.history_run_count} scrapes recorded",
+            font=ctk.CTkFont(family="Inter", size=12),
+            text_color=COLORS["text_secondary"][mode_index]
+        ).pack(anchor="w", pady=(0, 10))
+        
+        charts = [
+            ("bets_per_day", "Bets per Day"),
+            ("value_by_bookmaker", "Average Value by Bookmaker"),
+            ("hit_rate_by_league", "Expected Hit Rate by League"),
+        ]
+        for name, title in charts:
+            chart_frame = ctk.CTkFrame(
+                history_container,
+                fg_color=COLORS["card_bg"][mode_index],
+                corner_radius=10,
+                border_width=1,
+                border_color=COLORS["border"][mode_index]
+            )
+            chart_frame.pack(fill="x", pady=(0, 15))
+            
+            ctk.CTkLabel(
+                chart_frame,
+                text=title,
+                font=FONTS["subtitle"],
+                text_color=COLORS["text_primary"][mode_index]
+            ).pack(pady=(15, 5))
+            
+            self.history_charts.attach(name, chart_frame)
+    
+    def _compute_kpis(self):
+        """Compute the statistics view KPIs of the current data"""
+        # Traiter 'value' comme un float représentant un ratio, pas un pourcentage
+        values = self.data["value"].astype(float)
+        return {
+            "total_bets": len(self.data),
+            "avg_odds": self.data["odds"].mean(),
+            "avg_value": values.mean(),
+            # ROI potentiel moyen (value-1), converti en pourcentage
+            "avg_roi": (values - 1).mean() * 100,
+        }
     
     def create_kpi_card(self, parent, title, value, card_id):
         """Create a KPI card for the stats view"""
@@ -1116,32 +1884,67 @@ class ValueBetScraperApp(ctk.CTk):
         ).pack()
                 
     def update_progress(self, progress_value, status_text):
-        """Update progress bar and status text"""
+        """Update progress bar and status text (Tk thread only, see _process_ui_events)"""
         self.progress_bar.set(progress_value)
         self.progress_status.configure(text=status_text)
-        self.update_idletasks()
         
     def _cleanup_after_scraping(self):
         """Clean up UI after scraping"""
         self.progress_frame.grid_forget()
+        self.cancel_button.pack_forget()
         self.scrape_button.configure(state="normal")
         self.display_cards_button.configure(state="normal")
         self.stats_button.configure(state="normal")
+        self.history_button.configure(state="normal")
     
-    def load_data(self):
-        """Load data from CSV file"""
-        try:
-            if os.path.exists(self.data_path):
-                self.data = pd.read_csv(self.data_path)
-                self.filtered_data = self.data.copy()
-                return True
-            else:
-                self.show_notification("Data file not found. Run scraping first.", "warning")
-                return False
-        except Exception as e:
-            self.show_notification(f"Error loading data: {str(e)}", "error")
-            logger.exception(f"Error loading data: {str(e)}")  # logger.exception au lieu de logger.error avec exc_info
+    def load_data(self, on_loaded):
+        """Load the data file off the Tk thread, then show the view waiting for it"""
+        if not os.path.exists(self.data_path):
+            self.show_notification("Data file not found. Run scraping first.", "warning")
             return False
+        
+        # Unchanged files are never parsed twice
+        df = self.data_loader.get_cached(self.data_path)
+        if df is not None:
+            self._set_data(df)
+            on_loaded()
+            return True
+        
+        self._pending_view = on_loaded
+        self._show_loading_placeholder()
+        self.data_loader.load_async(self.data_path)
+        return True
+    
+    def _show_loading_placeholder(self):
+        """Show a lightweight placeholder while the data is loading"""
+        mode_index = 0 if ctk.get_appearance_mode().lower() == "light" else 1
+        
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        placeholder = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        placeholder.pack(expand=True)
+        
+        ctk.CTkLabel(
+            placeholder,
+            text="Loading data...",
+            font=ctk.CTkFont(family="Inter", size=16),
+            text_color=COLORS["text_secondary"][mode_index]
+        ).pack(pady=20)
+    
+    def _on_data_loaded(self, path, df, error):
+        """Install the data loaded in the background and show the waiting view"""
+        view, self._pending_view = self._pending_view, None
+        
+        if error is not None:
+            self.show_notification(f"Error loading data: {error}", "error")
+            return
+        
+        if df is not self.data:
+            self._set_data(df)
+        # A scrape started meanwhile owns the content area
+        if view is not None and not self.animation_running:
+            view()
     
     def show_notification(self, message, type="info"):
         """Display a notification"""
@@ -1173,7 +1976,10 @@ if __name__ == "__main__":
         
         # Properly handle potential after callbacks when app is destroyed
         def on_closing():
-            plt.close('all')  # Close all matplotlib figures
+            if app.scraper_process is not None:
+                app.scraper_process.cancel(timeout=2.0)
+            if app.api_server is not None:
+                app.api_server.stop()
             app.quit()
             app.destroy()
             
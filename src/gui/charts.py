@@ -0,0 +1,169 @@
+"""
+Reusable statistics charts.
+
+The value histogram and bookmaker bar figures are created once, outside pyplot's
+global registry, and their artists are updated in place when the data version
+changes. Revisiting the statistics view only attaches a canvas to the existing
+figures.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+# Number of bars of the value histogram
+HISTOGRAM_BINS = 9
+
+# Bookmakers shown individually, the rest are grouped under "Others"
+TOP_BOOKMAKERS = 10
+
+# Value of 2.0 means a 100% expected return
+ROI_100_VALUE = 2.0
+
+
+def _style_axes(ax, xlabel: str, ylabel: str, grid_axis: str = "both") -> None:
+    """Apply the common look of the statistics charts."""
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True, axis=grid_axis, alpha=0.3)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+
+class ChartManager:
+    """Owns the statistics figures and refreshes them per data version."""
+
+    def __init__(self, color: str):
+        self.data_version: Optional[int] = None
+
+        # Value distribution histogram, one rectangle per bin
+        self.value_figure = Figure(figsize=(5, 4))
+        self._value_ax = self.value_figure.add_subplot()
+        self._value_bars = self._value_ax.bar(
+            np.zeros(HISTOGRAM_BINS), np.zeros(HISTOGRAM_BINS), width=0, align="edge", color=color, alpha=0.7
+        )
+        _style_axes(self._value_ax, 'Value (ratio)', 'Number of bets')
+        self._value_ax.axvline(x=ROI_100_VALUE, color='red', linestyle='--', alpha=0.7)
+        self._value_ax.text(ROI_100_VALUE, 0, '100% ROI', color='red', rotation=90, va='bottom', ha='right')
+
+        # Bookmaker breakdown, one slot per top bookmaker plus "Others"
+        slots = TOP_BOOKMAKERS + 1
+        self.bookmaker_figure = Figure(figsize=(5, 4))
+        self._bookmaker_ax = self.bookmaker_figure.add_subplot()
+        self._bookmaker_bars = self._bookmaker_ax.bar(range(slots), np.zeros(slots), color=color, alpha=0.7)
+        self._bookmaker_labels = [
+            self._bookmaker_ax.text(i, 0, "", ha='center', va='bottom', fontsize=8) for i in range(slots)
+        ]
+        _style_axes(self._bookmaker_ax, 'Bookmaker', 'Number of bets', grid_axis='y')
+        # Headroom for the count labels above the bars
+        self._bookmaker_ax.margins(y=0.1)
+
+    def update(self, df: pd.DataFrame, data_version: int) -> bool:
+        """Refresh the figures for a data version, returns False if already up to date."""
+        if data_version == self.data_version:
+            return False
+
+        self._update_value_histogram(pd.to_numeric(df["value"], errors="coerce").dropna().to_numpy())
+        self._update_bookmaker_bars(df["bookmaker"].value_counts())
+        self.value_figure.tight_layout()
+        self.bookmaker_figure.tight_layout()
+
+        self.data_version = data_version
+        return True
+
+    def _update_value_histogram(self, values: np.ndarray) -> None:
+        """Move the histogram rectangles to the bins of the new values."""
+        if len(values) == 0:
+            low, high = 0.0, 1.0
+        else:
+            low, high = float(values.min()), float(values.max())
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+
+        edges = np.linspace(low, high, HISTOGRAM_BINS + 1)
+        counts, _ = np.histogram(values, bins=edges)
+        for bar, left, width, count in zip(self._value_bars, edges[:-1], np.diff(edges), counts):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(count)
+
+        self._value_ax.relim()
+        self._value_ax.autoscale_view()
+
+    def _update_bookmaker_bars(self, counts: pd.Series) -> None:
+        """Set the bar heights, labels and ticks to the new bookmaker counts."""
+        if len(counts) > TOP_BOOKMAKERS:
+            other_count = counts.iloc[TOP_BOOKMAKERS:].sum()
+            counts = counts.iloc[:TOP_BOOKMAKERS].copy()
+            counts['Others'] = other_count
+
+        for i, (bar, label) in enumerate(zip(self._bookmaker_bars, self._bookmaker_labels)):
+            visible = i < len(counts)
+            height = float(counts.iloc[i]) if visible else 0.0
+            bar.set_height(height)
+            bar.set_visible(visible)
+            label.set_position((i, height + 0.1))
+            label.set_text(f'{height:.0f}' if visible else "")
+
+        self._bookmaker_ax.set_xticks(range(len(counts)))
+        self._bookmaker_ax.set_xticklabels(counts.index, rotation=45, ha='right')
+        self._bookmaker_ax.relim(visible_only=True)
+        self._bookmaker_ax.autoscale_view()
+
+    def attach(self, figure: Figure, master) -> FigureCanvasTkAgg:
+        """Embed an existing figure in a Tk container and draw it."""
+        canvas = FigureCanvasTkAgg(figure, master=master)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        return canvas
+
+
+class HistoryCharts:
+    """Owns the history dashboard figures, redrawn only when the rollups change."""
+
+    def __init__(self, color: str):
+        self.color = color
+        self.rollups_version = None
+        self.figures = {
+            "bets_per_day": Figure(figsize=(5, 3.5)),
+            "value_by_bookmaker": Figure(figsize=(5, 3.5)),
+            "hit_rate_by_league": Figure(figsize=(5, 3.5)),
+        }
+        self._axes = {name: figure.add_subplot() for name, figure in self.figures.items()}
+
+    def update(self, summary: dict, rollups_version) -> bool:
+        """Redraw the dashboard series, returns False if already up to date."""
+        if rollups_version == self.rollups_version:
+            return False
+
+        ax = self._axes["bets_per_day"]
+        ax.clear()
+        series = summary["bets_per_day"]
+        ax.plot(series.index, series.values, color=self.color, marker='o', markersize=3)
+        _style_axes(ax, 'Day', 'Bets seen')
+        self.figures["bets_per_day"].autofmt_xdate()
+
+        for name, ylabel in (("value_by_bookmaker", 'Average value'), ("hit_rate_by_league", 'Expected hit rate (%)')):
+            ax = self._axes[name]
+            ax.clear()
+            series = summary[name]
+            ax.bar(range(len(series)), series.values, color=self.color, alpha=0.7)
+            ax.set_xticks(range(len(series)))
+            ax.set_xticklabels(series.index, rotation=45, ha='right')
+            _style_axes(ax, '', ylabel, grid_axis='y')
+
+        for figure in self.figures.values():
+            figure.tight_layout()
+
+        self.rollups_version = rollups_version
+        return True
+
+    def attach(self, name: str, master) -> FigureCanvasTkAgg:
+        """Embed one of the dashboard figures in a Tk container and draw it."""
+        canvas = FigureCanvasTkAgg(self.figures[name], master=master)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        return canvas
@@ -0,0 +1,66 @@
+"""
+Thread-safe bridge between background workers and the Tk main loop.
+
+Workers only post events; the main loop drains the queue at a fixed cadence and
+coalesces bursts, so widgets are touched from the Tk thread only and a flood of
+progress callbacks results in a single redraw.
+"""
+
+import queue
+from typing import Any, List, Tuple
+
+# Event kinds
+PROGRESS = "progress"
+NOTIFICATION = "notification"
+RESULT = "result"
+ERROR = "error"
+FINISHED = "finished"
+DATA_LOADED = "data_loaded"
+BACKTEST_DONE = "backtest_done"
+
+# Kinds where only the most recent event of a burst matters
+COALESCED_KINDS = (PROGRESS, NOTIFICATION)
+
+Event = Tuple[str, Tuple[Any, ...]]
+
+
+class UIEventQueue:
+    """Queue of (kind, payload) events posted by workers and drained by the GUI."""
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[Event]" = queue.SimpleQueue()
+
+    def post(self, kind: str, *payload: Any) -> None:
+        """Post an event from any thread."""
+        self._queue.put((kind, payload))
+
+    def post_progress(self, value: float, message: str) -> None:
+        """Post a progress update (0..1) with its status message."""
+        self.post(PROGRESS, value, message)
+
+    def post_notification(self, message: str, type: str = "info") -> None:
+        """Post a message for the notification area."""
+        self.post(NOTIFICATION, message, type)
+
+    def drain(self) -> List[Event]:
+        """Return the pending events, keeping only the last one of coalesced kinds.
+
+        Other events keep their relative order; a coalesced event takes the
+        position of its last occurrence.
+        """
+        events: List[Event] = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        last_index = {}
+        for index, (kind, _payload) in enumerate(events):
+            if kind in COALESCED_KINDS:
+                last_index[kind] = index
+
+        return [
+            event for index, event in enumerate(events)
+            if event[0] not in COALESCED_KINDS or last_index[event[0]] == index
+        ]
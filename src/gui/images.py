@@ -0,0 +1,62 @@
+"""
+Shared in-memory cache of decoded bookmaker logos.
+
+Each cached logo file is decoded once into a CTkImage and reused by every card
+showing the same bookmaker. The least recently used images are dropped past a
+fixed capacity.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+import customtkinter as ctk
+from loguru import logger
+
+from src.scraper.logos import logo_path
+
+# Logos are displayed within the same box as on the bookmaker site
+LOGO_BOX = (75, 25)
+LOGO_CACHE_SIZE = 64
+
+
+class LogoImageCache:
+    """LRU of CTkImage objects keyed by logo file name."""
+
+    def __init__(self, capacity: int = LOGO_CACHE_SIZE):
+        self.capacity = capacity
+        self._images: "OrderedDict[str, Optional[ctk.CTkImage]]" = OrderedDict()
+
+    def get(self, file_name: Optional[str]) -> Optional[ctk.CTkImage]:
+        """Return the image of a cached logo file, decoding it on first use."""
+        if not isinstance(file_name, str) or not file_name:
+            return None
+
+        if file_name in self._images:
+            self._images.move_to_end(file_name)
+            return self._images[file_name]
+
+        image = self._decode(file_name)
+        # Failures are cached too so a broken file isn't decoded for every card
+        self._images[file_name] = image
+        if len(self._images) > self.capacity:
+            self._images.popitem(last=False)
+        return image
+
+    def _decode(self, file_name: str) -> Optional[ctk.CTkImage]:
+        """Decode a logo file into a CTkImage fitting LOGO_BOX."""
+        from PIL import Image
+
+        path = logo_path(file_name)
+        if path is None:
+            return None
+        try:
+            with Image.open(path) as source:
+                source.load()
+                image = source.convert("RGBA")
+        except Exception as e:
+            logger.warning(f"Could not decode logo {file_name}: {e}")
+            return None
+
+        scale = min(LOGO_BOX[0] / image.width, LOGO_BOX[1] / image.height)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        return ctk.CTkImage(light_image=image, dark_image=image, size=size)
@@ -0,0 +1,96 @@
+"""
+Background data loading for the GUI.
+
+CSV files are parsed on a worker thread and the result is posted to the UI event
+queue. Parsed frames are cached by (path, mtime, size), so an unchanged file is
+never parsed twice in a session. A file exported with a manifest is identified by
+its generation instead, and read from the immutable generation file the manifest
+names, so a scrape writing a new export never hands the GUI a partial file.
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from src.gui import events
+from src.gui.events import UIEventQueue
+
+CacheKey = Tuple[str, int, int]
+
+
+def exported_manifest(path: str) -> Optional[dict]:
+    """Return the export manifest describing a file, if it was exported with one."""
+    from src.scraper.export import read_manifest
+
+    manifest = read_manifest(os.path.dirname(path))
+    if manifest is not None and manifest.get("name") == os.path.basename(path):
+        return manifest
+    return None
+
+
+def file_key(path: str) -> Optional[CacheKey]:
+    """Return the identity of a file: its export generation, or (path, mtime, size)."""
+    manifest = exported_manifest(path)
+    if manifest is not None:
+        return (os.path.abspath(path), -1, manifest["generation"])
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+class DataLoader:
+    """Loads CSV files off the Tk thread and remembers the last parse of each path."""
+
+    def __init__(self, ui_events: UIEventQueue):
+        self.ui_events = ui_events
+        self._cache: Dict[str, Tuple[CacheKey, object]] = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def get_cached(self, path: str):
+        """Return the cached frame of a path if the file hasn't changed since it was parsed."""
+        key = file_key(path)
+        with self._lock:
+            entry = self._cache.get(os.path.abspath(path))
+        if key is not None and entry is not None and entry[0] == key:
+            return entry[1]
+        return None
+
+    def load_async(self, path: str) -> None:
+        """Parse a file on a worker thread; a DATA_LOADED event is posted when done."""
+        path = os.path.abspath(path)
+        with self._lock:
+            if path in self._pending:
+                return
+            self._pending.add(path)
+
+        thread = threading.Thread(target=self._load, args=(path,), daemon=True)
+        thread.start()
+
+    def _load(self, path: str) -> None:
+        """Worker thread body."""
+        import pandas as pd
+        from src.scraper.export import load_export
+
+        try:
+            df, manifest = load_export(os.path.dirname(path)) if exported_manifest(path) else (None, None)
+            if df is not None:
+                key = (path, -1, manifest["generation"])
+            else:
+                # No manifest, or a generation file that can't be trusted
+                key = file_key(path)
+                df = pd.read_csv(path)
+            with self._lock:
+                self._cache[path] = (key, df)
+            logger.info(f"Loaded {len(df)} rows from {os.path.basename(path)}")
+            self.ui_events.post(events.DATA_LOADED, path, df, None)
+        except Exception as e:
+            logger.exception(f"Error loading data: {str(e)}")
+            self.ui_events.post(events.DATA_LOADED, path, None, str(e))
+        finally:
+            with self._lock:
+                self._pending.discard(path)
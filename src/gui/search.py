@@ -0,0 +1,104 @@
+"""
+Incremental text search over team, league and country names.
+
+The index is built once per data version. A term matches anywhere inside a word,
+whatever its length: terms of up to three characters are answered directly from
+a table of every 1- to 3-character substring, longer terms from the intersection
+of their trigrams, whose candidates are then verified, so a keystroke never scans
+every row.
+"""
+
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+SEARCH_COLUMNS = ["team_1", "team_2", "leagues", "countries"]
+
+NGRAM_SIZE = 3
+QUERY_CACHE_SIZE = 64
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and strip accents so "Atlético" matches "atletico"."""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def ngrams(token: str, size: int = NGRAM_SIZE) -> Iterable[str]:
+    """Yield the character n-grams of a token."""
+    for start in range(len(token) - size + 1):
+        yield token[start:start + size]
+
+
+class SearchIndex:
+    """Substring posting lists (1 to NGRAM_SIZE characters) over the searchable columns of a DataFrame."""
+
+    def __init__(self, df: pd.DataFrame, columns: List[str] = SEARCH_COLUMNS):
+        columns = [column for column in columns if column in df.columns]
+        self.size = len(df)
+        self._texts: List[str] = []
+        self._results: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        grams: Dict[str, List[int]] = {}
+        # Names repeat across rows, so the substrings of each word are listed once
+        token_grams: Dict[str, List[str]] = {}
+        rows = df[columns].fillna("").astype(str).itertuples(index=False, name=None)
+
+        for position, values in enumerate(rows):
+            text = normalize_text(" ".join(values))
+            self._texts.append(text)
+            row_grams = set()
+            for token in text.split():
+                if token not in token_grams:
+                    token_grams[token] = [gram for size in range(1, NGRAM_SIZE + 1) for gram in ngrams(token, size)]
+                row_grams.update(token_grams[token])
+            for gram in row_grams:
+                grams.setdefault(gram, []).append(position)
+
+        # Positions are appended in row order, so every posting list is already sorted
+        self._grams = {key: np.array(value, dtype=np.intp) for key, value in grams.items()}
+
+    def _term_positions(self, term: str) -> np.ndarray:
+        """Return the rows containing a term anywhere in one of their words."""
+        if len(term) <= NGRAM_SIZE:
+            return self._grams.get(term, np.empty(0, dtype=np.intp))
+
+        candidates = None
+        for gram in set(ngrams(term)):
+            postings = self._grams.get(gram)
+            if postings is None:
+                return np.empty(0, dtype=np.intp)
+            candidates = postings if candidates is None else np.intersect1d(candidates, postings, assume_unique=True)
+
+        # Trigrams may come from different words, confirm on the candidates only
+        return np.fromiter(
+            (position for position in candidates if term in self._texts[position]),
+            dtype=np.intp,
+        )
+
+    def search(self, query: str) -> np.ndarray:
+        """Return the sorted positions of rows matching every term of the query."""
+        terms = normalize_text(query).split()
+        key = " ".join(terms)
+        if not terms:
+            return np.arange(self.size)
+
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        positions = None
+        # Rarest-looking (longest) terms first to shrink the intersection quickly
+        for term in sorted(terms, key=len, reverse=True):
+            matches = self._term_positions(term)
+            positions = matches if positions is None else np.intersect1d(positions, matches, assume_unique=True)
+            if len(positions) == 0:
+                break
+
+        self._results[key] = positions
+        if len(self._results) > QUERY_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return positions
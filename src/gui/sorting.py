@@ -0,0 +1,72 @@
+"""
+Precomputed sort permutations for the value bets card view.
+
+Each permutation is computed once per data version and sort key, then composed
+with the positions selected by the filters, so changing the sort order is a
+reindex instead of a DataFrame sort.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.scraper.kickoff import kickoff_series, kickoff_values
+
+# Label shown in the GUI -> DataFrame column (None keeps the scraper order)
+SORT_KEYS = {
+    "Default": None,
+    "Value": "value",
+    "Edge": "model_value",
+    "Odds": "odds",
+    "Probability": "probability",
+    "Kickoff": "kickoff",
+    "Bookmaker": "bookmaker",
+    "League": "leagues",
+}
+
+
+class SortIndex:
+    """Lazily computed, cached sort permutations of a DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.size = len(df)
+        self._df = df
+        self._keys: Dict[str, np.ndarray] = {}
+        self._permutations: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def _sort_key(self, column: str) -> np.ndarray:
+        """Return a float array ordering like the column, with NaN for missing values."""
+        if column not in self._keys:
+            if column == "kickoff":
+                values = kickoff_values(kickoff_series(self._df))
+            elif pd.api.types.is_numeric_dtype(self._df[column]):
+                values = self._df[column].to_numpy(dtype=float)
+            else:
+                # Sorted factorization turns text into ranks; missing values get -1
+                codes, _ = pd.factorize(self._df[column].astype("string").str.casefold(), sort=True)
+                values = codes.astype(float)
+                values[codes < 0] = np.nan
+            self._keys[column] = values
+        return self._keys[column]
+
+    def permutation(self, column: str, ascending: bool = True) -> np.ndarray:
+        """Return the positions of all rows sorted by column (stable, missing values last)."""
+        cache_key = (column, ascending)
+        if cache_key not in self._permutations:
+            values = self._sort_key(column)
+            self._permutations[cache_key] = np.argsort(values if ascending else -values, kind="stable")
+        return self._permutations[cache_key]
+
+    def order(self, positions: np.ndarray, column: Optional[str], ascending: bool = True) -> np.ndarray:
+        """Return the selected positions reordered by a cached permutation."""
+        if column is None:
+            return positions if ascending else positions[::-1]
+
+        permutation = self.permutation(column, ascending)
+        if len(positions) == self.size:
+            return permutation
+
+        selected = np.zeros(self.size, dtype=bool)
+        selected[positions] = True
+        return permutation[selected[permutation]]
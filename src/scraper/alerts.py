@@ -0,0 +1,199 @@
+"""
+Rule-based alerts on scraped value bets.
+
+Alert rules are defined in the settings (ALERT_RULES) as thresholds on the value,
+probability, odds and edge columns, lists of sports, leagues and bookmakers, and
+a time-to-kickoff window. Each rule is evaluated as one vectorized mask over the
+whole snapshot.
+
+A bet is alerted at most once: the alerted bets (same key as the snapshot deltas)
+are persisted until their kickoff. Each rule sends at most one batched message
+per cooldown, and nothing is sent during quiet hours; bets held back by either
+stay pending and are sent with the next message of their rule.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import (
+    DATA_PATH, ALERTS_FILE, ALERT_RULES, ALERT_COOLDOWN_MINUTES, ALERT_QUIET_HOURS,
+    ALERT_MEMORY_HOURS, ALERT_MAX_LISTED_BETS,
+)
+from src.scraper.delta import bet_keys
+from src.scraper.kickoff import KickoffIndex, kickoff_series, kickoff_values, local_timezone
+
+# Rule key -> (column, comparison) of the numeric conditions
+THRESHOLDS = {
+    "min_value": ("value", np.greater_equal),
+    "min_probability": ("probability", np.greater_equal),
+    "min_odds": ("odds", np.greater_equal),
+    "max_odds": ("odds", np.less_equal),
+    "min_edge": ("model_value", np.greater_equal),
+    "min_odds_movement": ("odds_movement", np.greater_equal),
+}
+
+# Rule key -> column of the conditions on a list of allowed values
+CATEGORIES = {
+    "sports": "sports",
+    "countries": "countries",
+    "leagues": "leagues",
+    "bookmakers": "bookmaker",
+}
+
+# Every rule key understood by rule_mask
+RULE_KEYS = {"name", "cooldown_minutes", "kickoff_within_hours"} | set(THRESHOLDS) | set(CATEGORIES)
+
+
+def validate_rule(rule: dict) -> None:
+    """Raise ValueError for a rule without a name or with unknown keys (likely typos)."""
+    if not rule.get("name"):
+        raise ValueError(f"Alert rule without a name: {rule}")
+    unknown = set(rule) - RULE_KEYS
+    if unknown:
+        raise ValueError(f"Unknown keys in alert rule '{rule['name']}': {sorted(unknown)}")
+
+
+def rule_mask(
+    df: pd.DataFrame,
+    rule: dict,
+    kickoff_index: Optional[KickoffIndex] = None,
+    now: Optional[datetime] = None,
+) -> np.ndarray:
+    """Return the boolean mask of the rows matching every condition of a rule.
+
+    Conditions on a column the frame doesn't have match nothing.
+    """
+    mask = np.ones(len(df), dtype=bool)
+
+    for key, (column, compare) in THRESHOLDS.items():
+        if rule.get(key) is None:
+            continue
+        if column not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+        with np.errstate(invalid="ignore"):
+            mask &= compare(values, rule[key])
+
+    for key, column in CATEGORIES.items():
+        if rule.get(key):
+            mask &= df[column].astype(str).isin(rule[key]).to_numpy()
+
+    if rule.get("kickoff_within_hours") is not None:
+        kickoff_index = kickoff_index or KickoffIndex(kickoff_series(df))
+        window = np.zeros(len(df), dtype=bool)
+        window[kickoff_index.within(rule["kickoff_within_hours"], now)] = True
+        mask &= window
+
+    return mask
+
+
+def in_quiet_hours(now: datetime, quiet_hours=ALERT_QUIET_HOURS) -> bool:
+    """Whether a local time falls in the (start_hour, end_hour) quiet window, which may span midnight."""
+    if not quiet_hours:
+        return False
+    start, end = quiet_hours
+    hour = now.hour
+    return start <= hour < end if start <= end else hour >= start or hour < end
+
+
+def format_alert(rule_name: str, bets: pd.DataFrame, max_listed: int = ALERT_MAX_LISTED_BETS) -> dict:
+    """Build the batched alert of a rule: a title and one line per bet (the best ones first)."""
+    count = len(bets)
+    bet_message = "value bet" if count == 1 else "value bets"
+    lines = [f"🔔 {count} {bet_message} ({rule_name})"]
+    listed = bets.sort_values("value", ascending=False, kind="stable").head(max_listed)
+    for _, bet in listed.iterrows():
+        lines.append(f"{bet['team_1']} - {bet['team_2']}: {bet['outcome']} @ {bet['odds']} ({bet['bookmaker']})")
+    if count > max_listed:
+        lines.append(f"... and {count - max_listed} more")
+    return {"rule": rule_name, "title": "ValueBets Alert", "message": "\n".join(lines), "bets": bets}
+
+
+class AlertEngine:
+    """Evaluates the alert rules on each snapshot and remembers what was already sent."""
+
+    def __init__(
+        self,
+        rules: Optional[List[dict]] = None,
+        path: Optional[str] = None,
+        cooldown_minutes: float = ALERT_COOLDOWN_MINUTES,
+        quiet_hours=ALERT_QUIET_HOURS,
+    ):
+        self.rules = ALERT_RULES if rules is None else rules
+        for rule in self.rules:
+            validate_rule(rule)
+        self.path = path or os.path.join(DATA_PATH, ALERTS_FILE)
+        self.cooldown_minutes = cooldown_minutes
+        self.quiet_hours = quiet_hours
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        # Bet key -> epoch seconds after which it is forgotten
+        self.alerted: Dict[str, float] = state.get("alerted", {})
+        # Rule name -> epoch seconds of its last message
+        self.last_sent: Dict[str, float] = state.get("last_sent", {})
+
+    def evaluate(self, df: pd.DataFrame, now: Optional[datetime] = None) -> List[dict]:
+        """Return the alerts to send for a snapshot, marking their bets as alerted.
+
+        Each alert is a dict with the rule name, a title, a message and the bets.
+        """
+        now = now or datetime.now().astimezone()
+        if now.tzinfo is None:
+            now = pd.Timestamp(now).tz_localize(local_timezone()).to_pydatetime()
+        now_seconds = now.timestamp()
+        self._forget_expired(now_seconds)
+
+        if df.empty or not self.rules or in_quiet_hours(now.astimezone(local_timezone()), self.quiet_hours):
+            return []
+
+        keys = bet_keys(df)
+        kickoff = kickoff_series(df)
+        kickoff_index = KickoffIndex(kickoff)
+        pending = ~keys.isin(list(self.alerted)) & ~keys.duplicated()
+
+        alerts = []
+        for rule in self.rules:
+            name = rule["name"]
+            cooldown = rule.get("cooldown_minutes", self.cooldown_minutes)
+            if now_seconds - self.last_sent.get(name, -np.inf) < cooldown * 60:
+                continue
+            matches = pending & rule_mask(df, rule, kickoff_index, now)
+            if not matches.any():
+                continue
+
+            alerts.append(format_alert(name, df[matches]))
+            self.last_sent[name] = now_seconds
+            # A bet is sent by the first rule it matches only
+            pending &= ~matches
+            self._remember(keys[matches], kickoff_values(kickoff[matches]) / 1e9, now_seconds)
+
+        if alerts:
+            logger.info(f"{len(alerts)} alerts for {sum(len(alert['bets']) for alert in alerts)} bets")
+        self._save()
+        return alerts
+
+    def _remember(self, keys: pd.Index, kickoffs: np.ndarray, now: float) -> None:
+        """Mark bets as alerted until their kickoff (or for ALERT_MEMORY_HOURS if unknown)."""
+        expires = np.where(np.isnan(kickoffs), now + ALERT_MEMORY_HOURS * 3600, kickoffs)
+        self.alerted.update(zip(keys, expires.tolist()))
+
+    def _forget_expired(self, now: float) -> None:
+        """Drop the alerted bets whose kickoff passed, so the state stays small."""
+        self.alerted = {key: expires for key, expires in self.alerted.items() if expires > now}
+
+    def _save(self) -> None:
+        """Write the alert state atomically."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"alerted": self.alerted, "last_sent": self.last_sent}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,260 @@
+"""
+Read-only local HTTP API serving the latest snapshot from memory.
+
+Other tools poll this API instead of reading data/data.csv while the scraper may
+be rewriting it. A snapshot is published as a whole (publishing only swaps a
+reference) and every response is built from that immutable snapshot:
+
+    GET /bets   value bets as JSON records, or an Arrow IPC stream with
+                ?format=arrow (requires pyarrow); filtered with the GUI filter
+                names: sport, country, league, bookmaker, market, min_value,
+                min_probability, min_edge, min_odds, max_odds, kickoff_hours
+                and limit
+    GET /meta   version, row count and publication time of the snapshot
+
+Responses carry a strong ETag (hash of the body) and are gzip-compressed for
+clients that accept it; a request whose If-None-Match matches gets an empty 304.
+Encoded responses are cached per snapshot and query, so polling an unchanged
+snapshot costs a dictionary lookup.
+
+Run standalone on the exported CSV (reloaded when it changes) with:
+    python -m src.scraper.api
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import pandas as pd
+from loguru import logger
+
+from src.config.log_setup import setup_logging
+from src.config.settings import DATA_PATH, API_HOST, API_PORT, API_RELOAD_SECONDS
+from src.scraper.filters import CATEGORY_COLUMNS, FilterIndex
+from src.scraper.export import load_export, read_manifest
+from src.scraper.kickoff import ensure_kickoff
+
+# Query parameter -> FilterIndex.select filter, for the numeric filters
+NUMERIC_PARAMETERS = ["min_value", "min_probability", "min_edge", "min_odds", "max_odds", "kickoff_hours"]
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+# Encoded responses kept per snapshot
+RESPONSE_CACHE_SIZE = 64
+
+JSON_TYPE = "application/json"
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class Snapshot:
+    """One published DataFrame and the responses already encoded from it."""
+
+    def __init__(self, df: pd.DataFrame, version: int):
+        self.df = ensure_kickoff(df)
+        self.version = version
+        self.published_at = datetime.now().astimezone()
+        self._index: Optional[FilterIndex] = None
+        # (path, sorted query, format) -> (body, gzipped body, etag)
+        self._responses: Dict[Tuple, Tuple[bytes, Optional[bytes], str]] = {}
+        self._lock = threading.Lock()
+
+    def index(self) -> FilterIndex:
+        """Return the filter index, built on the first filtered request."""
+        with self._lock:
+            if self._index is None:
+                self._index = FilterIndex(self.df)
+            return self._index
+
+    def select(self, query: Dict[str, str]) -> pd.DataFrame:
+        """Return the rows matching the query parameters (ValueError on a bad number)."""
+        filters = {name: query[name] for name in CATEGORY_COLUMNS if name in query}
+        for name in NUMERIC_PARAMETERS:
+            if name in query:
+                filters[name] = float(query[name])
+        rows = self.df.iloc[self.index().select(filters)] if filters else self.df
+        if "limit" in query:
+            rows = rows.head(int(query["limit"]))
+        return rows
+
+    def response(self, key: Tuple, build) -> Tuple[bytes, Optional[bytes], str]:
+        """Return the cached (body, gzipped body, etag) of a request, building it once."""
+        cached = self._responses.get(key)
+        if cached is None:
+            body = build()
+            gzipped = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+            cached = (body, gzipped, hashlib.sha256(body).hexdigest()[:32])
+            with self._lock:
+                if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                    self._responses.pop(next(iter(self._responses)))
+                self._responses[key] = cached
+        return cached
+
+
+def to_json(df: pd.DataFrame) -> bytes:
+    """Encode rows as a JSON array of records (timestamps in ISO 8601)."""
+    return df.to_json(orient="records", date_format="iso", force_ascii=False).encode("utf-8")
+
+
+def to_arrow(df: pd.DataFrame) -> bytes:
+    """Encode rows as an Arrow IPC stream (ImportError without pyarrow)."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+class SnapshotServer:
+    """Threaded HTTP server answering from the last published snapshot."""
+
+    def __init__(self, host: str = API_HOST, port: int = API_PORT):
+        self.snapshot: Optional[Snapshot] = None
+        self._version = 0
+        server = self
+
+        class Handler(SnapshotRequestHandler):
+            snapshot_server = server
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def publish(self, df: pd.DataFrame) -> None:
+        """Serve a new snapshot; responses of the previous one are dropped."""
+        self._version += 1
+        # A single reference swap, requests in flight keep the snapshot they started with
+        self.snapshot = Snapshot(df, self._version)
+
+    def start(self) -> "SnapshotServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="api", daemon=True)
+        self._thread.start()
+        host, port = self.address
+        logger.info(f"API listening on http://{host}:{port}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class SnapshotRequestHandler(BaseHTTPRequestHandler):
+    """GET handler of SnapshotServer; every other method is rejected."""
+
+    snapshot_server: SnapshotServer
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        snapshot = self.snapshot_server.snapshot
+        if snapshot is None:
+            self._send_error(503, "No snapshot published yet")
+            return
+
+        if url.path == "/meta":
+            self._send_cached(snapshot, ("meta",), JSON_TYPE, lambda: json.dumps({
+                "version": snapshot.version,
+                "rows": len(snapshot.df),
+                "published_at": snapshot.published_at.isoformat(),
+            }).encode("utf-8"))
+        elif url.path == "/bets":
+            arrow = query.pop("format", None) == "arrow" or ARROW_TYPE in self.headers.get("Accept", "")
+            key = ("bets", tuple(sorted(query.items())), arrow)
+            encode = to_arrow if arrow else to_json
+            try:
+                self._send_cached(snapshot, key, ARROW_TYPE if arrow else JSON_TYPE,
+                                  lambda: encode(snapshot.select(query)),
+                                  cache="kickoff_hours" not in query)
+            except ValueError as e:
+                self._send_error(400, f"Invalid query: {e}")
+            except ImportError:
+                self._send_error(406, "Arrow output requires pyarrow")
+        else:
+            self._send_error(404, "Unknown path, use /bets or /meta")
+
+    def _send_cached(self, snapshot: Snapshot, key: Tuple, content_type: str, build, cache: bool = True) -> None:
+        """Send a response body, gzipped if accepted, or 304 if the client has it."""
+        if cache:
+            body, gzipped, etag = snapshot.response(key, build)
+        else:
+            # Kickoff windows depend on the current time
+            body = build()
+            gzipped = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+            etag = hashlib.sha256(body).hexdigest()[:32]
+
+        use_gzip = gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        # Each encoding is a different representation, with its own strong ETag
+        etag = f'"{etag}-gz"' if use_gzip else f'"{etag}"'
+
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        payload = gzipped if use_gzip else body
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept, Accept-Encoding")
+        self.send_header("Cache-Control", "no-cache")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: int, message: str) -> None:
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", JSON_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"API {self.address_string()} {format % args}")
+
+
+def serve_file(path: Optional[str] = None, server: Optional[SnapshotServer] = None) -> None:
+    """Serve an exported CSV, publishing it again whenever a new generation (or file) appears."""
+    path = path or os.path.join(DATA_PATH, "data.csv")
+    directory = os.path.dirname(path)
+    server = (server or SnapshotServer()).start()
+    last_key = None
+    while True:
+        try:
+            manifest = read_manifest(directory)
+            if manifest is not None and manifest.get("name") == os.path.basename(path):
+                key = ("generation", manifest["generation"])
+            else:
+                key = ("mtime", os.stat(path).st_mtime_ns)
+            if key != last_key:
+                df = load_export(directory)[0] if key[0] == "generation" else None
+                server.publish(df if df is not None else pd.read_csv(path))
+                last_key = key
+                logger.info(f"API snapshot {server.snapshot.version} published from {path}")
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load {path}: {e}")
+        time.sleep(API_RELOAD_SECONDS)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    serve_file()
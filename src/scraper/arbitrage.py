@@ -0,0 +1,122 @@
+"""
+Cross-bookmaker arbitrage (surebet) detection.
+
+The outcomes of a market (1/X/2, Over/Under, Home/Away, draw no bet) are
+complementary: backing all of them at the best price offered by any bookmaker
+is a sure profit when their implied probabilities sum to less than 1. Markets
+are matched on the hash of their event and market columns, and the whole
+snapshot is processed with a few vectorized pandas operations.
+
+Only rows present in the snapshot are considered, so a surebet is found only
+when every outcome of a market was scraped.
+"""
+
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import DATA_PATH, ARBITRAGE_FILE, ARBITRAGE_TOTAL_STAKE, ARBITRAGE_MIN_PROFIT
+from src.scraper.grouping import EVENT_COLUMNS, group_hashes
+from src.scraper.names import CANONICAL_COLUMNS, key_columns
+
+# Market prefix of the 'pronos' column -> its complementary outcomes
+MARKET_OUTCOMES = {
+    "1X2": ["1", "X", "2"],
+    "O/U": ["Over", "Under"],
+    "Home/Away": ["1", "2"],
+    "DNB": ["1", "2"],
+}
+
+ARBITRAGE_COLUMNS = EVENT_COLUMNS + [
+    "pronos", "outcome", "bookmaker", "odds", "stake", "implied_sum", "profit", "arbitrage_id",
+]
+
+
+def market_types(pronos: pd.Series) -> pd.Series:
+    """Return the market type (key of MARKET_OUTCOMES) of every row, NaN if unsupported."""
+    types = pd.Series(np.nan, index=pronos.index, dtype=object)
+    text = pronos.astype(str)
+    for market in MARKET_OUTCOMES:
+        # "1X2, 1st Half" and "O/U 2.5" are markets of these types, "1X2X" is not
+        matches = (text == market) | text.str.startswith(market + " ") | text.str.startswith(market + ",")
+        types[matches & types.isna()] = market
+    return types
+
+
+def find_arbitrages(
+    df: pd.DataFrame,
+    total_stake: float = ARBITRAGE_TOTAL_STAKE,
+    min_profit: float = ARBITRAGE_MIN_PROFIT,
+) -> pd.DataFrame:
+    """Return the legs of every surebet of a snapshot.
+
+    Each leg is the best price of one outcome; ``stake`` splits ``total_stake`` so
+    that every outcome pays the same, and ``profit`` is that payout's return on the
+    total stake (0.02 = 2%). ``arbitrage_id`` groups the legs of one surebet.
+    """
+    types = market_types(df["pronos"])
+    outcome = df["outcome"].astype(str)
+    supported = types.notna()
+    for market, outcomes in MARKET_OUTCOMES.items():
+        supported &= (types != market) | outcome.isin(outcomes)
+
+    market_columns = key_columns(df, EVENT_COLUMNS + ["pronos"])
+    id_columns = [column for column in market_columns if column in CANONICAL_COLUMNS.values()]
+    rows = df.loc[supported, EVENT_COLUMNS + id_columns + ["pronos", "outcome", "bookmaker", "odds"]].copy()
+    rows["odds"] = pd.to_numeric(rows["odds"], errors="coerce")
+    rows = rows[rows["odds"] > 1]
+    if rows.empty:
+        return pd.DataFrame(columns=ARBITRAGE_COLUMNS)
+
+    rows["market_id"] = group_hashes(rows, market_columns)
+    rows["required"] = types[rows.index].map({market: len(outcomes) for market, outcomes in MARKET_OUTCOMES.items()})
+
+    # Best price of each outcome of each market
+    legs = rows.sort_values("odds", ascending=False, kind="stable").drop_duplicates(["market_id", "outcome"])
+    legs["inverse"] = 1 / legs["odds"]
+
+    markets = legs.groupby("market_id").agg(
+        outcomes=("outcome", "size"),
+        required=("required", "first"),
+        implied_sum=("inverse", "sum"),
+    )
+    complete = markets["outcomes"] == markets["required"]
+    surebets = markets[complete & (1 / markets["implied_sum"] - 1 > min_profit)]
+
+    legs = legs[legs["market_id"].isin(surebets.index)].copy()
+    legs["implied_sum"] = legs["market_id"].map(surebets["implied_sum"])
+    legs["stake"] = (total_stake * legs["inverse"] / legs["implied_sum"]).round(2)
+    legs["profit"] = 1 / legs["implied_sum"] - 1
+    legs["arbitrage_id"] = legs["market_id"]
+
+    return legs.sort_values(["profit", "arbitrage_id", "outcome"], ascending=[False, True, True])[
+        ARBITRAGE_COLUMNS
+    ].reset_index(drop=True)
+
+
+def arbitrage_path() -> str:
+    """Return the path of the surebets file."""
+    return os.path.join(DATA_PATH, ARBITRAGE_FILE)
+
+
+def export_arbitrages(legs: pd.DataFrame, path: Optional[str] = None) -> str:
+    """Write the surebet legs of the last scrape and return the path."""
+    path = path or arbitrage_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    legs.to_csv(path, index=False)
+    logger.info(f"{legs['arbitrage_id'].nunique()} surebets exported to {path}")
+    return path
+
+
+def load_arbitrages(path: Optional[str] = None, since: Optional[float] = None) -> Optional[pd.DataFrame]:
+    """Load the exported surebet legs, or None if there are none written after ``since`` (epoch)."""
+    path = path or arbitrage_path()
+    try:
+        if since is not None and os.path.getmtime(path) < since:
+            return None
+        return pd.read_csv(path)
+    except (OSError, ValueError):
+        return None
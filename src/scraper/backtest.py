@@ -0,0 +1,314 @@
+"""
+Backtesting of staking strategies over the stored snapshots.
+
+Every stored snapshot is loaded once into flat NumPy arrays. A bet seen by several
+scrapes is kept once, at its first sighting (the run where it could first have
+been placed). A strategy (value and probability thresholds plus a Kelly fraction)
+is then evaluated over all runs at once: the stake of a bet is a fraction of the
+bankroll at the start of its run, so per-run returns are a single bincount and the
+bankroll curve a cumulative product. Large parameter sweeps are split across a
+process pool.
+
+Bets are settled with their ``result`` column (1 won, 0 lost) when any sighting
+knows it; otherwise the outcome is drawn from the scraped probability, once per
+match, market and outcome (with a seed derived from that key), so every
+bookmaker offering it settles the same way and results are reproducible, but
+only as good as the model.
+
+Usage:
+    python -m src.scraper.backtest
+"""
+
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.log_setup import setup_logging
+from src.config.settings import (
+    BANKROLL,
+    MAX_STAKE_FRACTION,
+    MAX_EVENT_EXPOSURE,
+    MAX_BOOKMAKER_EXPOSURE,
+    DATA_PATH,
+    BACKTEST_FILE,
+    BACKTEST_SEED,
+    BACKTEST_WORKERS,
+    BACKTEST_MIN_VALUES,
+    BACKTEST_MIN_PROBABILITIES,
+    BACKTEST_KELLY_FRACTIONS,
+)
+from src.scraper.delta import BET_KEY_COLUMNS, bet_keys
+from src.scraper.snapshots import list_snapshots, load_snapshot
+from src.scraper.staking import EVENT_COLUMNS, kelly_fractions, group_codes, apply_exposure_limit
+from src.scraper.names import CANONICAL_COLUMNS, key_columns
+
+RESULT_COLUMN = "result"
+SNAPSHOT_COLUMNS = list(dict.fromkeys(BET_KEY_COLUMNS + EVENT_COLUMNS)) + list(CANONICAL_COLUMNS.values()) + [
+    "odds", "value", "probability", RESULT_COLUMN,
+]
+# A simulated outcome is shared by every bookmaker offering it
+OUTCOME_KEY_COLUMNS = [column for column in BET_KEY_COLUMNS if column != "bookmaker"]
+
+PARAMETER_COLUMNS = ["min_value", "min_probability", "kelly_fraction"]
+RESULT_COLUMNS = PARAMETER_COLUMNS + [
+    "bets", "known", "wins", "hit_rate", "staked", "profit", "roi", "final_bankroll", "max_drawdown",
+]
+
+# Measured cost model of a sweep: one (bet, strategy) evaluation, starting a worker
+# (mostly importing pandas) and sending it one bet of the history
+EVALUATION_SECONDS = 60e-9
+WORKER_STARTUP_SECONDS = 0.5
+TRANSFER_SECONDS_PER_BET = 2e-7
+
+History = Dict[str, np.ndarray]
+
+# History of the worker processes, set once by _init_worker
+_history: Optional[History] = None
+
+
+def parameter_grid(
+    min_values: List[float] = BACKTEST_MIN_VALUES,
+    min_probabilities: List[float] = BACKTEST_MIN_PROBABILITIES,
+    kelly_fractions: List[float] = BACKTEST_KELLY_FRACTIONS,
+) -> List[Dict[str, float]]:
+    """Return every combination of the swept parameters."""
+    return [
+        dict(zip(PARAMETER_COLUMNS, combination))
+        for combination in itertools.product(min_values, min_probabilities, kelly_fractions)
+    ]
+
+
+def _key_uniforms(keys: pd.Index, seed: int) -> np.ndarray:
+    """Return a uniform draw in [0, 1) per key, depending only on the key and the seed."""
+    hashes = pd.util.hash_array(keys.to_numpy(dtype=object), hash_key=f"{seed:016d}"[-16:])
+    # The top 53 bits fill the mantissa of a double
+    return (hashes >> np.uint64(11)).astype(float) / 2.0 ** 53
+
+
+def use_pool(bets: int, strategies: int, workers: int) -> bool:
+    """Return whether a process pool finishes a sweep sooner than evaluating it serially.
+
+    Workers start in parallel, so the pool saves (1 - 1/workers) of the serial time
+    and costs about one worker startup plus the transfer of the history.
+    """
+    if workers <= 1:
+        return False
+    serial = bets * strategies * EVALUATION_SECONDS
+    overhead = WORKER_STARTUP_SECONDS + bets * TRANSFER_SECONDS_PER_BET
+    return serial * (1 - 1 / workers) > overhead
+
+
+def _outcomes(df: pd.DataFrame, result: pd.Series, seed: int) -> np.ndarray:
+    """Return whether each bet won, simulating unknown results once per match, market and outcome."""
+    probability = pd.to_numeric(df["probability"], errors="coerce").fillna(0).to_numpy() / 100
+    won = _key_uniforms(bet_keys(df, key_columns(df, OUTCOME_KEY_COLUMNS)), seed) < probability
+
+    result = pd.to_numeric(result, errors="coerce").to_numpy()
+    known = ~np.isnan(result)
+    won[known] = result[known] == 1
+    return won
+
+
+def load_history(seed: int = BACKTEST_SEED, directory: Optional[str] = None) -> Optional[History]:
+    """Load every stored snapshot into flat arrays, one row per bet (None if there is none).
+
+    Arrays: ``run`` (run index, chronological), ``odds``, ``value``, ``probability``,
+    ``kelly`` (full Kelly fraction), ``won``, ``known`` (settled by a known result), ``event`` and ``bookmaker`` (group codes
+    unique across runs), and ``run_ids``.
+    """
+    frames = []
+    run_ids = []
+    for run_id, path in list_snapshots(directory):
+        try:
+            df = load_snapshot(path, SNAPSHOT_COLUMNS)
+        except Exception as e:
+            logger.warning(f"Skipping unreadable snapshot {path}: {e}")
+            continue
+        if df.empty:
+            continue
+        df["run"] = len(run_ids)
+        frames.append(df)
+        run_ids.append(run_id)
+
+    if not frames:
+        return None
+
+    df = pd.concat(frames, ignore_index=True)
+    sightings = len(df)
+    keys = bet_keys(df)
+    # A result may only be known by a later sighting of the bet
+    if RESULT_COLUMN in df.columns:
+        result = df[RESULT_COLUMN].groupby(keys, sort=False).transform("last")
+    else:
+        result = pd.Series(np.nan, index=df.index)
+    first = ~keys.duplicated(keep="first")
+    df, result = df[first].reset_index(drop=True), result[first].reset_index(drop=True)
+    df["won"] = _outcomes(df, result, seed)
+
+    odds = pd.to_numeric(df["odds"], errors="coerce").to_numpy(dtype=float)
+    probability = pd.to_numeric(df["probability"], errors="coerce").to_numpy(dtype=float)
+
+    history = {
+        "run": df["run"].to_numpy(),
+        "odds": odds,
+        "value": pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=float),
+        "probability": probability,
+        "kelly": kelly_fractions(odds, probability),
+        "won": df["won"].to_numpy(dtype=bool),
+        "known": result.notna().to_numpy(),
+        "event": group_codes(df, key_columns(df, EVENT_COLUMNS) + ["run"]),
+        "bookmaker": group_codes(df, ["bookmaker", "run"]),
+        "run_ids": np.array(run_ids),
+    }
+    known = int(result.notna().sum())
+    logger.info(
+        f"Loaded {len(df)} bets ({sightings} sightings) from {len(run_ids)} snapshots ({known} with a known result)"
+    )
+    return history
+
+
+def evaluate_strategy(
+    history: History,
+    min_value: float,
+    min_probability: float,
+    kelly_fraction: float,
+    bankroll: float = BANKROLL,
+    max_stake_fraction: Optional[float] = MAX_STAKE_FRACTION,
+    max_event_exposure: Optional[float] = MAX_EVENT_EXPOSURE,
+    max_bookmaker_exposure: Optional[float] = MAX_BOOKMAKER_EXPOSURE,
+) -> Dict[str, float]:
+    """Replay one strategy over every run and return its performance.
+
+    Stakes follow the live staking rules (capped fractional Kelly, per-event and
+    per-bookmaker exposure limits), as fractions of the bankroll at the start of
+    each run; a run never stakes more than the whole bankroll. ``known`` counts the
+    placed bets settled by a known result rather than a simulated one.
+    """
+    runs = history["run"]
+    run_count = len(history["run_ids"])
+
+    selected = (history["value"] >= min_value) & (history["probability"] >= min_probability)
+    fractions = np.where(selected, kelly_fraction * history["kelly"], 0.0)
+    if max_stake_fraction is not None:
+        fractions = np.minimum(fractions, max_stake_fraction)
+    if max_event_exposure is not None:
+        fractions = apply_exposure_limit(fractions, history["event"], max_event_exposure)
+    if max_bookmaker_exposure is not None:
+        fractions = apply_exposure_limit(fractions, history["bookmaker"], max_bookmaker_exposure)
+    fractions = apply_exposure_limit(fractions, runs, 1.0)
+
+    won = history["won"]
+    returns = fractions * np.where(won, history["odds"] - 1, -1.0)
+    run_returns = np.bincount(runs, weights=returns, minlength=run_count)
+    run_stakes = np.bincount(runs, weights=fractions, minlength=run_count)
+
+    curve = bankroll * np.cumprod(1 + run_returns)
+    start = np.concatenate(([bankroll], curve[:-1]))
+    peak = np.maximum.accumulate(np.concatenate(([bankroll], curve)))[1:]
+
+    placed = fractions > 0
+    bets = int(placed.sum())
+    wins = int((placed & won).sum())
+    known = int((placed & history["known"]).sum())
+    staked = float((run_stakes * start).sum())
+    profit = float(curve[-1] - bankroll)
+
+    return {
+        "min_value": min_value,
+        "min_probability": min_probability,
+        "kelly_fraction": kelly_fraction,
+        "bets": bets,
+        "known": known,
+        "wins": wins,
+        "hit_rate": wins / bets * 100 if bets else 0.0,
+        "staked": round(staked, 2),
+        "profit": round(profit, 2),
+        "roi": profit / staked * 100 if staked > 0 else 0.0,
+        "final_bankroll": round(float(curve[-1]), 2),
+        "max_drawdown": float(((peak - curve) / peak).max() * 100),
+    }
+
+
+def _init_worker(history: History) -> None:
+    """Keep the history in the worker, so it's only sent once per process."""
+    global _history
+    _history = history
+
+
+def _evaluate_chunk(parameters: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    """Evaluate a chunk of the grid in a worker process."""
+    return [evaluate_strategy(_history, **params) for params in parameters]
+
+
+def run_sweep(
+    grid: Optional[List[Dict[str, float]]] = None,
+    history: Optional[History] = None,
+    workers: Optional[int] = BACKTEST_WORKERS,
+) -> pd.DataFrame:
+    """Evaluate every strategy of the grid, in parallel, and return one row per strategy."""
+    grid = grid if grid is not None else parameter_grid()
+    history = history if history is not None else load_history()
+    if history is None or not grid:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    workers = min(workers or os.cpu_count() or 1, len(grid))
+    logger.info(f"Backtesting {len(grid)} strategies over {len(history['run_ids'])} runs")
+
+    if not use_pool(len(history["run"]), len(grid), workers):
+        results = [evaluate_strategy(history, **params) for params in grid]
+    else:
+        # A few chunks per worker keeps them busy without a round trip per strategy
+        chunk_size = max(1, len(grid) // (workers * 4))
+        chunks = [grid[i:i + chunk_size] for i in range(0, len(grid), chunk_size)]
+        # Spawned workers are safe to start from the multi-threaded GUI
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(history,)) as executor:
+            results = [result for chunk in executor.map(_evaluate_chunk, chunks) for result in chunk]
+
+    return pd.DataFrame(results, columns=RESULT_COLUMNS)
+
+
+def backtest_path() -> str:
+    """Return the path of the backtest results file."""
+    return os.path.join(DATA_PATH, BACKTEST_FILE)
+
+
+def export_backtest(results: pd.DataFrame, path: Optional[str] = None) -> str:
+    """Write sweep results, best ROI first, and return the path."""
+    path = path or backtest_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    results.sort_values("roi", ascending=False).to_csv(path, index=False)
+    logger.info(f"Backtest results exported to {path}")
+    return path
+
+
+def load_backtest(path: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """Load the exported results of the last sweep, if any."""
+    path = path or backtest_path()
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path)
+
+
+def main() -> int:
+    """Run the configured sweep over all snapshots and export the results."""
+    setup_logging()
+    results = run_sweep()
+    if results.empty:
+        print("No stored snapshots to backtest. Run scraping first.")
+        return 1
+
+    export_backtest(results)
+    columns = ["min_value", "min_probability", "kelly_fraction", "bets", "roi", "max_drawdown"]
+    print(results.sort_values("roi", ascending=False)[columns].head(10).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
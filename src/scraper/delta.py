@@ -0,0 +1,97 @@
+"""
+Snapshot deltas for live refresh.
+
+A bet is identified by its match, market, outcome and bookmaker. Comparing two
+snapshots on that key gives the bets that were added, removed or changed, and
+merging a new snapshot keeps the position of every bet that is still there so
+the GUI only redraws what changed.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.scraper.names import key_columns
+
+BET_KEY_COLUMNS = ["sports", "countries", "leagues", "team_1", "team_2", "pronos", "outcome", "bookmaker"]
+
+# Columns whose modification makes a bet "changed"
+TRACKED_COLUMNS = ["date", "time", "odds", "value", "probability"]
+
+
+def bet_keys(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.Index:
+    """Return the identity key of every bet of a snapshot.
+
+    Team and league names are replaced by their canonical IDs when the frame has them.
+    """
+    columns = columns or key_columns(df, BET_KEY_COLUMNS)
+    values = [df[column].astype(str) for column in columns]
+    return pd.Index(values[0].str.cat(values[1:], sep="|").to_numpy())
+
+
+def _keyed(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Index a snapshot by bet key, keeping the first row of duplicated keys."""
+    keyed = df.set_axis(bet_keys(df, columns))
+    return keyed[~keyed.index.duplicated(keep="first")]
+
+
+def diff_snapshots(old: pd.DataFrame, new: pd.DataFrame) -> Dict[str, pd.Index]:
+    """Return the keys of the bets added, removed and changed between two snapshots."""
+    columns = key_columns(old, BET_KEY_COLUMNS, new)
+    old_keyed, new_keyed = _keyed(old, columns), _keyed(new, columns)
+
+    common = new_keyed.index.intersection(old_keyed.index)
+    old_values = old_keyed.loc[common, TRACKED_COLUMNS].astype(str)
+    new_values = new_keyed.loc[common, TRACKED_COLUMNS].astype(str)
+    changed = (old_values != new_values).any(axis=1).to_numpy()
+
+    return {
+        "added": new_keyed.index.difference(old_keyed.index, sort=False),
+        "removed": old_keyed.index.difference(new_keyed.index, sort=False),
+        "changed": common[changed],
+    }
+
+
+def merge_snapshot(old: pd.DataFrame, new: pd.DataFrame):
+    """Merge a new snapshot into the current one, keeping the order of surviving bets.
+
+    Removed bets are dropped, changed bets are replaced in place by their new row and
+    added bets are appended at the end.
+
+    Returns:
+        Tuple ``(merged, info)`` where ``info`` holds ``delta`` (see diff_snapshots),
+        ``old_positions`` (position of each merged row in ``old``, -1 if added),
+        ``changed`` (boolean array) and ``odds_change`` (new - old odds, NaN if unchanged).
+    """
+    delta = diff_snapshots(old, new)
+    columns = key_columns(old, BET_KEY_COLUMNS, new)
+    old_keyed, new_keyed = _keyed(old, columns), _keyed(new, columns)
+
+    kept_keys = old_keyed.index[~old_keyed.index.isin(delta["removed"])]
+    changed_keys = delta["changed"]
+    previous_odds = pd.to_numeric(old_keyed.loc[changed_keys, "odds"], errors="coerce")
+
+    # A changed bet takes its whole new row (kickoff, pricing, logo...), only its position is kept
+    unchanged = old_keyed.loc[kept_keys.difference(changed_keys, sort=False)]
+    updated = new_keyed.loc[changed_keys.append(delta["added"])]
+    merged = pd.concat([unchanged, updated]).loc[kept_keys.append(delta["added"])]
+
+    # Position of each key in the original (not deduplicated) frame
+    old_positions = pd.Series(np.arange(len(old)), index=bet_keys(old, columns))
+    old_positions = old_positions[~old_positions.index.duplicated(keep="first")]
+    positions = old_positions.reindex(merged.index).fillna(-1).astype(int).to_numpy()
+
+    changed = merged.index.isin(changed_keys)
+    odds_change = np.full(len(merged), np.nan)
+    odds_change[changed] = (
+        pd.to_numeric(merged.loc[changed_keys, "odds"], errors="coerce") - previous_odds
+    ).reindex(merged.index[changed]).to_numpy()
+
+    info = {
+        "delta": delta,
+        "old_positions": positions,
+        "changed": changed,
+        "odds_change": odds_change,
+    }
+    return merged.reset_index(drop=True), info
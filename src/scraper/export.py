@@ -0,0 +1,136 @@
+"""
+Crash-safe export of the latest scrape, with versioned generations.
+
+Each export is a new generation: the CSV is written to a temporary file, fsynced
+and atomically renamed, so a reader never sees a truncated file. The last
+EXPORT_GENERATIONS exports are kept as immutable files under data/generations/,
+and data.csv is atomically replaced by the newest one for existing readers.
+
+A small manifest (manifest.json, also replaced atomically) records the generation
+number, row count, SHA-256 checksum and timestamps of every kept generation.
+Readers compare the generation of the manifest with the one they loaded to decide
+whether to reload, and read the immutable generation file it names.
+"""
+
+import hashlib
+import io
+import json
+import os
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import DATA_PATH, EXPORT_GENERATIONS, GENERATIONS_DIRECTORY, MANIFEST_FILE
+
+
+def fsync_directory(directory: str) -> None:
+    """Persist a rename in a directory (not supported, nor needed, on Windows)."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: str, write: Callable) -> None:
+    """Write a file through a temporary file, fsynced then renamed over the target."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    fsync_directory(directory)
+
+
+def manifest_path(directory: Optional[str] = None) -> str:
+    """Return the path of the export manifest."""
+    return os.path.join(directory or DATA_PATH, MANIFEST_FILE)
+
+
+def read_manifest(directory: Optional[str] = None) -> Optional[dict]:
+    """Return the export manifest, or None if nothing was exported with it yet."""
+    try:
+        with open(manifest_path(directory), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def generation_path(file_name: str, generation: int, directory: Optional[str] = None) -> str:
+    """Return the path of the immutable file of one generation ("data.000042.csv")."""
+    stem, extension = os.path.splitext(file_name)
+    return os.path.join(directory or DATA_PATH, GENERATIONS_DIRECTORY, f"{stem}.{generation:06d}{extension}")
+
+
+def export_snapshot(
+    df: pd.DataFrame,
+    file_name: str = "data.csv",
+    scraped_at: Optional[datetime] = None,
+    directory: Optional[str] = None,
+    keep: int = EXPORT_GENERATIONS,
+) -> dict:
+    """Export a scrape as a new generation and return its manifest entry."""
+    directory = directory or DATA_PATH
+    manifest = read_manifest(directory) or {"generation": 0, "generations": []}
+    generation = manifest["generation"] + 1
+
+    content = df.to_csv(index=False).encode("utf-8")
+    entry = {
+        "name": file_name,
+        "generation": generation,
+        "file": os.path.relpath(generation_path(file_name, generation, directory), directory),
+        "rows": len(df),
+        "bytes": len(content),
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "scraped_at": (scraped_at or datetime.now()).astimezone().isoformat(),
+        "written_at": datetime.now().astimezone().isoformat(),
+    }
+
+    write_atomic(os.path.join(directory, entry["file"]), lambda f: f.write(content))
+    write_atomic(os.path.join(directory, file_name), lambda f: f.write(content))
+
+    # The manifest is replaced last, so it never names a file that isn't complete
+    kept = [entry] + manifest["generations"][:max(keep - 1, 0)]
+    new_manifest = dict(entry, generations=kept)
+    write_atomic(
+        manifest_path(directory),
+        lambda f: f.write(json.dumps(new_manifest, indent=1).encode("utf-8")),
+    )
+
+    for old in manifest["generations"][max(keep - 1, 0):]:
+        try:
+            os.remove(os.path.join(directory, old["file"]))
+        except OSError:
+            pass
+
+    logger.info(f"Generation {generation} exported: {len(df)} rows to {os.path.join(directory, file_name)}")
+    return entry
+
+
+def load_export(directory: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], Optional[dict]]:
+    """Load the latest generation named by the manifest, checking its checksum.
+
+    Returns (None, None) when there is no manifest or its file is missing or
+    doesn't match, so callers can fall back to reading data.csv.
+    """
+    directory = directory or DATA_PATH
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None, None
+    try:
+        with open(os.path.join(directory, manifest["file"]), "rb") as f:
+            content = f.read()
+    except OSError as e:
+        logger.warning(f"Generation {manifest['generation']} unreadable: {e}")
+        return None, None
+    if hashlib.sha256(content).hexdigest() != manifest["sha256"]:
+        logger.warning(f"Generation {manifest['generation']} doesn't match its checksum")
+        return None, None
+    return pd.read_csv(io.BytesIO(content)), manifest
@@ -0,0 +1,129 @@
+"""
+Indexed filtering of the value bets, shared by the card view and the local API.
+
+The index is built once per data version: every categorical column gets a map of
+value -> row positions and every numeric column gets a sorted array, so a filter
+change only combines precomputed masks and binary searches instead of rescanning
+the DataFrame.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.scraper.kickoff import kickoff_series, kickoff_values, local_timezone
+
+# Filter name -> DataFrame column
+CATEGORY_COLUMNS = {
+    "sport": "sports",
+    "country": "countries",
+    "league": "leagues",
+    "bookmaker": "bookmaker",
+    "market": "pronos",
+}
+
+NUMERIC_COLUMNS = {
+    "value": "value",
+    "probability": "probability",
+    "odds": "odds",
+    "edge": "model_value",
+}
+
+ALL_OPTION = "All"
+
+
+class FilterIndex:
+    """Precomputed category bitmaps and sorted numeric arrays for a DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.size = len(df)
+        self._positions: Dict[str, Dict[str, np.ndarray]] = {}
+        self._masks: Dict[Tuple[str, str], np.ndarray] = {}
+        self._sorted: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        for name, column in CATEGORY_COLUMNS.items():
+            if column in df.columns:
+                groups = df.groupby(column, sort=True).indices
+                self._positions[name] = {str(key): positions for key, positions in groups.items()}
+            else:
+                self._positions[name] = {}
+
+        for name, column in NUMERIC_COLUMNS.items():
+            if column in df.columns:
+                values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+                self._add_sorted(name, values)
+
+        if "kickoff" in df.columns or ("date" in df.columns and "time" in df.columns):
+            self._add_sorted("kickoff", kickoff_values(kickoff_series(df)))
+
+    def _add_sorted(self, name: str, values: np.ndarray) -> None:
+        """Store the stable ascending order of a numeric column (NaN last)."""
+        order = np.argsort(values, kind="stable")
+        self._sorted[name] = (values[order], order)
+
+    def options(self, name: str) -> List[str]:
+        """Return the sorted distinct values available for a category filter."""
+        return list(self._positions.get(name, {}).keys())
+
+    def category_mask(self, name: str, value: str) -> np.ndarray:
+        """Return the (cached) boolean mask of rows whose category equals value."""
+        key = (name, value)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.zeros(self.size, dtype=bool)
+            positions = self._positions.get(name, {}).get(value)
+            if positions is not None:
+                mask[positions] = True
+            self._masks[key] = mask
+        return mask
+
+    def range_mask(self, name: str, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Return the mask of rows with low <= column <= high using binary search."""
+        mask = np.zeros(self.size, dtype=bool)
+        if name not in self._sorted:
+            return mask
+
+        sorted_values, order = self._sorted[name]
+        # NaN values sort last, so the searchable range stops before them
+        valid = len(sorted_values) - int(np.isnan(sorted_values).sum())
+        start = 0 if low is None else int(np.searchsorted(sorted_values[:valid], low, side="left"))
+        stop = valid if high is None else int(np.searchsorted(sorted_values[:valid], high, side="right"))
+        mask[order[start:stop]] = True
+        return mask
+
+    def select(self, filters: dict, now: Optional[datetime] = None) -> np.ndarray:
+        """Return the row positions matching all active filters, in frame order.
+
+        Args:
+            filters: Mapping with optional keys ``sport``, ``country``, ``league``,
+                ``bookmaker``, ``market`` (exact values), ``min_value``,
+                ``min_probability``, ``min_edge``, ``min_odds``, ``max_odds`` (floats) and
+                ``kickoff_hours`` (only matches starting within that many hours).
+            now: Reference time for the kickoff window, defaults to the current time.
+        """
+        mask = np.ones(self.size, dtype=bool)
+
+        for name in CATEGORY_COLUMNS:
+            value = filters.get(name)
+            if value and value != ALL_OPTION:
+                mask &= self.category_mask(name, value)
+
+        if filters.get("min_value") is not None:
+            mask &= self.range_mask("value", low=filters["min_value"])
+        if filters.get("min_probability") is not None:
+            mask &= self.range_mask("probability", low=filters["min_probability"])
+        if filters.get("min_edge") is not None:
+            mask &= self.range_mask("edge", low=filters["min_edge"])
+        if filters.get("min_odds") is not None or filters.get("max_odds") is not None:
+            mask &= self.range_mask("odds", low=filters.get("min_odds"), high=filters.get("max_odds"))
+
+        if filters.get("kickoff_hours") is not None:
+            start = pd.Timestamp(now or datetime.now().astimezone())
+            if start.tzinfo is None:
+                start = start.tz_localize(local_timezone())
+            end = start + timedelta(hours=filters["kickoff_hours"])
+            mask &= self.range_mask("kickoff", low=float(start.value), high=float(end.value))
+
+        return np.flatnonzero(mask)
@@ -0,0 +1,73 @@
+"""
+Grouping of the same bet offered by several bookmakers.
+
+Rows of the same event, market and outcome are clustered on a 64-bit hash of
+their key columns, then the best odds, the spread between bookmakers and the
+number of bookmakers are computed for every group in a single groupby pass.
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.scraper.names import key_columns
+
+EVENT_COLUMNS = ["sports", "countries", "leagues", "team_1", "team_2", "date", "time"]
+MARKET_COLUMNS = ["pronos", "outcome"]
+
+GROUP_COLUMNS = ["group_id", "best_odds", "odds_spread", "bookmaker_count", "is_best_price"]
+
+
+def group_hashes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Return a 64-bit hash of the given key columns for every row."""
+    # Text form, so dates hash the same whether parsed or read back from the CSV
+    hashes = pd.util.hash_pandas_object(df[columns].astype(str), index=False)
+    return hashes.to_numpy().view(np.int64)
+
+
+def bet_groups(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the group columns of every row (aligned on df).
+
+    Columns:
+        group_id: hash of the event, market and outcome.
+        best_odds: highest odds of the group.
+        odds_spread: highest minus lowest odds of the group.
+        bookmaker_count: number of rows (bookmakers) of the group.
+        is_best_price: whether the row offers the best odds of its group.
+    """
+    group_ids = group_hashes(df, key_columns(df, EVENT_COLUMNS + MARKET_COLUMNS))
+    codes, _ = pd.factorize(group_ids)
+    odds = pd.to_numeric(df["odds"], errors="coerce").to_numpy(dtype=float)
+
+    stats = pd.Series(odds).groupby(codes).agg(["max", "min", "size"]).to_numpy()
+    best_odds = stats[codes, 0]
+
+    return pd.DataFrame({
+        "group_id": group_ids,
+        "best_odds": best_odds,
+        "odds_spread": best_odds - stats[codes, 1],
+        "bookmaker_count": stats[codes, 2].astype(int),
+        "is_best_price": odds >= best_odds,
+    }, index=df.index)
+
+
+def add_group_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the frame with the columns of bet_groups added (or replaced)."""
+    groups = bet_groups(df)
+    return df.drop(columns=groups.columns, errors="ignore").join(groups)
+
+
+def best_price_positions(positions: np.ndarray, group_ids: np.ndarray, odds: np.ndarray) -> np.ndarray:
+    """Keep one position per group among the given ones: the one with the best odds.
+
+    Ties keep the first position, and the result is in ascending position order.
+    """
+    positions = np.asarray(positions)
+    if not len(positions):
+        return positions
+    # Sorted by group, then by decreasing odds (NaN last); lexsort is stable
+    order = positions[np.lexsort((np.nan_to_num(-odds[positions], nan=np.inf), group_ids[positions]))]
+    groups = group_ids[order]
+    first = np.concatenate(([True], groups[1:] != groups[:-1]))
+    return np.sort(order[first])
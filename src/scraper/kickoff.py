@@ -0,0 +1,132 @@
+"""
+Canonical kickoff timestamps and a sorted time-window index.
+
+The site shows a day ("Today", "Tomorr." or "12 May") and a time in the local
+timezone. They are combined once into a timezone-aware UTC ``kickoff`` column:
+the year is inferred from the scrape date, so a January fixture scraped in
+December lands in the next year. KickoffIndex keeps the kickoffs sorted, so
+"starting within N hours" is two binary searches.
+"""
+
+import os
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import TIMEZONE
+
+# Fixture dates further than this in the past are taken as next year's
+YEAR_ROLLOVER_DAYS = 180
+
+
+@lru_cache(maxsize=None)
+def local_timezone() -> tzinfo:
+    """Return the timezone of the times shown by the site: TIMEZONE, or the system's.
+
+    The system timezone is resolved to its IANA zone (TZ, or the /etc/localtime
+    link) so DST changes and ambiguous times are handled. Where there is none
+    (Windows), dateutil's tzlocal asks the system for the offset of every
+    timestamp. A fixed UTC offset would be wrong on the other side of a DST change.
+    """
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    if TIMEZONE:
+        return ZoneInfo(TIMEZONE)
+    names = [os.environ.get("TZ", "").lstrip(":")]
+    link = os.path.realpath("/etc/localtime")
+    if "zoneinfo" + os.sep in link:
+        names.append(link.split("zoneinfo" + os.sep, 1)[1])
+    for name in filter(None, names):
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            continue
+    from dateutil.tz import tzlocal
+
+    return tzlocal()
+
+
+def localize(values: pd.Series, tz: Optional[tzinfo] = None) -> pd.Series:
+    """Attach a timezone (default: local_timezone) to naive datetimes and convert them to UTC.
+
+    A wall time repeated by a DST change is taken in standard time, one skipped
+    by it is shifted forward.
+    """
+    ambiguous = np.zeros(len(values), dtype=bool)
+    localized = values.dt.tz_localize(tz or local_timezone(), ambiguous=ambiguous, nonexistent="shift_forward")
+    return localized.dt.tz_convert("UTC")
+
+
+def infer_dates(day_month: pd.Series, today: Optional[datetime] = None) -> pd.Series:
+    """Parse "12 May" style dates, rolling over to next year when needed.
+
+    An aware ``today`` is taken as its wall-clock date in its own timezone.
+    """
+    today = pd.Timestamp(today or datetime.now(local_timezone()))
+    today = (today.tz_localize(None) if today.tzinfo is not None else today).normalize()
+    dates = pd.to_datetime(day_month + f" {today.year}", format="%d %b %Y", errors="coerce")
+    rollover = dates < today - timedelta(days=YEAR_ROLLOVER_DAYS)
+    return dates.where(~rollover, dates + pd.DateOffset(years=1))
+
+
+def combine_kickoff(dates: pd.Series, times: pd.Series, tz: Optional[tzinfo] = None) -> pd.Series:
+    """Combine local dates and "HH:MM" times into UTC kickoff timestamps."""
+    local = pd.to_datetime(
+        dates.astype(str).str.slice(0, 10) + " " + times.astype(str),
+        format="%Y-%m-%d %H:%M",
+        errors="coerce",
+    )
+    return localize(local, tz)
+
+
+def kickoff_series(df: pd.DataFrame) -> pd.Series:
+    """Return the UTC kickoff of every row, from the kickoff column or date and time."""
+    if "kickoff" in df.columns:
+        kickoff = df["kickoff"]
+        if isinstance(kickoff.dtype, pd.DatetimeTZDtype):
+            return kickoff.dt.tz_convert("UTC")
+        # Read back from a CSV as text
+        return pd.to_datetime(kickoff, errors="coerce", utc=True)
+    return combine_kickoff(df["date"], df["time"])
+
+
+def ensure_kickoff(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the frame with a parsed, timezone-aware kickoff column."""
+    if "kickoff" in df.columns and isinstance(df["kickoff"].dtype, pd.DatetimeTZDtype):
+        return df
+    return df.assign(kickoff=kickoff_series(df))
+
+
+def kickoff_values(kickoff: pd.Series) -> np.ndarray:
+    """Return kickoffs as float UTC nanoseconds, NaN when unknown (for sorting and searching)."""
+    values = kickoff.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+    values = values.astype(np.int64).astype(float)
+    values[kickoff.isna().to_numpy()] = np.nan
+    return values
+
+
+class KickoffIndex:
+    """Kickoff timestamps sorted once, queried by binary search."""
+
+    def __init__(self, kickoff: pd.Series):
+        values = kickoff_values(kickoff)
+        self.order = np.argsort(values, kind="stable")
+        sorted_values = values[self.order]
+        # Unknown kickoffs sort last and are never returned
+        self.sorted_values = sorted_values[:len(sorted_values) - int(np.isnan(sorted_values).sum())]
+
+    def between(self, start: pd.Timestamp, end: pd.Timestamp) -> np.ndarray:
+        """Return the positions (in ascending position order) of kickoffs in [start, end]."""
+        low = np.searchsorted(self.sorted_values, float(pd.Timestamp(start).value), side="left")
+        high = np.searchsorted(self.sorted_values, float(pd.Timestamp(end).value), side="right")
+        return np.sort(self.order[low:high])
+
+    def within(self, hours: float, now: Optional[datetime] = None) -> np.ndarray:
+        """Return the positions of the matches starting in the next given hours."""
+        start = pd.Timestamp(now) if now is not None else pd.Timestamp.now(tz="UTC")
+        if start.tzinfo is None:
+            start = start.tz_localize(local_timezone())
+        return self.between(start, start + timedelta(hours=hours))
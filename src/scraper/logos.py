@@ -0,0 +1,107 @@
+"""
+Content-addressed on-disk cache of bookmaker logos.
+
+Logos are fetched once per URL and stored under their SHA-256, so identical images
+served from different URLs share one file. An index maps each known URL to its
+file, which means a scrape only downloads logos it has never seen.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import urllib.request
+from typing import Dict, Iterable, Optional
+
+from loguru import logger
+
+from src.config.settings import DATA_PATH, REQUEST_TIMEOUT, USER_AGENT
+
+LOGOS_DIR = os.path.join(DATA_PATH, "logos")
+INDEX_PATH = os.path.join(LOGOS_DIR, "index.json")
+
+EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/svg+xml": ".svg",
+}
+
+
+def _load_index() -> Dict[str, str]:
+    """Return the URL -> file name index."""
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(index: Dict[str, str]) -> None:
+    """Write the index atomically."""
+    tmp_path = INDEX_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, INDEX_PATH)
+
+
+def _fetch(url: str):
+    """Return the (bytes, content type) of a logo URL, data: URIs included."""
+    if url.startswith("data:"):
+        header, _, payload = url.partition(",")
+        content_type = header[5:].split(";")[0]
+        data = base64.b64decode(payload) if ";base64" in header else payload.encode()
+        return data, content_type
+
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+        return response.read(), response.headers.get_content_type()
+
+
+def store_logo(data: bytes, content_type: str = "image/png") -> str:
+    """Store logo bytes under their content hash and return the file name."""
+    extension = EXTENSIONS.get(content_type, ".img")
+    file_name = hashlib.sha256(data).hexdigest() + extension
+    path = os.path.join(LOGOS_DIR, file_name)
+    if not os.path.exists(path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return file_name
+
+
+def cache_logos(urls: Iterable[str]) -> Dict[str, str]:
+    """Make sure every logo URL is cached and return the URL -> file name mapping."""
+    os.makedirs(LOGOS_DIR, exist_ok=True)
+    index = _load_index()
+    mapping = {}
+    new_entries = 0
+
+    for url in set(urls):
+        if not isinstance(url, str) or not url:
+            continue
+        file_name = index.get(url)
+        if file_name is None or not os.path.exists(os.path.join(LOGOS_DIR, file_name)):
+            try:
+                file_name = store_logo(*_fetch(url))
+            except Exception as e:
+                logger.warning(f"Failed to cache logo {url[:80]}: {e}")
+                continue
+            index[url] = file_name
+            new_entries += 1
+        mapping[url] = file_name
+
+    if new_entries:
+        _save_index(index)
+        logger.info(f"Cached {new_entries} new bookmaker logos")
+    return mapping
+
+
+def logo_path(file_name: Optional[str]) -> Optional[str]:
+    """Return the path of a cached logo file, or None if it isn't cached."""
+    if not isinstance(file_name, str) or not file_name:
+        return None
+    path = os.path.join(LOGOS_DIR, file_name)
+    return path if os.path.exists(path) else None
@@ -0,0 +1,208 @@
+"""
+Odds movement tracking and closing-line value per bet.
+
+Every observed odds change of a bet (same key as the snapshot deltas) is appended
+to a binary tick log of fixed-size records, so the full time series costs 16 bytes
+per change. A small summary of the bets still open (opening, previous and latest
+odds) is all a run has to read: updating it only touches the bets of the run and
+appends ticks for the new and changed ones.
+
+Once a bet's kickoff has passed, its last observed odds are its closing line: the
+bet moves to an append-only file of closed bets with its closing-line value
+(opening odds / closing odds - 1).
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import DATA_PATH, MOVEMENTS_DIRECTORY
+from src.scraper.delta import bet_keys
+from src.scraper.kickoff import kickoff_series, localize
+
+MOVEMENTS_DIR = os.path.join(DATA_PATH, MOVEMENTS_DIRECTORY)
+
+# One record per odds change: 4 + 8 + 4 bytes
+TICK_DTYPE = np.dtype([("bet_id", "<i4"), ("observed_at", "<i8"), ("odds", "<f4")])
+
+SUMMARY_COLUMNS = [
+    "bet_id", "kickoff", "opening_odds", "opening_at", "previous_odds", "previous_at",
+    "latest_odds", "latest_at", "changes",
+]
+
+# Columns added to a scraped frame by MovementTracker.update
+MOVEMENT_COLUMNS = ["opening_odds", "odds_movement", "odds_velocity"]
+
+
+def to_seconds(values) -> np.ndarray:
+    """Return datetimes as epoch seconds (float, NaN for missing values).
+
+    Naive datetimes are taken as local time.
+    """
+    values = pd.to_datetime(pd.Series(values), errors="coerce")
+    values = localize(values) if values.dt.tz is None else values.dt.tz_convert("UTC")
+    values = values.dt.tz_localize(None)
+    seconds = values.to_numpy(dtype="datetime64[s]").astype("int64").astype(float)
+    seconds[values.isna().to_numpy()] = np.nan
+    return seconds
+
+
+def kickoff_seconds(df: pd.DataFrame) -> np.ndarray:
+    """Return the kickoff of every bet as epoch seconds."""
+    return to_seconds(kickoff_series(df))
+
+
+def movement_metrics(summary: pd.DataFrame) -> pd.DataFrame:
+    """Compute the movement columns of summary rows.
+
+    odds_movement is the change since the opening odds (ratio, +0.05 = 5% longer),
+    odds_velocity the odds change per hour over the last move (NaN before any move).
+    """
+    hours = (summary["latest_at"] - summary["previous_at"]) / 3600
+    return pd.DataFrame({
+        "opening_odds": summary["opening_odds"],
+        "odds_movement": summary["latest_odds"] / summary["opening_odds"] - 1,
+        "odds_velocity": (summary["latest_odds"] - summary["previous_odds"]) / hours.where(hours > 0),
+    }, index=summary.index)
+
+
+class MovementTracker:
+    """Append-only odds time series and summary of the open bets."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or MOVEMENTS_DIR
+        self.ticks_path = os.path.join(self.directory, "ticks.bin")
+        self.open_path = os.path.join(self.directory, "open.csv")
+        self.closed_path = os.path.join(self.directory, "closed.csv")
+        self.state_path = os.path.join(self.directory, "state.json")
+
+        try:
+            self.summary = pd.read_csv(self.open_path, index_col="key")
+        except (OSError, ValueError):
+            self.summary = pd.DataFrame(columns=SUMMARY_COLUMNS, dtype=float).rename_axis("key")
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                self.next_bet_id = json.load(f)["next_bet_id"]
+        except (OSError, ValueError, KeyError):
+            self.next_bet_id = 0
+
+    def update(self, df: pd.DataFrame, observed_at: Optional[datetime] = None) -> pd.DataFrame:
+        """Record the odds of a scrape and return its movement columns (aligned on df)."""
+        now = to_seconds([observed_at or datetime.now()])[0]
+        keys = bet_keys(df)
+        run = pd.DataFrame({
+            "odds": pd.to_numeric(df["odds"], errors="coerce").to_numpy(dtype=float),
+            "kickoff": kickoff_seconds(df),
+        }, index=keys)
+        run = run[~run.index.duplicated(keep="first") & run["odds"].notna().to_numpy()]
+
+        known = run.index.isin(self.summary.index)
+
+        # New bets open at their current odds
+        added = run[~known]
+        bet_ids = np.arange(self.next_bet_id, self.next_bet_id + len(added))
+        self.next_bet_id += len(added)
+        new_rows = pd.DataFrame({
+            "bet_id": bet_ids,
+            "kickoff": added["kickoff"],
+            "opening_odds": added["odds"],
+            "opening_at": now,
+            "previous_odds": np.nan,
+            "previous_at": np.nan,
+            "latest_odds": added["odds"],
+            "latest_at": now,
+            "changes": 0,
+        }, index=added.index)
+
+        # Known bets only change when their odds moved
+        seen = run[known]
+        latest = self.summary.loc[seen.index, "latest_odds"].to_numpy(dtype=float)
+        moved = seen.index[~np.isclose(seen["odds"].to_numpy(), latest)]
+        if len(moved):
+            rows = self.summary.loc[moved]
+            self.summary.loc[moved, "previous_odds"] = rows["latest_odds"]
+            self.summary.loc[moved, "previous_at"] = rows["latest_at"]
+            self.summary.loc[moved, "latest_odds"] = seen.loc[moved, "odds"]
+            self.summary.loc[moved, "latest_at"] = now
+            self.summary.loc[moved, "changes"] = rows["changes"] + 1
+        # Kickoff times can be rescheduled
+        self.summary.loc[seen.index, "kickoff"] = seen["kickoff"]
+
+        if len(new_rows):
+            self.summary = pd.concat([self.summary, new_rows]) if len(self.summary) else new_rows
+
+        ticked = self.summary.loc[new_rows.index.append(moved)]
+        self._append_ticks(ticked["bet_id"].to_numpy(), now, ticked["latest_odds"].to_numpy())
+
+        metrics = movement_metrics(self.summary.loc[run.index])
+        self._close_started_bets(now, run.index)
+        self._save()
+
+        logger.info(f"Odds movements: {len(new_rows)} new bets, {len(moved)} odds changes")
+        return metrics.reindex(keys).set_axis(df.index)
+
+    def _append_ticks(self, bet_ids: np.ndarray, observed_at: float, odds: np.ndarray) -> None:
+        """Append one tick per bet to the tick log."""
+        if not len(bet_ids):
+            return
+        ticks = np.empty(len(bet_ids), dtype=TICK_DTYPE)
+        ticks["bet_id"] = bet_ids
+        ticks["observed_at"] = int(observed_at)
+        ticks["odds"] = odds
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.ticks_path, "ab") as f:
+            f.write(ticks.tobytes())
+
+    def _close_started_bets(self, now: float, seen_keys: pd.Index) -> None:
+        """Move the bets whose kickoff passed to the closed file, with their CLV.
+
+        Bets without a known kickoff are closed as soon as they leave the scrape.
+        """
+        kickoff = self.summary["kickoff"]
+        closing = (kickoff <= now) | (kickoff.isna() & ~self.summary.index.isin(seen_keys))
+        if not closing.any():
+            return
+
+        closed = self.summary[closing].copy()
+        closed["closing_odds"] = closed["latest_odds"]
+        closed["clv"] = closed["opening_odds"] / closed["closing_odds"] - 1
+        os.makedirs(self.directory, exist_ok=True)
+        closed.rename_axis("key").to_csv(self.closed_path, mode="a", header=not os.path.exists(self.closed_path))
+        self.summary = self.summary[~closing]
+
+    def _save(self) -> None:
+        """Write the open bets summary and the id counter atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.open_path + ".tmp"
+        self.summary.rename_axis("key").to_csv(tmp_path)
+        os.replace(tmp_path, self.open_path)
+
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"next_bet_id": self.next_bet_id}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def load_ticks(self) -> np.ndarray:
+        """Return every recorded tick (structured array of TICK_DTYPE)."""
+        if not os.path.exists(self.ticks_path):
+            return np.empty(0, dtype=TICK_DTYPE)
+        return np.fromfile(self.ticks_path, dtype=TICK_DTYPE)
+
+    def odds_series(self, bet_id: int) -> pd.Series:
+        """Return the odds time series of one bet."""
+        ticks = self.load_ticks()
+        ticks = ticks[ticks["bet_id"] == bet_id]
+        return pd.Series(ticks["odds"].astype(float), index=pd.to_datetime(ticks["observed_at"], unit="s", utc=True))
+
+
+def load_closed(directory: Optional[str] = None) -> pd.DataFrame:
+    """Load the closed bets with their closing-line value (empty if none)."""
+    path = os.path.join(directory or MOVEMENTS_DIR, "closed.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["key"] + SUMMARY_COLUMNS + ["closing_odds", "clv"])
+    return pd.read_csv(path)
@@ -0,0 +1,161 @@
+"""
+Normalization of team and league names into stable canonical IDs.
+
+Names are first reduced to a normalized form (case, accents, punctuation,
+spacing and common abbreviations such as "Utd"). A persistent alias table maps
+every normalized name ever seen to its canonical name; a name that isn't in the
+table yet is fuzzy-matched once (difflib) against the canonical names of the
+same scope (teams per sport, leagues per sport and country) and recorded. The
+canonical name is then hashed into an ID column, so the delta, history and
+grouping stages join on exact keys.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import DATA_PATH, ALIASES_FILE, NAME_MATCH_CUTOFF
+
+# Token rewrites applied to normalized names
+ABBREVIATIONS = {
+    "utd": "united",
+    "st": "saint",
+    "intl": "international",
+    "univ": "university",
+}
+# Club prefixes and suffixes ignored when comparing names
+IGNORED_TOKENS = {"fc", "cf", "afc", "sc", "fk", "sk", "esports", "gaming", "team"}
+# Words up to this length (codes, ages) must match exactly
+SHORT_TOKEN_LENGTH = 4
+
+# Raw column -> canonical ID column
+CANONICAL_COLUMNS = {
+    "team_1": "team_1_id",
+    "team_2": "team_2_id",
+    "leagues": "league_id",
+}
+
+
+def normalize_name(name: str) -> str:
+    """Return the normalized form of a team or league name."""
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(char for char in text if not unicodedata.combining(char)).casefold()
+    tokens = re.sub(r"[^\w]+", " ", text).split()
+    tokens = [ABBREVIATIONS.get(token, token) for token in tokens]
+    kept = [token for token in tokens if token not in IGNORED_TOKENS]
+    # A name made only of ignored tokens ("Team") keeps them
+    return " ".join(kept or tokens)
+
+
+def _comparable(a: str, b: str) -> bool:
+    """Whether two normalized names may be spelling variants of each other.
+
+    Names with a different number of words ("Real Madrid B") or different short
+    words such as codes and ages ("LCK" / "LEC", "U21" / "U20") are never merged
+    by the fuzzy matcher.
+    """
+    a_tokens, b_tokens = a.split(), b.split()
+    return len(a_tokens) == len(b_tokens) and all(
+        x == y for x, y in zip(a_tokens, b_tokens) if min(len(x), len(y)) <= SHORT_TOKEN_LENGTH
+    )
+
+
+def canonical_id(key: str) -> str:
+    """Return the stable ID of a canonical name key."""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def key_columns(df: pd.DataFrame, columns: List[str], other: Optional[pd.DataFrame] = None) -> List[str]:
+    """Replace name columns by their canonical ID columns where the frame(s) have them.
+
+    An ID column is only used if it is complete in every frame, so data from
+    before the normalization keeps joining on the raw names.
+    """
+    frames = [df] if other is None else [df, other]
+
+    def has_ids(column: str) -> bool:
+        id_column = CANONICAL_COLUMNS.get(column)
+        return id_column is not None and all(
+            id_column in frame.columns and frame[id_column].notna().all() for frame in frames
+        )
+
+    return [CANONICAL_COLUMNS[column] if has_ids(column) else column for column in columns]
+
+
+class NameIndex:
+    """Persistent alias table with a fuzzy matcher for unseen names."""
+
+    def __init__(self, path: Optional[str] = None, cutoff: float = NAME_MATCH_CUTOFF):
+        self.path = path or os.path.join(DATA_PATH, ALIASES_FILE)
+        self.cutoff = cutoff
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.aliases: Dict[str, Dict[str, str]] = json.load(f)
+        except (OSError, ValueError):
+            self.aliases = {}
+        # Canonical names per kind and scope, for fuzzy matching
+        self._canonical: Dict[str, Dict[str, List[str]]] = {}
+        for kind, aliases in self.aliases.items():
+            for key in set(aliases.values()):
+                scope, _, name = key.rpartition("|")
+                self._canonical.setdefault(kind, {}).setdefault(scope, []).append(name)
+        self._dirty = False
+
+    def resolve(self, kind: str, scope: str, name: str) -> str:
+        """Return the canonical key ("scope|name") of a name, matching it once if new."""
+        normalized = normalize_name(name)
+        aliases = self.aliases.setdefault(kind, {})
+        key = f"{scope}|{normalized}"
+        if key in aliases:
+            return aliases[key]
+
+        candidates = self._canonical.setdefault(kind, {}).setdefault(scope, [])
+        comparable = [candidate for candidate in candidates if _comparable(normalized, candidate)]
+        matches = difflib.get_close_matches(normalized, comparable, n=1, cutoff=self.cutoff)
+        if matches:
+            canonical = f"{scope}|{matches[0]}"
+            logger.info(f"Name '{name}' matched to '{matches[0]}' ({kind}, {scope})")
+        else:
+            canonical = key
+            candidates.append(normalized)
+
+        aliases[key] = canonical
+        self._dirty = True
+        return canonical
+
+    def resolve_column(self, kind: str, scopes: pd.Series, names: pd.Series) -> pd.Series:
+        """Return the canonical ID of every (scope, name) pair, resolving each distinct pair once."""
+        pairs = pd.DataFrame({"scope": scopes.astype(str), "name": names.astype(str)})
+        codes, uniques = pd.factorize(pd.MultiIndex.from_frame(pairs))
+        ids = [canonical_id(self.resolve(kind, scope, name)) for scope, name in uniques]
+        return pd.Series(pd.Index(ids)[codes], index=names.index)
+
+    def save(self) -> None:
+        """Write the alias table atomically if it changed."""
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.aliases, f, indent=1, sort_keys=True, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def add_canonical_columns(df: pd.DataFrame, index: Optional[NameIndex] = None) -> pd.DataFrame:
+    """Return the frame with team_1_id, team_2_id and league_id columns added."""
+    index = index or NameIndex()
+    df = df.copy()
+    sports = df["sports"].astype(str)
+    df["team_1_id"] = index.resolve_column("teams", sports, df["team_1"])
+    df["team_2_id"] = index.resolve_column("teams", sports, df["team_2"])
+    df["league_id"] = index.resolve_column("leagues", sports + "/" + df["countries"].astype(str), df["leagues"])
+    index.save()
+    return df
@@ -0,0 +1,225 @@
+"""
+Asynchronous notification dispatcher with pluggable sinks.
+
+The scrape only puts notifications on a bounded queue and moves on: a background
+thread delivers them to every configured sink (desktop toast, HTTP webhook,
+JSON-lines file). Notifications arriving within NOTIFICATION_BATCH_SECONDS of each
+other are delivered as one digest, a full queue drops new notifications instead of
+blocking, and the delivery latency and failures of every sink are recorded.
+"""
+
+import json
+import os
+import platform
+import queue
+import threading
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.config.settings import (
+    DATA_PATH, NOTIFICATION_SINKS, NOTIFICATION_WEBHOOK_URL, NOTIFICATION_FILE,
+    NOTIFICATION_QUEUE_SIZE, NOTIFICATION_BATCH_SECONDS, NOTIFICATION_TIMEOUT,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+ICON_PATH = os.path.join(PROJECT_ROOT, "assets", "vbicon.ico")
+
+# Windows AppUserModelID of the toasts, for proper notification branding
+APP_ID = "ValueBetsScanner.Notification.1"
+
+# Maximum notifications merged into one digest
+MAX_BATCH_SIZE = 50
+
+
+def digest(notifications: List[dict]) -> Tuple[str, str]:
+    """Return the title and message of a batch: the notification itself, or a digest of all."""
+    if len(notifications) == 1:
+        return notifications[0]["title"], notifications[0]["message"]
+    title = f"{notifications[0]['title']} ({len(notifications)})"
+    return title, "\n\n".join(notification["message"] for notification in notifications)
+
+
+class DesktopSink:
+    """System toast through plyer."""
+
+    name = "desktop"
+
+    def __init__(self, icon_path: str = ICON_PATH):
+        from plyer import notification
+
+        self._notify = notification.notify
+        self.icon_path = icon_path if os.path.exists(icon_path) else None
+        # The AppID is a per-process setting, set once
+        if platform.system() == "Windows":
+            try:
+                import ctypes
+
+                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(APP_ID)
+            except Exception as e:
+                logger.error(f"Failed to set AppID: {e}")
+
+    def send(self, notifications: List[dict]) -> None:
+        title, message = digest(notifications)
+        self._notify(title=title, message=message, app_icon=self.icon_path, timeout=30)
+
+
+class WebhookSink:
+    """JSON POST of the batch to an HTTP endpoint."""
+
+    name = "webhook"
+
+    def __init__(self, url: str = NOTIFICATION_WEBHOOK_URL, timeout: float = NOTIFICATION_TIMEOUT):
+        if not url:
+            raise ValueError("NOTIFICATION_WEBHOOK_URL is not set")
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, notifications: List[dict]) -> None:
+        title, message = digest(notifications)
+        body = json.dumps({"title": title, "message": message, "notifications": notifications}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class FileSink:
+    """One JSON line per notification, appended to a file."""
+
+    name = "file"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(DATA_PATH, NOTIFICATION_FILE)
+
+    def send(self, notifications: List[dict]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(notification, ensure_ascii=False) + "\n" for notification in notifications)
+
+
+SINKS = {
+    "desktop": DesktopSink,
+    "webhook": WebhookSink,
+    "file": FileSink,
+}
+
+
+class NotificationDispatcher:
+    """Bounded queue of notifications delivered to the sinks by a background thread."""
+
+    def __init__(
+        self,
+        sinks: list,
+        queue_size: int = NOTIFICATION_QUEUE_SIZE,
+        batch_seconds: float = NOTIFICATION_BATCH_SECONDS,
+    ):
+        self.sinks = sinks
+        self.batch_seconds = batch_seconds
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self._metrics: Dict[str, Dict[str, float]] = {
+            sink.name: {"sent": 0, "failed": 0, "latency_total": 0.0, "latency_max": 0.0} for sink in sinks
+        }
+        self._thread = threading.Thread(target=self._run, name="notifications", daemon=True)
+        self._thread.start()
+
+    def notify(self, title: str, message: str, **extra) -> bool:
+        """Queue a notification without blocking; return False if the queue was full."""
+        notification = {"title": title, "message": message, "created_at": time.time(), **extra}
+        try:
+            self._queue.put_nowait(notification)
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning(f"Notification queue full, dropped: {title}")
+            return False
+
+    def flush(self, timeout: float = NOTIFICATION_TIMEOUT * 2) -> bool:
+        """Wait until every queued notification was delivered; return False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def metrics(self) -> Dict[str, dict]:
+        """Return the delivery count, failures and latency (seconds) of every sink."""
+        with self._lock:
+            result = {}
+            for name, values in self._metrics.items():
+                delivered = values["sent"]
+                result[name] = {
+                    "sent": int(delivered),
+                    "failed": int(values["failed"]),
+                    "mean_latency": values["latency_total"] / delivered if delivered else None,
+                    "max_latency": values["latency_max"],
+                }
+            result["dropped"] = self.dropped
+            return result
+
+    def _run(self) -> None:
+        """Deliver batches until the process exits."""
+        while True:
+            batch = [self._queue.get()]
+            # Gather the burst that follows into the same digest
+            deadline = time.monotonic() + self.batch_seconds
+            while len(batch) < MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._deliver(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver(self, batch: List[dict]) -> None:
+        """Send a batch to every sink, recording latency and failures per sink."""
+        for sink in self.sinks:
+            try:
+                sink.send(batch)
+            except Exception as e:
+                with self._lock:
+                    self._metrics[sink.name]["failed"] += len(batch)
+                logger.error(f"Failed to send {len(batch)} notifications to {sink.name}: {e}")
+                continue
+            now = time.time()
+            with self._lock:
+                metrics = self._metrics[sink.name]
+                for notification in batch:
+                    latency = now - notification["created_at"]
+                    metrics["sent"] += 1
+                    metrics["latency_total"] += latency
+                    metrics["latency_max"] = max(metrics["latency_max"], latency)
+        logger.info(f"{len(batch)} notifications dispatched to {len(self.sinks)} sinks")
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    """Return the process-wide dispatcher, created on first use with the configured sinks.
+
+    A sink that can't be created (missing dependency or setting) is skipped.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            sinks = []
+            for name in NOTIFICATION_SINKS:
+                try:
+                    sinks.append(SINKS[name]())
+                except Exception as e:
+                    logger.error(f"Notification sink '{name}' disabled: {e}")
+            _dispatcher = NotificationDispatcher(sinks)
+        return _dispatcher
@@ -0,0 +1,211 @@
+"""
+Compressed archive of the fetched value-bets pages.
+
+Every fetched page is kept so parser regressions can be debugged and the history
+re-extracted after a selector change. Consecutive pages are nearly identical, so:
+
+- pages are deduplicated on their SHA-256: a page already archived only adds an
+  index entry;
+- each page is compressed on its own with zlib and a preset dictionary built from
+  a reference page, which holds the markup shared by every page. A new dictionary
+  is built every ARCHIVE_DICTIONARY_PAGES pages to follow changes of the site;
+- pages are appended to one data file, and an index (fetch time, hash, offset,
+  length, dictionary) gives random access to any single page without
+  decompressing the others.
+
+Re-extract the archive in parallel with:
+    python -m src.scraper.page_archive reextract
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+from loguru import logger
+
+from src.config.log_setup import setup_logging
+from src.config.settings import DATA_PATH, PAGES_DIRECTORY, ARCHIVE_DICTIONARY_PAGES, ARCHIVE_COMPRESSION_LEVEL
+
+PAGES_DIR = os.path.join(DATA_PATH, PAGES_DIRECTORY)
+
+INDEX_COLUMNS = ["fetched_at", "sha256", "offset", "length", "dictionary"]
+
+# zlib only uses the last 32 KiB of a preset dictionary
+DICTIONARY_SIZE = 32 * 1024
+DICTIONARY_CHUNK = 256
+
+
+def build_dictionary(page: bytes, size: int = DICTIONARY_SIZE) -> bytes:
+    """Return a preset dictionary sampled evenly from a reference page.
+
+    A page larger than the dictionary is cut into chunks and every n-th chunk is
+    kept, so the markup of the whole page (not only its end) can be referenced.
+    """
+    if len(page) <= size:
+        return page
+    chunks = len(page) // DICTIONARY_CHUNK
+    step = chunks / (size // DICTIONARY_CHUNK)
+    return b"".join(
+        page[int(i * step) * DICTIONARY_CHUNK:(int(i * step) + 1) * DICTIONARY_CHUNK]
+        for i in range(size // DICTIONARY_CHUNK)
+    )
+
+
+class PageArchive:
+    """Append-only page store with a fetch-time and content-hash index."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or PAGES_DIR
+        self.data_path = os.path.join(self.directory, "pages.bin")
+        self.index_path = os.path.join(self.directory, "index.csv")
+        self.dictionary_dir = os.path.join(self.directory, "dictionaries")
+        try:
+            self.index = pd.read_csv(self.index_path)
+        except (OSError, ValueError):
+            self.index = pd.DataFrame(columns=INDEX_COLUMNS)
+        # Content hash -> first index entry storing it
+        self._stored = self.index.drop_duplicates("sha256").set_index("sha256")
+        self._dictionaries: Dict[int, bytes] = {}
+
+    def _dictionary(self, dictionary_id: int) -> bytes:
+        """Return a preset dictionary, read once."""
+        if dictionary_id not in self._dictionaries:
+            with open(os.path.join(self.dictionary_dir, f"{dictionary_id:06d}.zdict"), "rb") as f:
+                self._dictionaries[dictionary_id] = f.read()
+        return self._dictionaries[dictionary_id]
+
+    def _current_dictionary(self, page: bytes) -> int:
+        """Return the dictionary for a new page, starting a new one from it if due."""
+        stored = self._stored
+        if len(stored):
+            dictionary_id = int(stored["dictionary"].max())
+            if (stored["dictionary"] == dictionary_id).sum() < ARCHIVE_DICTIONARY_PAGES:
+                return dictionary_id
+            dictionary_id += 1
+        else:
+            dictionary_id = 1
+        os.makedirs(self.dictionary_dir, exist_ok=True)
+        dictionary = build_dictionary(page)
+        with open(os.path.join(self.dictionary_dir, f"{dictionary_id:06d}.zdict"), "wb") as f:
+            f.write(dictionary)
+        self._dictionaries[dictionary_id] = dictionary
+        return dictionary_id
+
+    def add(self, html: str, fetched_at: Optional[datetime] = None) -> dict:
+        """Archive a fetched page and return its index entry."""
+        page = html.encode("utf-8")
+        digest = hashlib.sha256(page).hexdigest()
+        fetched_at = (fetched_at or datetime.now()).astimezone().isoformat()
+
+        if digest in self._stored.index:
+            stored = self._stored.loc[digest]
+            entry = {"fetched_at": fetched_at, "sha256": digest, "offset": int(stored["offset"]),
+                     "length": int(stored["length"]), "dictionary": int(stored["dictionary"])}
+        else:
+            dictionary_id = self._current_dictionary(page)
+            compressor = zlib.compressobj(ARCHIVE_COMPRESSION_LEVEL, zdict=self._dictionary(dictionary_id))
+            compressed = compressor.compress(page) + compressor.flush()
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.data_path, "ab") as f:
+                offset = f.tell()
+                f.write(compressed)
+            entry = {"fetched_at": fetched_at, "sha256": digest, "offset": offset,
+                     "length": len(compressed), "dictionary": dictionary_id}
+            self._stored.loc[digest] = [entry[column] for column in self._stored.columns]
+
+        # The index line is written after the page, so it never points to missing bytes
+        row = pd.DataFrame([entry], columns=INDEX_COLUMNS)
+        row.to_csv(self.index_path, mode="a", header=not os.path.exists(self.index_path), index=False)
+        self.index = pd.concat([self.index, row], ignore_index=True) if len(self.index) else row
+        logger.info(f"Page archived ({len(page)} bytes -> {entry['length']} bytes, {digest[:12]})")
+        return entry
+
+    def read(self, entry) -> str:
+        """Return the HTML of one index entry (a row of self.index or a dict)."""
+        with open(self.data_path, "rb") as f:
+            f.seek(int(entry["offset"]))
+            compressed = f.read(int(entry["length"]))
+        decompressor = zlib.decompressobj(zdict=self._dictionary(int(entry["dictionary"])))
+        return (decompressor.decompress(compressed) + decompressor.flush()).decode("utf-8")
+
+    def find(self, fetched_at: datetime) -> Optional[pd.Series]:
+        """Return the index entry of the last page fetched at or before a time (naive is local)."""
+        times = pd.to_datetime(self.index["fetched_at"], utc=True)
+        position = times.searchsorted(pd.Timestamp(fetched_at.astimezone()).tz_convert("UTC"), side="right") - 1
+        return self.index.iloc[position] if position >= 0 else None
+
+
+def _reextract_chunk(args) -> List[pd.DataFrame]:
+    """Worker: extract the value bets of a chunk of distinct pages."""
+    from src.scraper.scraper import extract_data_from_html
+
+    directory, entries = args
+    archive = PageArchive(directory)
+    frames = []
+    for entry in entries:
+        try:
+            df = extract_data_from_html(archive.read(entry))
+        except Exception as e:
+            logger.error(f"Page {entry['sha256'][:12]} could not be extracted: {e}")
+            continue
+        frames.append(df.assign(sha256=entry["sha256"]))
+    return frames
+
+
+def reextract(directory: Optional[str] = None, workers: Optional[int] = None) -> pd.DataFrame:
+    """Replay extract_data_from_html over every archived page, in parallel.
+
+    Each distinct page is extracted once; the rows of a page are repeated for every
+    time it was fetched, with its fetched_at.
+    """
+    archive = PageArchive(directory)
+    if archive.index.empty:
+        return pd.DataFrame()
+    pages = archive.index.drop_duplicates("sha256").to_dict("records")
+    workers = workers or os.cpu_count() or 1
+    chunks = [(archive.directory, pages[i::workers]) for i in range(min(workers, len(pages)))]
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(len(chunks), mp_context=context) as executor:
+        frames = [frame for chunk in executor.map(_reextract_chunk, chunks) for frame in chunk]
+    if not frames:
+        return pd.DataFrame()
+
+    extracted = pd.concat(frames, ignore_index=True)
+    fetches = archive.index[["fetched_at", "sha256"]]
+    return fetches.merge(extracted, on="sha256").drop(columns="sha256")
+
+
+def main() -> int:
+    """Command line entry point."""
+    setup_logging()
+    parser = argparse.ArgumentParser(description="Archive of the fetched value-bets pages")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the archived fetches")
+    reextract_parser = commands.add_parser("reextract", help="Extract the value bets of every archived page")
+    reextract_parser.add_argument("--workers", type=int, default=None)
+    reextract_parser.add_argument("--output", default=os.path.join(DATA_PATH, "reextract.csv"))
+    args = parser.parse_args()
+
+    if args.command == "list":
+        index = PageArchive().index
+        print(index.to_string(index=False) if len(index) else "No archived pages.")
+        return 0
+
+    df = reextract(workers=args.workers)
+    if df.empty:
+        print("No archived pages could be extracted.")
+        return 1
+    df.to_csv(args.output, index=False)
+    print(f"{len(df)} rows from {df['fetched_at'].nunique()} fetches written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""
+Independent pricing of the scraped bets.
+
+The site's value and probability columns are taken as scraped; this module
+recomputes the implied probability of the odds and the expected value of every
+bet, flags rows whose scraped value disagrees with its own odds and probability,
+and applies an optional user-supplied probability model to the whole frame in
+one call.
+
+A probability model is a function taking the DataFrame and returning one
+probability (in %) per row, configured as "package.module:function" in
+PROBABILITY_MODEL.
+"""
+
+import importlib
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import PROBABILITY_MODEL, VALUE_TOLERANCE
+
+ProbabilityModel = Callable[[pd.DataFrame], Sequence[float]]
+
+PRICING_COLUMNS = ["implied_probability", "computed_value", "value_mismatch", "model_probability", "model_value"]
+
+
+def implied_probability(odds: np.ndarray) -> np.ndarray:
+    """Return the probability (%) implied by decimal odds, NaN for invalid odds."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(odds > 0, 100 / odds, np.nan)
+
+
+def expected_value(probability: np.ndarray, odds: np.ndarray) -> np.ndarray:
+    """Return the expected return per unit staked (probability in %), like the value column."""
+    return probability / 100 * odds
+
+
+def load_probability_model(path: Optional[str] = PROBABILITY_MODEL) -> Optional[ProbabilityModel]:
+    """Import the configured probability model, or return None if there is none."""
+    if not path:
+        return None
+    module_name, _, function_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def compute_pricing(
+    df: pd.DataFrame,
+    model: Optional[ProbabilityModel] = None,
+    tolerance: float = VALUE_TOLERANCE,
+) -> pd.DataFrame:
+    """Return the pricing columns of a value bets frame.
+
+    Columns:
+        implied_probability: probability (%) implied by the odds.
+        computed_value: probability x odds, from the scraped probability.
+        value_mismatch: the scraped value differs from computed_value by more than
+            tolerance, relative to computed_value (0.05 = 5%).
+        model_probability: probability (%) of the model, the scraped one without a model.
+        model_value: expected value of the bet with model_probability.
+    """
+    odds = pd.to_numeric(df["odds"], errors="coerce").to_numpy(dtype=float)
+    probability = pd.to_numeric(df["probability"], errors="coerce").to_numpy(dtype=float)
+    value = pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=float)
+
+    computed_value = expected_value(probability, odds)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value_gap = np.abs(value / computed_value - 1)
+
+    if model is not None:
+        model_probability = np.asarray(model(df), dtype=float)
+        if model_probability.shape != (len(df),):
+            raise ValueError(f"Probability model returned shape {model_probability.shape} for {len(df)} rows")
+    else:
+        model_probability = probability
+
+    return pd.DataFrame({
+        "implied_probability": implied_probability(odds),
+        "computed_value": computed_value,
+        "value_mismatch": value_gap > tolerance,
+        "model_probability": model_probability,
+        "model_value": expected_value(model_probability, odds),
+    }, index=df.index)
+
+
+def add_pricing_columns(df: pd.DataFrame, model: Optional[ProbabilityModel] = None, **kwargs) -> pd.DataFrame:
+    """Return the frame with the columns of compute_pricing added (or replaced)."""
+    pricing = compute_pricing(df, model, **kwargs)
+    mismatches = int(pricing["value_mismatch"].sum())
+    if mismatches:
+        logger.info(f"{mismatches} bets have a scraped value inconsistent with their odds and probability")
+    return df.drop(columns=pricing.columns, errors="ignore").join(pricing)
@@ -0,0 +1,145 @@
+"""
+Incrementally maintained rollups for the history dashboard.
+
+Every stored scrape appends one aggregate row per (day, sport, bookmaker, league)
+to a small CSV: counts, sums of odds, value and probability, and a value
+histogram. Trends over weeks are computed from these rows alone, never from the
+raw snapshots.
+
+A bet is counted once per day, at its first sighting that day: the keys of the
+bets already seen on the current day are kept next to the rollups, so scraping
+more often doesn't inflate the counts.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import DATA_PATH, ROLLUPS_FILE
+from src.scraper.delta import bet_keys
+
+GROUP_COLUMNS = ["sports", "bookmaker", "leagues"]
+
+# Value histogram bin edges; the last bin is open-ended
+VALUE_BIN_EDGES = [1.0, 1.25, 1.5, 1.75, 2.0, 2.5, 3.0]
+VALUE_BIN_COLUMNS = [f"value_bin_{i}" for i in range(len(VALUE_BIN_EDGES))]
+
+SUM_COLUMNS = ["count", "sum_odds", "sum_value", "sum_probability"] + VALUE_BIN_COLUMNS
+
+
+def rollups_path() -> str:
+    """Return the path of the rollups file."""
+    return os.path.join(DATA_PATH, ROLLUPS_FILE)
+
+
+def seen_path(path: Optional[str] = None) -> str:
+    """Return the path of the keys of the bets already counted on the last rollup day."""
+    return os.path.splitext(path or rollups_path())[0] + ".seen.json"
+
+
+def load_seen(day: str, path: Optional[str] = None) -> Set[str]:
+    """Return the keys of the bets already counted on a day (empty for a new day)."""
+    try:
+        with open(seen_path(path), encoding="utf-8") as f:
+            seen = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return set(seen["keys"]) if seen.get("day") == day else set()
+
+
+def save_seen(day: str, keys: Set[str], path: Optional[str] = None) -> None:
+    """Replace the keys counted on the current day."""
+    target = seen_path(path)
+    tmp_path = target + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"day": day, "keys": sorted(keys)}, f)
+    os.replace(tmp_path, target)
+
+
+def compute_run_rollup(df: pd.DataFrame, scraped_at: datetime, seen: Optional[Set[str]] = None) -> pd.DataFrame:
+    """Aggregate one scrape into rollup rows (one per sport, bookmaker and league).
+
+    Only bets whose key is not in ``seen`` (nor repeated within the scrape) are
+    counted; groups without a new bet keep a row with a zero count.
+    """
+    keys = bet_keys(df)
+    new = ~keys.duplicated(keep="first")
+    if seen:
+        new &= ~keys.isin(list(seen))
+
+    frame = df[GROUP_COLUMNS].fillna("Unknown").astype(str)
+    frame["new"] = new
+    frame["odds"] = pd.to_numeric(df["odds"], errors="coerce").where(new)
+    frame["value"] = pd.to_numeric(df["value"], errors="coerce").where(new)
+    frame["probability"] = pd.to_numeric(df["probability"], errors="coerce").where(new)
+
+    # Values below the first edge fall in the first bin
+    bins = np.clip(np.searchsorted(VALUE_BIN_EDGES, frame["value"].to_numpy(), side="right") - 1, 0, None)
+    for i, column in enumerate(VALUE_BIN_COLUMNS):
+        frame[column] = (bins == i) & frame["value"].notna().to_numpy()
+
+    rollup = frame.groupby(GROUP_COLUMNS, sort=False).agg(
+        count=("new", "sum"),
+        sum_odds=("odds", "sum"),
+        sum_value=("value", "sum"),
+        sum_probability=("probability", "sum"),
+        **{column: (column, "sum") for column in VALUE_BIN_COLUMNS},
+    ).reset_index()
+
+    rollup.insert(0, "day", scraped_at.strftime("%Y-%m-%d"))
+    rollup.insert(0, "run_id", scraped_at.strftime("%Y%m%d%H%M%S"))
+    return rollup
+
+
+def update_rollups(df: pd.DataFrame, scraped_at: Optional[datetime] = None, path: Optional[str] = None) -> pd.DataFrame:
+    """Append the rollup of a stored scrape to the rollups file and return it."""
+    path = path or rollups_path()
+    scraped_at = scraped_at or datetime.now()
+    day = scraped_at.strftime("%Y-%m-%d")
+    seen = load_seen(day, path)
+    rollup = compute_run_rollup(df, scraped_at, seen)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rollup.to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+    # Saved after the rows, so a failed append never hides bets from the next run
+    save_seen(day, seen | set(bet_keys(df)), path)
+    logger.info(f"Rollups updated with {len(rollup)} groups for run {rollup['run_id'].iloc[0]}")
+    return rollup
+
+
+def load_rollups(path: Optional[str] = None) -> pd.DataFrame:
+    """Load every stored rollup row (empty frame if no scrape was stored yet)."""
+    path = path or rollups_path()
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["run_id", "day"] + GROUP_COLUMNS + SUM_COLUMNS)
+    return pd.read_csv(path, dtype={"run_id": str})
+
+
+def history_summary(rollups: pd.DataFrame, top: int = 10) -> Dict[str, pd.Series]:
+    """Compute the dashboard series from rollup rows.
+
+    Returns:
+        Dict with ``bets_per_day`` (distinct bets seen per day), ``value_by_bookmaker``
+        (average value) and ``hit_rate_by_league`` (expected hit rate, i.e. the average
+        probability), the last two limited to the ``top`` most frequent entries.
+    """
+    if rollups.empty:
+        empty = pd.Series(dtype=float)
+        return {"bets_per_day": empty, "value_by_bookmaker": empty, "hit_rate_by_league": empty}
+
+    bets_per_day = rollups.groupby("day")["count"].sum().sort_index()
+    bets_per_day.index = pd.to_datetime(bets_per_day.index)
+
+    by_bookmaker = rollups.groupby("bookmaker")[["count", "sum_value"]].sum().nlargest(top, "count")
+    by_league = rollups.groupby("leagues")[["count", "sum_probability"]].sum().nlargest(top, "count")
+
+    return {
+        "bets_per_day": bets_per_day,
+        "value_by_bookmaker": (by_bookmaker["sum_value"] / by_bookmaker["count"]).sort_values(ascending=False),
+        "hit_rate_by_league": (by_league["sum_probability"] / by_league["count"]).sort_values(ascending=False),
+    }
@@ -6,25 +6,26 @@ import time
 from loguru import logger
 from typing import Tuple, Optional, Callable
 import os
-from plyer import notification
 import getpass
-import platform
-import ctypes
 import random
-
-
-def configure_logger() -> None:
-    """Set up logging configuration and ensure logs directory exists."""
-    logs_dir = os.path.join(os.path.dirname(__file__), "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    logger.add(
-        os.path.join(logs_dir, "scraper.log"),
-        rotation="1 MB",
-        level="DEBUG",
-        backtrace=True,
-        diagnose=True,
-    )
-    logger.info("Logger configured successfully")
+from urllib.parse import urljoin
+
+from src.config.settings import ARCHIVE_PAGES
+from src.config.log_setup import setup_logging, set_run, set_stage
+from src.scraper.rollups import update_rollups
+from src.scraper.logos import cache_logos
+from src.scraper.staking import add_stake_columns
+from src.scraper.pricing import add_pricing_columns, load_probability_model
+from src.scraper.snapshots import store_snapshot, run_id
+from src.scraper.movements import MovementTracker
+from src.scraper.grouping import add_group_columns
+from src.scraper.names import add_canonical_columns
+from src.scraper.arbitrage import find_arbitrages, export_arbitrages
+from src.scraper.kickoff import infer_dates, combine_kickoff, local_timezone
+from src.scraper.alerts import AlertEngine
+from src.scraper.notifications import get_dispatcher
+from src.scraper.export import export_snapshot
+from src.scraper.page_archive import PageArchive
 
 
 def setup_browser() -> Tuple[Playwright, Browser, Page]:
@@ -103,6 +104,7 @@ def extract_data_from_html(html: str) -> pd.DataFrame:
         "team_2": [],
         "outcome": [],
         "bookmaker": [],
+        "bookmaker_logo_url": [],
         "odds": [],
         "value": [],
         "probability": [],
@@ -155,12 +157,16 @@ def extract_bookmaker_data(valuebet, data):
     for bookmaker in bookmaker_info:
         img = bookmaker.find("img")
         data["bookmaker"].append(img["alt"] if img and "alt" in img.attrs else None)
+        # Lazy-loaded logos keep their URL in data-src, src only holds a placeholder
+        src = (img.get("data-src") or img.get("src")) if img else None
+        data["bookmaker_logo_url"].append(urljoin("https://www.oddsportal.com/", src) if src else None)
 
 
 def clean_and_process_data(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and process the extracted data."""
     logger.info("Cleaning and processing the extracted data")
-    today = datetime.now()
+    # "Today" is the site's today, in the timezone its times are shown in
+    today = datetime.now(local_timezone())
 
     df["probability"] = pd.to_numeric(
         df["probability"].str.replace("%", "", regex=False), errors="coerce"
@@ -175,12 +181,11 @@ def clean_and_process_data(df: pd.DataFrame) -> pd.DataFrame:
             }
         )
     )
-    df["date"] = pd.to_datetime(
-        df["date"] + f" {today.year}", format="%d %b %Y", errors="coerce"
-    )
+    df["date"] = infer_dates(df["date"], today)
     df["time"] = pd.to_datetime(
         df["time"], format="%H:%M", errors="coerce"
     ).dt.strftime("%H:%M")
+    df["kickoff"] = combine_kickoff(df["date"], df["time"])
     df[["value", "odds"]] = df[["value", "odds"]].apply(pd.to_numeric, errors="coerce")
     df.sort_values(
         by=["probability", "date", "time"], ascending=[False, True, True], inplace=True
@@ -190,47 +195,13 @@ def clean_and_process_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def export_data_to_csv(df: pd.DataFrame, file_name: str) -> None:
-    """Export the cleaned data to a CSV file."""
+def export_data_to_csv(df: pd.DataFrame, file_name: str, scraped_at: Optional[datetime] = None) -> None:
+    """Export the cleaned data to a CSV file, atomically and as a new generation."""
     logger.info("Exporting data to CSV")
-    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
-    os.makedirs(data_dir, exist_ok=True)
-    csv_path = os.path.join(data_dir, file_name)
-    df.to_csv(csv_path, index=False)
+    export_snapshot(df, file_name, scraped_at)
     logger.info(f"Data exported successfully.")
 
 
-def send_notification(high_probability_count: int) -> None:
-    """Send a system notification about value bets."""
-    try:
-        # Define the path to an icon file
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "vbicon.ico")
-        
-        # Ensure the icon directory exists
-        os.makedirs(os.path.dirname(icon_path), exist_ok=True)
-        
-        # On Windows, set the AppID for proper notification branding
-        if platform.system() == "Windows":
-            try:
-                app_id = "ValueBetsScanner.Notification.1"
-                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
-            except Exception as e:
-                logger.error(f"Failed to set AppID: {e}")
-        
-        # Display singular form if there's only one value bet
-        bet_message = "value bet found!" if high_probability_count == 1 else "value bets found!"
-        
-        notification.notify(
-            title="ValueBets Alert",
-            message=f"🔔 {high_probability_count} {bet_message}",
-            app_icon=icon_path if os.path.exists(icon_path) else None,
-            timeout=30
-        )
-        logger.info(f"Notification sent for {high_probability_count} high probability value bets")
-    except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
-
-
 def scrape_with_retries(max_attempts: int = 3, callback: Optional[Callable] = None) -> Optional[pd.DataFrame]:
     """Execute the scraping process with multiple retries."""
     for attempt in range(1, max_attempts + 1):
@@ -244,6 +215,7 @@ def scrape_with_retries(max_attempts: int = 3, callback: Optional[Callable] = No
             if callback:
                 callback(2, 5, "Initialisation du navigateur...")
             
+            set_stage("fetch")
             playwright, browser, page = setup_browser()
             
             if callback:
@@ -252,16 +224,28 @@ def scrape_with_retries(max_attempts: int = 3, callback: Optional[Callable] = No
             html = navigate_to_value_bets(page)
             
             if html:
+                if ARCHIVE_PAGES:
+                    try:
+                        PageArchive().add(html)
+                    except Exception as e:
+                        logger.error(f"Failed to archive the page: {e}")
+                
                 if callback:
                     callback(4, 5, "Extraction des données...")
                 
+                set_stage("extract")
                 df = extract_data_from_html(html)
                 
                 if not df.empty:
                     if callback:
                         callback(5, 5, "Traitement des données...")
                     
-                    return clean_and_process_data(df)
+                    set_stage("clean")
+                    df = clean_and_process_data(df)
+                    # Canonical team and league IDs, the keys of every later join
+                    df = add_canonical_columns(df)
+                    # Same bet at several bookmakers: best odds and spread per group
+                    return add_group_columns(df)
             
             logger.warning(f"Attempt {attempt} failed to retrieve valid data")
             
@@ -311,7 +295,9 @@ def main(callback: Optional[Callable] = None) -> Optional[pd.DataFrame]:
     if callback:
         callback(1, 5, "Configuration des journaux...")
     
-    configure_logger()
+    setup_logging()
+    set_run(run_id(datetime.now()))
+    set_stage("start")
     logger.info("Starting the value bets scraping process")
     
     if callback:
@@ -323,20 +309,72 @@ def main(callback: Optional[Callable] = None) -> Optional[pd.DataFrame]:
         if callback:
             callback(3, 5, "Données récupérées, analyse en cours...")
             
-        # Check for values > 50 in the 'probability' column
-        high_probability_count = (df["probability"] > 50).sum()
+        set_stage("enrich")
+        # Own edge estimate, from the configured probability model if any
+        try:
+            df = add_pricing_columns(df, load_probability_model())
+        except Exception as e:
+            logger.error(f"Probability model failed, using the scraped probabilities: {e}")
+            df = add_pricing_columns(df)
+        
+        # Stake sizing columns, exported with the data
+        df = add_stake_columns(df, probability_column="model_probability")
         
-        if high_probability_count > 0:
-            send_notification(high_probability_count)
+        # Odds movements since each bet was first seen, also used by alerts
+        try:
+            df = df.join(MovementTracker().update(df))
+        except Exception as e:
+            logger.error(f"Failed to track odds movements: {e}")
+        
+        # Logos are downloaded once per URL into the content-addressed cache
+        try:
+            logo_files = cache_logos(df["bookmaker_logo_url"].dropna().unique())
+            df["bookmaker_logo"] = df["bookmaker_logo_url"].map(logo_files)
+        except Exception as e:
+            logger.error(f"Failed to cache bookmaker logos: {e}")
+        
+        set_stage("alerts")
+        # Configured alert rules, each bet is notified once
+        try:
+            dispatcher = get_dispatcher()
+            for alert in AlertEngine().evaluate(df):
+                dispatcher.notify(alert["title"], alert["message"], rule=alert["rule"])
+        except Exception as e:
+            logger.error(f"Failed to evaluate alerts: {e}")
         
         if callback:
             callback(4, 5, "Sauvegarde des données...")
             
-        export_data_to_csv(df, "data.csv")
+        set_stage("export")
+        scraped_at = datetime.now()
+        export_data_to_csv(df, "data.csv", scraped_at)
+        
+        try:
+            export_arbitrages(find_arbitrages(df))
+        except Exception as e:
+            logger.error(f"Failed to detect surebets: {e}")
+        
+        set_stage("history")
+        # History is secondary, a rollup or snapshot failure must not fail the scrape
+        try:
+            update_rollups(df, scraped_at)
+        except Exception as e:
+            logger.error(f"Failed to update rollups: {e}")
+        try:
+            store_snapshot(df, scraped_at)
+        except Exception as e:
+            logger.error(f"Failed to store snapshot: {e}")
+        
+        # Alerts are delivered in the background, a scrape process must not exit before them
+        dispatcher = get_dispatcher()
+        if not dispatcher.flush():
+            logger.warning("Notifications still pending at the end of the scrape")
+        logger.info(f"Notification metrics: {dispatcher.metrics()}")
         
         if callback:
             callback(5, 5, f"Opération terminée avec succès! {len(df)} value bets trouvées.")
             
+        set_stage("done")
         logger.info("Scraping process completed successfully")
         return df
     else:
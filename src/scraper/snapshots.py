@@ -0,0 +1,55 @@
+"""
+Store of the raw snapshot of every scrape.
+
+data.csv only holds the latest scrape, so each stored scrape is also kept as a
+compressed CSV named after its run id. Past runs can then be replayed, e.g. by
+the backtesting engine.
+"""
+
+import os
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+
+from src.config.settings import DATA_PATH, HISTORY_DIRECTORY
+
+HISTORY_DIR = os.path.join(DATA_PATH, HISTORY_DIRECTORY)
+SNAPSHOT_SUFFIX = ".csv.gz"
+
+
+def run_id(scraped_at: datetime) -> str:
+    """Return the run id of a scrape (same format as the rollups)."""
+    return scraped_at.strftime("%Y%m%d%H%M%S")
+
+
+def store_snapshot(df: pd.DataFrame, scraped_at: Optional[datetime] = None, directory: Optional[str] = None) -> str:
+    """Store the snapshot of a scrape and return its path."""
+    directory = directory or HISTORY_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(directory, run_id(scraped_at or datetime.now()) + SNAPSHOT_SUFFIX)
+    tmp_path = path + ".tmp"
+    df.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, path)
+    logger.info(f"Snapshot of {len(df)} bets stored to {path}")
+    return path
+
+
+def list_snapshots(directory: Optional[str] = None) -> List[Tuple[str, str]]:
+    """Return the (run id, path) of every stored snapshot, oldest first."""
+    directory = directory or HISTORY_DIR
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        (name[:-len(SNAPSHOT_SUFFIX)], os.path.join(directory, name))
+        for name in os.listdir(directory)
+        if name.endswith(SNAPSHOT_SUFFIX)
+    )
+
+
+def load_snapshot(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load a stored snapshot, optionally only some of its columns."""
+    usecols = None if columns is None else lambda column: column in columns
+    return pd.read_csv(path, usecols=usecols)
@@ -0,0 +1,109 @@
+"""
+Vectorized stake sizing over a value bets frame.
+
+Full, fractional and capped Kelly, flat and edge-proportional stakes are computed
+for every row at once with NumPy, then scaled down so the total stake on one event
+or at one bookmaker never exceeds its exposure limit.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.scraper.names import key_columns
+
+from src.config.settings import (
+    BANKROLL,
+    KELLY_FRACTION,
+    MAX_STAKE_FRACTION,
+    FLAT_STAKE,
+    PROPORTIONAL_STAKE_FACTOR,
+    MAX_EVENT_EXPOSURE,
+    MAX_BOOKMAKER_EXPOSURE,
+)
+
+EVENT_COLUMNS = ["sports", "team_1", "team_2", "date", "time"]
+
+STAKE_COLUMNS = ["stake_full_kelly", "stake_kelly", "stake_flat", "stake_proportional"]
+
+
+def edges(odds: np.ndarray, probability: np.ndarray) -> np.ndarray:
+    """Return the expected return per unit staked (probability in %, NaN-safe)."""
+    return probability / 100 * odds - 1
+
+
+def kelly_fractions(odds: np.ndarray, probability: np.ndarray) -> np.ndarray:
+    """Return the full Kelly fraction of the bankroll for every bet (0 without an edge)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = edges(odds, probability) / (odds - 1)
+    return np.nan_to_num(np.clip(fractions, 0, 1), nan=0.0)
+
+
+def group_codes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Return an integer group id per row for the given key columns."""
+    return df.groupby([df[column].astype(str) for column in columns], sort=False).ngroup().to_numpy()
+
+
+def apply_exposure_limit(stakes: np.ndarray, codes: np.ndarray, limit: float) -> np.ndarray:
+    """Scale the stakes of every group whose total exceeds the limit down to it."""
+    totals = np.bincount(codes, weights=stakes)[codes]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(totals > limit, limit / totals, 1.0)
+    return stakes * scale
+
+
+def compute_stakes(
+    df: pd.DataFrame,
+    bankroll: float = BANKROLL,
+    kelly_fraction: float = KELLY_FRACTION,
+    max_stake_fraction: Optional[float] = MAX_STAKE_FRACTION,
+    max_event_exposure: Optional[float] = MAX_EVENT_EXPOSURE,
+    max_bookmaker_exposure: Optional[float] = MAX_BOOKMAKER_EXPOSURE,
+    probability_column: str = "probability",
+) -> pd.DataFrame:
+    """Return the stake columns of every strategy for a value bets frame.
+
+    Columns:
+        kelly_fraction: full Kelly fraction of the bankroll.
+        stake_full_kelly: full Kelly stake.
+        stake_kelly: fractional Kelly stake, capped at max_stake_fraction (the recommended stake).
+        stake_flat: flat stake on every bet with a positive edge.
+        stake_proportional: stake proportional to the edge, capped like stake_kelly.
+
+    Every stake column then respects the per-event and per-bookmaker exposure limits
+    (fractions of the bankroll, None to disable).
+    """
+    odds = pd.to_numeric(df["odds"], errors="coerce").to_numpy(dtype=float)
+    probability = pd.to_numeric(df[probability_column], errors="coerce").to_numpy(dtype=float)
+
+    fractions = kelly_fractions(odds, probability)
+    edge = np.nan_to_num(edges(odds, probability), nan=0.0)
+    cap = bankroll * max_stake_fraction if max_stake_fraction is not None else np.inf
+
+    stakes = pd.DataFrame(index=df.index)
+    stakes["kelly_fraction"] = fractions
+    stakes["stake_full_kelly"] = bankroll * fractions
+    stakes["stake_kelly"] = np.minimum(bankroll * kelly_fraction * fractions, cap)
+    stakes["stake_flat"] = np.where(edge > 0, FLAT_STAKE, 0.0)
+    stakes["stake_proportional"] = np.minimum(bankroll * PROPORTIONAL_STAKE_FACTOR * np.clip(edge, 0, None), cap)
+
+    limits = []
+    if max_event_exposure is not None and all(column in df.columns for column in EVENT_COLUMNS):
+        limits.append((group_codes(df, key_columns(df, EVENT_COLUMNS)), bankroll * max_event_exposure))
+    if max_bookmaker_exposure is not None and "bookmaker" in df.columns:
+        limits.append((group_codes(df, ["bookmaker"]), bankroll * max_bookmaker_exposure))
+
+    for column in STAKE_COLUMNS:
+        values = stakes[column].to_numpy()
+        for codes, limit in limits:
+            values = apply_exposure_limit(values, codes, limit)
+        stakes[column] = np.round(values, 2)
+
+    return stakes
+
+
+def add_stake_columns(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """Return the frame with the stake columns of compute_stakes added (or replaced)."""
+    stakes = compute_stakes(df, **kwargs)
+    return df.drop(columns=stakes.columns, errors="ignore").join(stakes)
@@ -0,0 +1,109 @@
+"""
+Run the scraper in a child process and stream its progress back over a pipe.
+
+Parsing and cleaning then no longer compete with the GUI for the GIL, and a hung
+browser can be stopped by terminating the child. The result frame is sent with
+pickle protocol 5 and out-of-band buffers, so its NumPy columns cross the pipe as
+raw bytes instead of being copied into one large pickle.
+"""
+
+import multiprocessing
+import pickle
+from typing import Any, List, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+
+# Message kinds sent by the child
+PROGRESS = "progress"
+RESULT = "result"
+ERROR = "error"
+
+Message = Tuple[Any, ...]
+
+
+def _send_frame(conn, df: Optional[pd.DataFrame]) -> None:
+    """Send a DataFrame as a pickle header followed by its out-of-band buffers."""
+    buffers: List[pickle.PickleBuffer] = []
+    header = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    conn.send((RESULT, len(buffers)))
+    conn.send_bytes(header)
+    for buffer in buffers:
+        conn.send_bytes(buffer.raw())
+
+
+def _receive_frame(conn, buffer_count: int) -> Optional[pd.DataFrame]:
+    """Rebuild a DataFrame sent by _send_frame."""
+    header = conn.recv_bytes()
+    buffers = [conn.recv_bytes() for _ in range(buffer_count)]
+    return pickle.loads(header, buffers=buffers)
+
+
+def _run_child(conn) -> None:
+    """Entry point of the child process."""
+    from src.scraper.scraper import main as run_scraper
+
+    def progress_callback(step, total_steps, message):
+        progress = step / total_steps if total_steps > 0 else 0
+        conn.send((PROGRESS, progress, message))
+
+    try:
+        _send_frame(conn, run_scraper(callback=progress_callback))
+    except Exception as e:
+        logger.exception(f"Scraper child process failed: {e}")
+        conn.send((ERROR, str(e)))
+    finally:
+        # Log sinks are asynchronous, write what is queued before the process exits
+        logger.complete()
+        conn.close()
+
+
+class ScraperProcess:
+    """Handle on a scraper running in a child process."""
+
+    def __init__(self):
+        # "spawn" avoids forking a process that holds Tk and browser state
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe(duplex=False)
+        self._process = context.Process(target=_run_child, args=(child_conn,), daemon=True)
+        self._child_conn = child_conn
+
+    def start(self) -> None:
+        """Start the child process."""
+        self._process.start()
+        # The child owns its end now; closing ours lets recv detect its exit
+        self._child_conn.close()
+        logger.info(f"Scraper child process started (pid={self._process.pid})")
+
+    def is_alive(self) -> bool:
+        """Return True while the child process is running."""
+        return self._process.is_alive()
+
+    def poll(self) -> List[Message]:
+        """Return every message available without blocking.
+
+        Messages are ``(PROGRESS, value, text)``, ``(RESULT, df_or_none)`` and
+        ``(ERROR, text)``.
+        """
+        messages: List[Message] = []
+        try:
+            while self._conn.poll():
+                message = self._conn.recv()
+                if message[0] == RESULT:
+                    message = (RESULT, _receive_frame(self._conn, message[1]))
+                messages.append(message)
+        except (EOFError, OSError):
+            # The child exited (or was terminated) and its end of the pipe is closed
+            pass
+        return messages
+
+    def cancel(self, timeout: float = 5.0) -> None:
+        """Terminate the child process, killing it if it doesn't stop in time."""
+        if self._process.is_alive():
+            logger.warning(f"Terminating scraper child process (pid={self._process.pid})")
+            self._process.terminate()
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+        self._conn.close()
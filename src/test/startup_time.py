@@ -0,0 +1,58 @@
+# Startup time benchmark for the GUI, based on python -X importtime
+#
+# Usage: python -m src.test.startup_time [module]
+# Exits with status 1 if the import exceeds STARTUP_IMPORT_BUDGET_MS or pulls in
+# a module that should only be loaded by the view or action that needs it.
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.config.settings import PROJECT_ROOT, STARTUP_IMPORT_BUDGET_MS
+
+# Modules the homepage doesn't need, they must not be imported at startup
+DEFERRED_MODULES = ["pandas", "numpy", "matplotlib", "playwright", "bs4", "plyer"]
+
+
+def measure_imports(module):
+    """Import a module in a fresh interpreter and return {module: cumulative import time in µs}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(result.returncode)
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+module = sys.argv[1] if len(sys.argv) > 1 else "src.gui.app"
+timings = measure_imports(module)
+total_ms = timings.get(module, 0) / 1000
+
+print(f"Import time of {module}: {total_ms:.0f} ms (budget {STARTUP_IMPORT_BUDGET_MS} ms)")
+for name, cumulative in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:10]:
+    print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+failures = []
+if total_ms > STARTUP_IMPORT_BUDGET_MS:
+    failures.append(f"import time {total_ms:.0f} ms exceeds the {STARTUP_IMPORT_BUDGET_MS} ms budget")
+loaded = [name for name in DEFERRED_MODULES if name in timings]
+if loaded:
+    failures.append(f"modules imported at startup: {', '.join(loaded)}")
+
+for failure in failures:
+    print(f"FAIL: {failure}")
+sys.exit(1 if failures else 0)
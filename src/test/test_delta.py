@@ -0,0 +1,55 @@
+# Regression tests of the snapshot merge used by the auto-refresh
+#
+# Usage: python -m pytest src/test/test_delta.py
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.scraper.delta import merge_snapshot
+
+
+def snapshot(rows):
+    """Build a snapshot frame from (team_1, bookmaker, odds, model_value) tuples"""
+    return pd.DataFrame([
+        {
+            "sports": "Football", "countries": "France", "leagues": "Ligue 1",
+            "team_1": team_1, "team_2": "Lyon", "pronos": "1X2", "outcome": "1", "bookmaker": bookmaker,
+            "date": "2026-10-20", "time": "20:00", "odds": odds, "value": 5.0, "probability": 50.0,
+            "model_value": model_value, "bookmaker_logo_url": f"https://logos/{bookmaker}.png",
+        }
+        for team_1, bookmaker, odds, model_value in rows
+    ])
+
+
+def test_merge_keeps_positions_and_appends_added():
+    old = snapshot([("Paris", "A", 2.0, 0.1), ("Lens", "A", 3.0, 0.2), ("Nice", "A", 4.0, 0.3)])
+    new = snapshot([("Nice", "A", 4.0, 0.3), ("Brest", "A", 5.0, 0.4), ("Paris", "A", 2.0, 0.1)])
+
+    merged, info = merge_snapshot(old, new)
+
+    assert merged["team_1"].tolist() == ["Paris", "Nice", "Brest"]
+    assert info["old_positions"].tolist() == [0, 2, -1]
+    assert list(info["delta"]["removed"]) == ["Football|France|Ligue 1|Lens|Lyon|1X2|1|A"]
+    assert not info["changed"].any()
+
+
+def test_changed_bet_takes_its_whole_new_row():
+    old = snapshot([("Paris", "A", 2.0, 0.1), ("Lens", "A", 3.0, 0.2)])
+    new = snapshot([("Lens", "A", 3.0, 0.2), ("Paris", "A", 2.5, 0.35)])
+    new.loc[1, "bookmaker_logo_url"] = "https://logos/A-new.png"
+
+    merged, info = merge_snapshot(old, new)
+
+    # Position of the old snapshot, every column of the new one
+    assert merged["team_1"].tolist() == ["Paris", "Lens"]
+    assert info["changed"].tolist() == [True, False]
+    changed = merged.iloc[0]
+    assert changed["odds"] == 2.5
+    assert changed["model_value"] == 0.35
+    assert changed["bookmaker_logo_url"] == "https://logos/A-new.png"
+    assert np.isclose(info["odds_change"][0], 0.5)
+    assert np.isnan(info["odds_change"][1])
@@ -0,0 +1,110 @@
+# Webhook delivery of the notification dispatcher, against a local stub server
+#
+# Usage: python -m pytest src/test/test_notifications.py
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.scraper.notifications import NotificationDispatcher, WebhookSink
+
+
+class StubWebhook:
+    """HTTP server on a free port recording the JSON body of every POST"""
+
+    def __init__(self):
+        self.bodies = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                stub.bodies.append((self.headers["Content-Type"], json.loads(self.rfile.read(length))))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/hook"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def unused_port():
+    """Return a local port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_webhook_posts_notification_json():
+    stub = StubWebhook()
+    try:
+        dispatcher = NotificationDispatcher([WebhookSink(stub.url)], batch_seconds=0.05)
+        assert dispatcher.notify("High value", "PSG - Lyon @ 2.10", rule="high_value")
+        assert dispatcher.flush(timeout=5)
+    finally:
+        stub.close()
+
+    assert len(stub.bodies) == 1
+    content_type, body = stub.bodies[0]
+    assert content_type == "application/json"
+    assert body["title"] == "High value"
+    assert body["message"] == "PSG - Lyon @ 2.10"
+    assert len(body["notifications"]) == 1
+    assert body["notifications"][0]["rule"] == "high_value"
+    assert dispatcher.metrics()["webhook"]["sent"] == 1
+
+
+def test_burst_is_batched_into_one_digest():
+    stub = StubWebhook()
+    try:
+        dispatcher = NotificationDispatcher([WebhookSink(stub.url)], batch_seconds=0.5)
+        for i in range(5):
+            dispatcher.notify("Value bet", f"Bet {i}")
+        assert dispatcher.flush(timeout=5)
+    finally:
+        stub.close()
+
+    assert len(stub.bodies) == 1
+    body = stub.bodies[0][1]
+    assert body["title"] == "Value bet (5)"
+    assert body["message"] == "\n\n".join(f"Bet {i}" for i in range(5))
+    assert [notification["message"] for notification in body["notifications"]] == [f"Bet {i}" for i in range(5)]
+
+
+def test_unreachable_endpoint_does_not_block():
+    sink = WebhookSink(f"http://127.0.0.1:{unused_port()}/hook", timeout=1)
+    dispatcher = NotificationDispatcher([sink], batch_seconds=0.05)
+
+    start = time.monotonic()
+    assert dispatcher.notify("Value bet", "Bet 1")
+    assert time.monotonic() - start < 0.5
+    assert dispatcher.flush(timeout=5)
+
+    metrics = dispatcher.metrics()["webhook"]
+    assert metrics["sent"] == 0
+    assert metrics["failed"] == 1
+
+
+def test_silent_endpoint_times_out():
+    # Accepts connections (backlog) but never answers
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        sink = WebhookSink(f"http://127.0.0.1:{server.getsockname()[1]}/hook", timeout=0.5)
+        dispatcher = NotificationDispatcher([sink], batch_seconds=0.05)
+        dispatcher.notify("Value bet", "Bet 1")
+        assert dispatcher.flush(timeout=5)
+
+    assert dispatcher.metrics()["webhook"]["failed"] == 1